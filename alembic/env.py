@@ -9,6 +9,10 @@ from alembic import context
 from app.models.base import Base
 import app.models.job
 import app.models.job_execution
+import app.models.workflow
+import app.models.dead_letter
+import app.models.job_change
+import app.models.execution_blob
 target_metadata = Base.metadata
 
 
@@ -16,6 +20,10 @@ target_metadata = Base.metadata
 # access to the values within the .ini file in use.
 config = context.config
 
+# Migrate the database the service is configured for; `alembic -x url=...` targets another one, e.g. a replica
+from app.config.settings import settings
+config.set_main_option("sqlalchemy.url", context.get_x_argument(as_dictionary=True).get("url", settings.database_url))
+
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
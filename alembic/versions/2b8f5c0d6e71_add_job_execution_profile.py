@@ -0,0 +1,25 @@
+"""Add job execution profile
+
+Revision ID: 2b8f5c0d6e71
+Revises: 7c2d9e4b1a35
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2b8f5c0d6e71'
+down_revision: Union[str, None] = '7c2d9e4b1a35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('job_executions', sa.Column('profile', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('job_executions', 'profile')
@@ -0,0 +1,75 @@
+"""Add workflow tables
+
+Revision ID: 480c6501ce89
+Revises: e6eb562c2d72
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '480c6501ce89'
+down_revision: Union[str, None] = 'e6eb562c2d72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('workflows',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('nodes', sa.JSON(), nullable=False),
+    sa.Column('schedule_type', sa.String(length=50), nullable=True),
+    sa.Column('schedule_config', sa.JSON(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_workflows_id'), 'workflows', ['id'], unique=False)
+    op.create_index(op.f('ix_workflows_name'), 'workflows', ['name'], unique=False)
+    op.create_table('workflow_runs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('workflow_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_workflow_runs_id'), 'workflow_runs', ['id'], unique=False)
+    op.create_index(op.f('ix_workflow_runs_workflow_id'), 'workflow_runs', ['workflow_id'], unique=False)
+    op.create_table('workflow_run_nodes',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('run_id', sa.Integer(), nullable=False),
+    sa.Column('node_key', sa.String(length=255), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('depends_on', sa.JSON(), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('execution_id', sa.Integer(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_workflow_run_nodes_id'), 'workflow_run_nodes', ['id'], unique=False)
+    op.create_index(op.f('ix_workflow_run_nodes_run_id'), 'workflow_run_nodes', ['run_id'], unique=False)
+    op.add_column('job_executions', sa.Column('workflow_run_id', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_job_executions_workflow_run_id'), 'job_executions', ['workflow_run_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_job_executions_workflow_run_id'), table_name='job_executions')
+    op.drop_column('job_executions', 'workflow_run_id')
+    op.drop_index(op.f('ix_workflow_run_nodes_run_id'), table_name='workflow_run_nodes')
+    op.drop_index(op.f('ix_workflow_run_nodes_id'), table_name='workflow_run_nodes')
+    op.drop_table('workflow_run_nodes')
+    op.drop_index(op.f('ix_workflow_runs_workflow_id'), table_name='workflow_runs')
+    op.drop_index(op.f('ix_workflow_runs_id'), table_name='workflow_runs')
+    op.drop_table('workflow_runs')
+    op.drop_index(op.f('ix_workflows_name'), table_name='workflows')
+    op.drop_index(op.f('ix_workflows_id'), table_name='workflows')
+    op.drop_table('workflows')
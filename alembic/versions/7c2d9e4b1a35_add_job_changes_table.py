@@ -0,0 +1,40 @@
+"""Add job changes table
+
+Revision ID: 7c2d9e4b1a35
+Revises: fb5f6fa36188
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2d9e4b1a35'
+down_revision: Union[str, None] = 'fb5f6fa36188'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('job_changes',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('change_type', sa.String(length=20), nullable=False),
+    sa.Column('changed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_job_changes_id'), 'job_changes', ['id'], unique=False)
+    op.create_index(op.f('ix_job_changes_job_id'), 'job_changes', ['job_id'], unique=False)
+    # Seed the feed so a sync from the beginning sees every existing job
+    op.execute(
+        "INSERT INTO job_changes (job_id, change_type, changed_at) "
+        "SELECT id, 'created', COALESCE(updated_at, created_at) FROM jobs ORDER BY id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_job_changes_job_id'), table_name='job_changes')
+    op.drop_index(op.f('ix_job_changes_id'), table_name='job_changes')
+    op.drop_table('job_changes')
@@ -0,0 +1,35 @@
+"""Add execution blobs table
+
+Revision ID: 9d4e7a1c3f20
+Revises: 2b8f5c0d6e71
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4e7a1c3f20'
+down_revision: Union[str, None] = '2b8f5c0d6e71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('execution_blobs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('execution_id', sa.Integer(), nullable=False),
+    sa.Column('field', sa.String(length=20), nullable=False),
+    sa.Column('chunk_index', sa.Integer(), nullable=False),
+    sa.Column('data', sa.LargeBinary().with_variant(mysql.LONGBLOB(), 'mysql'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_execution_blobs_execution_field_chunk', 'execution_blobs', ['execution_id', 'field', 'chunk_index'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_execution_blobs_execution_field_chunk', table_name='execution_blobs')
+    op.drop_table('execution_blobs')
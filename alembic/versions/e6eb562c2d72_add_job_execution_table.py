@@ -27,7 +27,7 @@ def upgrade() -> None:
     sa.Column('completed_at', sa.DateTime(), nullable=True),
     sa.Column('status', sa.String(length=50), nullable=False),
     sa.Column('result', sa.JSON(), nullable=True),
-    sa.Column('error_message', mysql.LONGTEXT(), nullable=True),
+    sa.Column('error_message', sa.Text().with_variant(mysql.LONGTEXT(), 'mysql'), nullable=True),
     sa.Column('execution_time_ms', sa.Integer(), nullable=True),
     sa.PrimaryKeyConstraint('id')
     )
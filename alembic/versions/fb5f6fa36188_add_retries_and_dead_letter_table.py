@@ -0,0 +1,48 @@
+"""Add retries and dead letter table
+
+Revision ID: fb5f6fa36188
+Revises: 480c6501ce89
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision: str = 'fb5f6fa36188'
+down_revision: Union[str, None] = '480c6501ce89'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('job_executions', sa.Column('attempt', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('job_executions', sa.Column('parent_execution_id', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_job_executions_parent_execution_id'), 'job_executions', ['parent_execution_id'], unique=False)
+    op.create_table('dead_letter_jobs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('execution_id', sa.Integer(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('error_message', sa.Text().with_variant(mysql.LONGTEXT(), 'mysql'), nullable=True),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('replayed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_dead_letter_jobs_id'), 'dead_letter_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_dead_letter_jobs_job_id'), 'dead_letter_jobs', ['job_id'], unique=False)
+    op.create_index(op.f('ix_dead_letter_jobs_status'), 'dead_letter_jobs', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_dead_letter_jobs_status'), table_name='dead_letter_jobs')
+    op.drop_index(op.f('ix_dead_letter_jobs_job_id'), table_name='dead_letter_jobs')
+    op.drop_index(op.f('ix_dead_letter_jobs_id'), table_name='dead_letter_jobs')
+    op.drop_table('dead_letter_jobs')
+    op.drop_index(op.f('ix_job_executions_parent_execution_id'), table_name='job_executions')
+    op.drop_column('job_executions', 'parent_execution_id')
+    op.drop_column('job_executions', 'attempt')
@@ -0,0 +1,18 @@
+import math
+from fastapi import HTTPException
+from app.services.load_monitor import LoadMonitor
+from app.config.settings import settings
+
+def require_capacity():
+    """Dependency rejecting writes while the service is overloaded or the database is down"""
+    state = LoadMonitor.state()
+    if state["admission_level"] == "ok":
+        return
+    
+    retry_after = str(math.ceil(max(settings.health_cache_seconds, 1)))
+    status_code = 503 if state["admission_level"] == "unavailable" else 429
+    raise HTTPException(
+        status_code=status_code,
+        detail=f"Service {state['admission_level']}: {', '.join(state['admission_reasons'])}",
+        headers={"Retry-After": retry_after}
+    )
@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.database.connection import get_db, get_read_db
+from app.api.admission import require_capacity
+from app.services.dead_letter_service import DeadLetterService
+from app.services.scheduler_service import SchedulerService
+from app.schemas.job_schemas import (
+    DeadLetterResponse, DeadLetterReplayRequest, DeadLetterReplayResponse
+)
+
+router = APIRouter(prefix="/dead-letters", tags=["dead-letters"])
+
+def get_dead_letter_service(db: Session = Depends(get_db)) -> DeadLetterService:
+    """Dependency to get dead letter service"""
+    scheduler_service = SchedulerService()
+    return DeadLetterService(db, scheduler_service)
+
+def get_read_dead_letter_service(db: Session = Depends(get_read_db)) -> DeadLetterService:
+    """Dependency to get dead letter service for read-only endpoints, served from a replica"""
+    return DeadLetterService(db, SchedulerService())
+
+# GET dead letters
+@router.get("/", response_model=List[DeadLetterResponse])
+async def list_dead_letters(
+    skip: int = Query(0, ge=0, description="Number of entries to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of entries to return"),
+    job_id: Optional[int] = Query(None, description="Filter by job ID"),
+    status: Optional[str] = Query(None, description="Filter by status (pending, replayed)"),
+    dead_letter_service: DeadLetterService = Depends(get_read_dead_letter_service)
+):
+    """List dead-lettered job failures"""
+    entries, _ = dead_letter_service.get_dead_letters(
+        skip=skip,
+        limit=limit,
+        job_id=job_id,
+        status=status
+    )
+    return entries
+
+# POST bulk replay
+@router.post("/replay", response_model=DeadLetterReplayResponse, dependencies=[Depends(require_capacity)])
+async def replay_dead_letters(
+    replay_request: DeadLetterReplayRequest,
+    dead_letter_service: DeadLetterService = Depends(get_dead_letter_service)
+):
+    """Replay pending dead letter entries, selected by ids and/or job, or all of them"""
+    try:
+        replayed = dead_letter_service.replay(
+            ids=replay_request.ids,
+            job_id=replay_request.job_id
+        )
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return DeadLetterReplayResponse(replayed=replayed)
@@ -0,0 +1,73 @@
+from fastapi import APIRouter, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from typing import Optional
+import asyncio
+import orjson
+from app.services.event_broadcaster import EventBroadcaster
+from app.config.settings import settings
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+# SSE stream of execution events
+@router.get("/executions")
+async def stream_execution_events(
+    request: Request,
+    job_id: Optional[int] = Query(None, description="Only events of this job"),
+    job_type: Optional[str] = Query(None, description="Only events of this job type")
+):
+    """Stream execution started/completed/failed events as Server-Sent Events"""
+    subscription = EventBroadcaster.subscribe(job_id=job_id, job_type=job_type)
+    
+    async def stream():
+        try:
+            while not await request.is_disconnected():
+                event = await subscription.get(settings.event_keepalive_seconds)
+                dropped = subscription.take_dropped()
+                if dropped:
+                    yield f"event: overflow\ndata: {orjson.dumps({'dropped': dropped}).decode()}\n\n"
+                if event is None:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: {event['event']}\ndata: {orjson.dumps(event).decode()}\n\n"
+        finally:
+            EventBroadcaster.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# WebSocket stream of execution events
+@router.websocket("/executions/ws")
+async def execution_events_socket(
+    websocket: WebSocket,
+    job_id: Optional[int] = None,
+    job_type: Optional[str] = None
+):
+    """Stream execution events as JSON messages over a WebSocket"""
+    await websocket.accept()
+    subscription = EventBroadcaster.subscribe(job_id=job_id, job_type=job_type)
+    # Watch for the client closing so idle sockets are released without waiting for a send
+    closed = asyncio.ensure_future(_wait_for_disconnect(websocket))
+    try:
+        while True:
+            next_event = asyncio.ensure_future(subscription.get(settings.event_keepalive_seconds))
+            await asyncio.wait({next_event, closed}, return_when=asyncio.FIRST_COMPLETED)
+            if closed.done():
+                next_event.cancel()
+                break
+            
+            dropped = subscription.take_dropped()
+            if dropped:
+                await websocket.send_text(orjson.dumps({"event": "overflow", "dropped": dropped}).decode())
+            await websocket.send_text(orjson.dumps(next_event.result() or {"event": "keepalive"}).decode())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        closed.cancel()
+        EventBroadcaster.unsubscribe(subscription)
+
+async def _wait_for_disconnect(websocket: WebSocket):
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
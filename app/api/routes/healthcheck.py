@@ -1,27 +1,46 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.database.connection import get_db
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from app.services.job_handler import JobHandlerFactory
+from app.services.load_monitor import LoadMonitor
+from app.services.scheduler_service import SchedulerService
+from app.config.settings import settings
 from datetime import datetime, timezone
 
 router = APIRouter(prefix="/health", tags=["health"])
 
 # basic health check endpoint
 @router.get("/")
-async def health_check(db: Session = Depends(get_db)):
+def health_check():
     """Health check endpoint"""
-    try:
-        # Test database connection
-        db.execute("SELECT 1")
-        
-        return {
-            "status": "healthy",
-            "timestamp": datetime.now(timezone.utc),
-            "database": "connected"
-        }
-    except Exception as e:
-        return {
-            "status": "unhealthy",
-            "timestamp": datetime.now(timezone.utc),
-            "database": "disconnected",
-            "error": str(e)
-        }
+    state = LoadMonitor.state()
+    response = {
+        "status": "healthy" if state["level"] == "ok" else "unhealthy",
+        "timestamp": datetime.now(timezone.utc),
+        "database": state["database"],
+        "load": state,
+        "handlers": JobHandlerFactory.health()
+    }
+    if state["database_error"]:
+        response["error"] = state["database_error"]
+    return response
+
+# liveness probe
+@router.get("/live")
+def liveness():
+    """Whether the process should be restarted; never touches the database"""
+    running = settings.service_role == "api" or SchedulerService().scheduler.running
+    return JSONResponse(
+        status_code=200 if running else 503,
+        content={"status": "alive" if running else "scheduler stopped"}
+    )
+
+# readiness probe
+@router.get("/ready")
+def readiness():
+    """Whether the instance should receive traffic, from cached load measurements"""
+    state = LoadMonitor.state()
+    return JSONResponse(
+        status_code=200 if state["level"] == "ok" else 503,
+        content=jsonable_encoder({"status": "ready" if state["level"] == "ok" else "not ready", **state})
+    )
@@ -1,11 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Header, Response
+from fastapi.responses import ORJSONResponse, PlainTextResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.database.connection import get_db
+import hashlib
+from app.database.connection import get_db, get_read_db
+from app.api.admission import require_capacity
 from app.services.job_service import JobService
+from app.services.result_store import ResultStore
 from app.services.scheduler_service import SchedulerService
 from app.schemas.job_schemas import (
-    JobCreate, JobUpdate, JobResponse, JobListResponse
+    JobCreate, JobUpdate, JobResponse, JobListResponse, JobExecutionResponse, JobChangeFeedResponse,
+    ExecutionProfileResponse
 )
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
@@ -15,8 +20,24 @@ def get_job_service(db: Session = Depends(get_db)) -> JobService:
     scheduler_service = SchedulerService()
     return JobService(db, scheduler_service)
 
+def get_read_job_service(db: Session = Depends(get_read_db)) -> JobService:
+    """Dependency to get job service for read-only endpoints, served from a replica"""
+    return JobService(db, SchedulerService())
+
+def make_etag(*parts) -> str:
+    """Strong ETag from the values that identify a representation"""
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:20]}"'
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Whether an If-None-Match header already names this ETag"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
 # POST jobs
-@router.post("/", response_model=JobResponse, status_code=201)
+@router.post("/", response_model=JobResponse, status_code=201, dependencies=[Depends(require_capacity)])
 async def create_job(
     job_data: JobCreate,
     job_service: JobService = Depends(get_job_service)
@@ -35,39 +56,77 @@ async def list_jobs(
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     job_type: Optional[str] = Query(None, description="Filter by job type"),
     search: Optional[str] = Query(None, description="Search in job name and description"),
-    job_service: JobService = Depends(get_job_service)
+    fields: Optional[str] = Query(None, description="Comma separated fields to return, e.g. id,name,next_run"),
+    if_none_match: Optional[str] = Header(None),
+    job_service: JobService = Depends(get_read_job_service)
 ):
     """List all jobs with filtering and pagination"""
-    jobs, total = job_service.get_jobs(
-        skip=skip,
-        limit=limit,
-        is_active=is_active,
-        job_type=job_type,
-        search=search
+    # Revalidation costs one aggregate query instead of reading and encoding the page
+    etag = make_etag(
+        job_service.get_list_version(is_active=is_active, job_type=job_type, search=search),
+        skip, limit, is_active, job_type, search, fields
     )
+    if etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers={"ETag": etag})
     
-    return JobListResponse(
-        jobs=jobs,
-        total=total,
-        page=skip // limit + 1,
-        per_page=limit,
-        has_next=skip + limit < total
-    )
+    try:
+        jobs, total = job_service.get_job_rows(
+            skip=skip,
+            limit=limit,
+            is_active=is_active,
+            job_type=job_type,
+            search=search,
+            fields=[field.strip() for field in fields.split(",") if field.strip()] if fields else None
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # Rows are encoded straight to JSON bytes; response_model only documents the full shape
+    return ORJSONResponse({
+        "jobs": jobs,
+        "total": total,
+        "page": skip // limit + 1,
+        "per_page": limit,
+        "has_next": skip + limit < total
+    }, headers={"ETag": etag})
+
+# GET job change feed
+@router.get("/changes", response_model=JobChangeFeedResponse)
+async def list_job_changes(
+    since: Optional[str] = Query(None, description="next_token from the previous call; omit for a full sync"),
+    limit: int = Query(500, ge=1, le=1000, description="Maximum number of changes to read"),
+    job_service: JobService = Depends(get_job_service)
+):
+    """Jobs created, updated or deleted since the given token"""
+    # Read from the primary: the safety window can't account for replication lag,
+    # so a token handed out by a lagging replica could skip changes it hasn't received
+    try:
+        since_id = int(since) if since else 0
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid since token")
+    return job_service.get_changes(since=since_id, limit=limit)
 
 # GET job by ID
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job(
+    response: Response,
     job_id: int = Path(..., description="Job ID"),
-    job_service: JobService = Depends(get_job_service)
+    if_none_match: Optional[str] = Header(None),
+    job_service: JobService = Depends(get_read_job_service)
 ):
     """Get job details by ID"""
     job = job_service.get_job_by_id(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
+    
+    etag = make_etag(job.id, job_service.get_job_version(job_id), job.updated_at, job.total_runs)
+    if etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return job
 
 # PUT update job
-@router.put("/{job_id}", response_model=JobResponse)
+@router.put("/{job_id}", response_model=JobResponse, dependencies=[Depends(require_capacity)])
 async def update_job(
     job_id: int = Path(..., description="Job ID"),
     job_data: JobUpdate = ...,
@@ -88,3 +147,64 @@ async def delete_job(
     """Delete a job"""
     if not job_service.delete_job(job_id):
         raise HTTPException(status_code=404, detail="Job not found")
+
+# GET execution profile
+@router.get("/{job_id}/executions/{execution_id}/profile", response_model=ExecutionProfileResponse)
+async def get_execution_profile(
+    job_id: int = Path(..., description="Job ID"),
+    execution_id: int = Path(..., description="Execution ID"),
+    job_service: JobService = Depends(get_read_job_service)
+):
+    """Get the phase timings and profiler summary of a profiled execution"""
+    profile = job_service.get_execution_profile(job_id, execution_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="No profile recorded for this execution")
+    return profile
+
+# GET execution result
+@router.get("/{job_id}/executions/{execution_id}/result")
+async def get_execution_result(
+    job_id: int = Path(..., description="Job ID"),
+    execution_id: int = Path(..., description="Execution ID"),
+    job_service: JobService = Depends(get_read_job_service)
+):
+    """Get the full result of an execution; large results are streamed from blob storage"""
+    output = job_service.get_execution_output(job_id, execution_id, "result")
+    if not output:
+        raise HTTPException(status_code=404, detail="No result recorded for this execution")
+    value, spilled = output
+    if spilled:
+        return StreamingResponse(ResultStore.stream(execution_id, "result"), media_type="application/json")
+    return ORJSONResponse(value)
+
+# GET execution error message
+@router.get("/{job_id}/executions/{execution_id}/error", response_class=PlainTextResponse)
+async def get_execution_error(
+    job_id: int = Path(..., description="Job ID"),
+    execution_id: int = Path(..., description="Execution ID"),
+    job_service: JobService = Depends(get_read_job_service)
+):
+    """Get the full error message of a failed execution; long messages are streamed from blob storage"""
+    output = job_service.get_execution_output(job_id, execution_id, "error_message")
+    if not output:
+        raise HTTPException(status_code=404, detail="No error recorded for this execution")
+    value, spilled = output
+    if spilled:
+        return StreamingResponse(ResultStore.stream(execution_id, "error_message"), media_type="text/plain; charset=utf-8")
+    return PlainTextResponse(value)
+
+# POST cancel a running execution
+@router.post("/{job_id}/executions/{execution_id}/cancel", response_model=JobExecutionResponse, status_code=202)
+async def cancel_execution(
+    job_id: int = Path(..., description="Job ID"),
+    execution_id: int = Path(..., description="Execution ID"),
+    job_service: JobService = Depends(get_job_service)
+):
+    """Request cancellation of a running execution"""
+    try:
+        execution = job_service.cancel_execution(job_id, execution_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if not execution:
+        raise HTTPException(status_code=404, detail="Execution not found")
+    return execution
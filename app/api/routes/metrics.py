@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.services.metrics import Metrics
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+# Prometheus scrape endpoint
+@router.get("/", response_class=PlainTextResponse)
+async def metrics():
+    """Expose in-process metrics in Prometheus text format"""
+    return Metrics.render_prometheus()
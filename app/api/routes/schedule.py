@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session
+from app.database.connection import get_read_db
+from app.services.forecast_service import ForecastService, parse_duration
+
+router = APIRouter(prefix="/schedule", tags=["schedule"])
+
+# GET capacity forecast
+@router.get("/forecast")
+def forecast(
+    window: str = Query("24h", description="Forecast horizon, e.g. 1h, 24h, 7d"),
+    bucket: str = Query("1m", description="Histogram bucket width, e.g. 1m, 15m, 1h"),
+    db: Session = Depends(get_read_db)
+):
+    """Upcoming fires per job type and estimated concurrent worker demand"""
+    try:
+        result = ForecastService(db).forecast(parse_duration(window), parse_duration(bucket))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ORJSONResponse(result)
@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+from app.services.scheduler_service import SchedulerService
+
+router = APIRouter(prefix="/scheduler", tags=["scheduler"])
+
+# GET executor state
+@router.get("/executor")
+async def executor_status():
+    """Current worker pool size, backlog and recent autoscaling decisions"""
+    return SchedulerService().executor_stats()
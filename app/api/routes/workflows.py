@@ -0,0 +1,102 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from sqlalchemy.orm import Session
+from typing import List
+from app.database.connection import get_db, get_read_db
+from app.api.admission import require_capacity
+from app.services.workflow_service import WorkflowService
+from app.services.scheduler_service import SchedulerService
+from app.schemas.workflow_schemas import (
+    WorkflowCreate, WorkflowResponse, WorkflowRunResponse
+)
+
+router = APIRouter(prefix="/workflows", tags=["workflows"])
+
+def get_workflow_service(db: Session = Depends(get_db)) -> WorkflowService:
+    """Dependency to get workflow service"""
+    scheduler_service = SchedulerService()
+    return WorkflowService(db, scheduler_service)
+
+def get_read_workflow_service(db: Session = Depends(get_read_db)) -> WorkflowService:
+    """Dependency to get workflow service for read-only endpoints, served from a replica"""
+    return WorkflowService(db, SchedulerService())
+
+# POST workflows
+@router.post("/", response_model=WorkflowResponse, status_code=201, dependencies=[Depends(require_capacity)])
+async def create_workflow(
+    workflow_data: WorkflowCreate,
+    workflow_service: WorkflowService = Depends(get_workflow_service)
+):
+    """Create a new workflow"""
+    try:
+        return workflow_service.create_workflow(workflow_data)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+# GET workflows
+@router.get("/", response_model=List[WorkflowResponse])
+async def list_workflows(
+    skip: int = Query(0, ge=0, description="Number of workflows to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of workflows to return"),
+    workflow_service: WorkflowService = Depends(get_read_workflow_service)
+):
+    """List workflows with pagination"""
+    workflows, _ = workflow_service.get_workflows(skip=skip, limit=limit)
+    return workflows
+
+# GET workflow by ID
+@router.get("/{workflow_id}", response_model=WorkflowResponse)
+async def get_workflow(
+    workflow_id: int = Path(..., description="Workflow ID"),
+    workflow_service: WorkflowService = Depends(get_read_workflow_service)
+):
+    """Get workflow details by ID"""
+    workflow = workflow_service.get_workflow_by_id(workflow_id)
+    if not workflow:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+    return workflow
+
+# DELETE workflow
+@router.delete("/{workflow_id}", status_code=204)
+async def delete_workflow(
+    workflow_id: int = Path(..., description="Workflow ID"),
+    workflow_service: WorkflowService = Depends(get_workflow_service)
+):
+    """Delete a workflow"""
+    if not workflow_service.delete_workflow(workflow_id):
+        raise HTTPException(status_code=404, detail="Workflow not found")
+
+# POST trigger a workflow run
+@router.post("/{workflow_id}/runs", response_model=WorkflowRunResponse, status_code=202, dependencies=[Depends(require_capacity)])
+async def trigger_workflow_run(
+    workflow_id: int = Path(..., description="Workflow ID"),
+    workflow_service: WorkflowService = Depends(get_workflow_service)
+):
+    """Start a new run of the workflow"""
+    run = workflow_service.trigger_run(workflow_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+    return run
+
+# GET workflow runs
+@router.get("/{workflow_id}/runs", response_model=List[WorkflowRunResponse])
+async def list_workflow_runs(
+    workflow_id: int = Path(..., description="Workflow ID"),
+    skip: int = Query(0, ge=0, description="Number of runs to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of runs to return"),
+    workflow_service: WorkflowService = Depends(get_read_workflow_service)
+):
+    """List recent runs of a workflow"""
+    return workflow_service.get_runs(workflow_id, skip=skip, limit=limit)
+
+# GET workflow run by ID
+@router.get("/{workflow_id}/runs/{run_id}", response_model=WorkflowRunResponse)
+async def get_workflow_run(
+    workflow_id: int = Path(..., description="Workflow ID"),
+    run_id: int = Path(..., description="Run ID"),
+    workflow_service: WorkflowService = Depends(get_read_workflow_service)
+):
+    """Get a workflow run with per-node status"""
+    run = workflow_service.get_run(workflow_id, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Workflow run not found")
+    return run
@@ -1,20 +1,38 @@
+import itertools
+import math
+import time
+from fastapi import Request, Response
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
 from app.config.settings import settings
 
-# Create MySQL engine
-engine = create_engine(
-    settings.database_url,
-    pool_size=10,
-    max_overflow=20,
-    pool_recycle=3600,
-    pool_pre_ping=True,
-    echo=False 
-)
+def _create_engine(url: str):
+    return create_engine(
+        url,
+        pool_size=10,
+        max_overflow=20,
+        pool_recycle=3600,
+        pool_pre_ping=True,
+        echo=False 
+    )
+
+# Create MySQL engine; every write goes to the primary
+engine = _create_engine(settings.database_url)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Replicas serve read-only endpoints, picked round robin
+replica_engines = [_create_engine(url) for url in settings.database_replica_urls]
+_replica_sessions = [sessionmaker(autocommit=False, autoflush=False, bind=replica) for replica in replica_engines]
+_next_replica = itertools.count()
+
+# Set on responses to writes; holds the time until which the client reads from the primary
+PRIMARY_PIN_COOKIE = "db_primary_until"
+
+# Lets a client ask for a primary read explicitly, e.g. when it does not keep cookies
+CONSISTENCY_HEADER = "X-Read-Consistency"
+
 def get_db() -> Session:
     """Dependency to get database session"""
     db = SessionLocal()
@@ -23,6 +41,42 @@ def get_db() -> Session:
     finally:
         db.close()
 
+def get_read_db(request: Request) -> Session:
+    """Dependency to get a session for read-only endpoints
+    
+    Uses a replica unless none is configured or the client wrote recently, in which
+    case the read goes to the primary so the client sees its own change.
+    """
+    if _replica_sessions and not is_pinned_to_primary(request):
+        db = _replica_sessions[next(_next_replica) % len(_replica_sessions)]()
+    else:
+        db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def is_pinned_to_primary(request: Request) -> bool:
+    """Whether the client wrote within read_your_writes_seconds or asked for a primary read"""
+    if request.headers.get(CONSISTENCY_HEADER, "").lower() == "strong":
+        return True
+    try:
+        return float(request.cookies.get(PRIMARY_PIN_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+def pin_to_primary(response: Response):
+    """Send the client's reads to the primary until replicas have caught up with its write"""
+    if not replica_engines or settings.read_your_writes_seconds <= 0:
+        return
+    response.set_cookie(
+        PRIMARY_PIN_COOKIE,
+        f"{time.time() + settings.read_your_writes_seconds:.3f}",
+        max_age=math.ceil(settings.read_your_writes_seconds),
+        httponly=True,
+        samesite="lax"
+    )
+
 @contextmanager
 def get_db_context():
     """Context manager for database sessions"""
@@ -35,3 +89,11 @@ def get_db_context():
         raise
     finally:
         db.close()
+
+def pool_saturation() -> float:
+    """Fraction of the engine's connection capacity currently checked out"""
+    pool = engine.pool
+    if not hasattr(pool, "checkedout") or not hasattr(pool, "size"):
+        return 0.0
+    capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+    return pool.checkedout() / capacity if capacity else 0.0
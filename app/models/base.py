@@ -1,3 +1,9 @@
+from sqlalchemy import Text, LargeBinary
+from sqlalchemy.dialects.mysql import LONGTEXT, LONGBLOB
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
+
+# LONGTEXT/LONGBLOB on MySQL, the generic types elsewhere (e.g. SQLite for local setups and tests)
+LongText = Text().with_variant(LONGTEXT(), "mysql")
+LongBlob = LargeBinary().with_variant(LONGBLOB(), "mysql")
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+
+from app.models.base import Base, LongText
+
+class DeadLetterJob(Base):
+    __tablename__ = "dead_letter_jobs"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    job_id = Column(Integer, nullable=False, index=True)
+
+    # Last failed attempt that exhausted the retry policy
+    execution_id = Column(Integer, nullable=False)
+    attempts = Column(Integer, nullable=False)
+    error_message = Column(LongText, nullable=True)
+
+    status = Column(String(50), nullable=False, default="pending", index=True)  # pending, replayed
+    created_at = Column(DateTime, default=func.now())
+    replayed_at = Column(DateTime, nullable=True)
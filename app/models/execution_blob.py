@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, Index
+
+from app.models.base import Base, LongBlob
+
+class ExecutionBlob(Base):
+    __tablename__ = "execution_blobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Compressed chunk of an execution result or error message too large to keep inline
+    execution_id = Column(Integer, nullable=False)
+    field = Column(String(20), nullable=False)  # result, error_message
+    chunk_index = Column(Integer, nullable=False)
+    data = Column(LongBlob, nullable=False)
+
+    __table_args__ = (
+        Index("ix_execution_blobs_execution_field_chunk", "execution_id", "field", "chunk_index", unique=True),
+    )
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+class JobChange(Base):
+    __tablename__ = "job_changes"
+
+    # Monotonic sequence: the latest id is the table version and ids are change feed tokens
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    job_id = Column(Integer, nullable=False, index=True)
+
+    # created, updated, deleted; deleted rows are the tombstones of hard-deleted jobs
+    change_type = Column(String(20), nullable=False)
+    changed_at = Column(DateTime, default=func.now())
@@ -1,23 +1,30 @@
 from sqlalchemy import Column, Integer, String, DateTime, JSON
 from sqlalchemy.sql import func
-from sqlalchemy.dialects.mysql import LONGTEXT
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 
-from app.models.base import Base
+from app.models.base import Base, LongText
     
 class JobExecution(Base):
     __tablename__ = "job_executions"
     
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     job_id = Column(Integer, nullable=False, index=True)
+    workflow_run_id = Column(Integer, nullable=True, index=True)
+    
+    # Retry tracking: attempt number and the failed execution it retries
+    attempt = Column(Integer, default=1, nullable=False)
+    parent_execution_id = Column(Integer, nullable=True, index=True)
     
     # Execution details
     started_at = Column(DateTime, default=func.now())
     completed_at = Column(DateTime, nullable=True)
-    status = Column(String(50), nullable=False)  # pending, running, completed, failed
+    status = Column(String(50), nullable=False)  # pending, running, success, error, timed_out, cancelling, cancelled
     
     # Results
     result = Column(JSON, nullable=True)
-    error_message = Column(LONGTEXT, nullable=True)
-    execution_time_ms = Column(Integer, nullable=True)
\ No newline at end of file
+    error_message = Column(LongText, nullable=True)
+    execution_time_ms = Column(Integer, nullable=True)
+    
+    # Phase timings and optional cProfile/tracemalloc summary of sampled runs
+    profile = Column(JSON, nullable=True)
\ No newline at end of file
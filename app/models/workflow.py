@@ -0,0 +1,51 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, JSON
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+class Workflow(Base):
+    __tablename__ = "workflows"
+
+    # generic informations regarding workflow
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    name = Column(String(255), nullable=False, index=True)
+    description = Column(Text, nullable=True)
+
+    # DAG definition: [{"key": ..., "job_id": ..., "depends_on": [...]}]
+    nodes = Column(JSON, nullable=False)
+
+    # Optional schedule for the whole workflow (cron, interval)
+    schedule_type = Column(String(50), nullable=True)
+    schedule_config = Column(JSON, nullable=True)
+    is_active = Column(Boolean, default=True, nullable=False)
+
+    # Metadata
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+class WorkflowRun(Base):
+    __tablename__ = "workflow_runs"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    workflow_id = Column(Integer, nullable=False, index=True)
+
+    status = Column(String(50), nullable=False)  # running, completed, failed
+    started_at = Column(DateTime, default=func.now())
+    completed_at = Column(DateTime, nullable=True)
+
+class WorkflowRunNode(Base):
+    __tablename__ = "workflow_run_nodes"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    run_id = Column(Integer, nullable=False, index=True)
+
+    # Snapshot of the node definition at the time the run started
+    node_key = Column(String(255), nullable=False)
+    job_id = Column(Integer, nullable=False)
+    depends_on = Column(JSON, nullable=False)
+
+    # Execution details
+    status = Column(String(50), nullable=False)  # pending, queued, running, completed, failed, skipped
+    execution_id = Column(Integer, nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
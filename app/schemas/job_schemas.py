@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field, validator
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
 from enum import Enum
+import random
 
 class JobType(str, Enum):
     EMAIL_NOTIFICATION = "email_notification"
@@ -15,6 +16,41 @@ class JobStatus(str, Enum):
     INACTIVE = "inactive"
     PAUSED = "paused"
 
+class RetryPolicy(BaseModel):
+    max_attempts: int = Field(3, ge=1, le=20, description="Total attempts including the first run")
+    backoff_seconds: float = Field(5.0, gt=0, description="Delay before the first retry")
+    backoff_multiplier: float = Field(2.0, ge=1, description="Growth factor applied per attempt")
+    max_backoff_seconds: float = Field(300.0, gt=0, description="Upper bound for a single delay")
+    jitter: float = Field(0.1, ge=0, le=1, description="Random +/- fraction applied to each delay")
+    
+    def delay_for(self, attempt: int) -> float:
+        """Seconds to wait before retrying after the given failed attempt"""
+        delay = min(
+            self.backoff_seconds * self.backoff_multiplier ** (attempt - 1),
+            self.max_backoff_seconds
+        )
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+class ProfilingOptions(BaseModel):
+    sample_rate: float = Field(1.0, ge=0, le=1, description="Fraction of runs to profile")
+    cprofile: bool = Field(False, description="Record the handler's cProfile hotspots")
+    tracemalloc: bool = Field(False, description="Record the handler's allocations")
+
+def validate_execution_config(job_config: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Reject job configs carrying an invalid retry_policy, timeout_seconds, priority or profiling"""
+    if not job_config:
+        return job_config
+    if job_config.get("retry_policy") is not None:
+        RetryPolicy(**job_config["retry_policy"])
+    timeout = job_config.get("timeout_seconds")
+    if timeout is not None and (not isinstance(timeout, (int, float)) or timeout <= 0):
+        raise ValueError("timeout_seconds must be a positive number")
+    if job_config.get("priority", "normal") not in ("low", "normal", "high"):
+        raise ValueError("priority must be one of low, normal, high")
+    if job_config.get("profiling") is not None:
+        ProfilingOptions(**job_config["profiling"])
+    return job_config
+
 class JobCreate(BaseModel):
     name: str = Field(..., min_length=1, max_length=255, description="Job name")
     description: Optional[str] = Field(None, max_length=1000, description="Job description")
@@ -34,6 +70,10 @@ class JobCreate(BaseModel):
             if 'interval_seconds' not in v:
                 raise ValueError("interval_seconds is required for interval schedule type")
         return v
+    
+    @validator('job_config')
+    def validate_job_config(cls, v):
+        return validate_execution_config(v)
 
 class JobUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
@@ -41,6 +81,10 @@ class JobUpdate(BaseModel):
     schedule_config: Optional[Dict[str, Any]] = None
     job_config: Optional[Dict[str, Any]] = None
     is_active: Optional[bool] = None
+    
+    @validator('job_config')
+    def validate_job_config(cls, v):
+        return validate_execution_config(v)
 
 class JobResponse(BaseModel):
     id: int
@@ -69,6 +113,17 @@ class JobListResponse(BaseModel):
     per_page: int
     has_next: bool
 
+class JobChangeResponse(BaseModel):
+    job_id: int
+    change_type: str  # created, updated, deleted
+    changed_at: datetime
+    job: Optional[JobResponse] = Field(None, description="Current job definition; null for deletions")
+
+class JobChangeFeedResponse(BaseModel):
+    changes: List[JobChangeResponse]
+    next_token: str = Field(..., description="Pass as since to fetch the following changes")
+    has_more: bool
+
 class JobExecutionResponse(BaseModel):
     id: int
     job_id: int
@@ -78,6 +133,33 @@ class JobExecutionResponse(BaseModel):
     result: Optional[Dict[str, Any]]
     error_message: Optional[str]
     execution_time_ms: Optional[int]
+    attempt: int
+    parent_execution_id: Optional[int]
+    
+    class Config:
+        from_attributes = True
+
+class ExecutionProfileResponse(BaseModel):
+    execution_id: int
+    job_id: int
+    profile: Dict[str, Any]
+
+class DeadLetterResponse(BaseModel):
+    id: int
+    job_id: int
+    execution_id: int
+    attempts: int
+    error_message: Optional[str]
+    status: str
+    created_at: datetime
+    replayed_at: Optional[datetime]
     
     class Config:
         from_attributes = True
+
+class DeadLetterReplayRequest(BaseModel):
+    ids: Optional[List[int]] = Field(None, description="Dead letter entries to replay")
+    job_id: Optional[int] = Field(None, description="Replay all pending entries of this job")
+
+class DeadLetterReplayResponse(BaseModel):
+    replayed: int
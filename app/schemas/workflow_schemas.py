@@ -0,0 +1,86 @@
+from pydantic import BaseModel, Field, validator
+from typing import Optional, Dict, Any, List
+from datetime import datetime
+from app.schemas.job_schemas import ScheduleType
+
+class WorkflowNode(BaseModel):
+    key: str = Field(..., min_length=1, max_length=255, description="Unique node key within the workflow")
+    job_id: int = Field(..., description="Job executed by this node")
+    depends_on: List[str] = Field(default_factory=list, description="Keys of upstream nodes")
+
+class WorkflowCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=255, description="Workflow name")
+    description: Optional[str] = Field(None, max_length=1000, description="Workflow description")
+    nodes: List[WorkflowNode] = Field(..., min_length=1, description="DAG of jobs to execute")
+    schedule_type: Optional[ScheduleType] = Field(None, description="Optional scheduling method")
+    schedule_config: Optional[Dict[str, Any]] = Field(None, description="Schedule configuration")
+    is_active: bool = Field(True, description="Whether the workflow schedule is active")
+
+    @validator('nodes')
+    def validate_nodes(cls, v):
+        keys = [node.key for node in v]
+        if len(keys) != len(set(keys)):
+            raise ValueError("Node keys must be unique")
+
+        known = set(keys)
+        for node in v:
+            missing = [dep for dep in node.depends_on if dep not in known]
+            if missing:
+                raise ValueError(f"Node {node.key} depends on unknown nodes: {missing}")
+
+        # Kahn's algorithm: every node must be reachable in topological order
+        remaining = {node.key: set(node.depends_on) for node in v}
+        while remaining:
+            roots = [key for key, deps in remaining.items() if not deps]
+            if not roots:
+                raise ValueError(f"Workflow contains a cycle between nodes: {sorted(remaining)}")
+            for key in roots:
+                del remaining[key]
+            for deps in remaining.values():
+                deps.difference_update(roots)
+        return v
+
+    @validator('schedule_config', always=True)
+    def validate_schedule_config(cls, v, values):
+        schedule_type = values.get('schedule_type')
+        if schedule_type == ScheduleType.CRON:
+            if not v or 'cron_expression' not in v:
+                raise ValueError("cron_expression is required for cron schedule type")
+        elif schedule_type == ScheduleType.INTERVAL:
+            if not v or 'interval_seconds' not in v:
+                raise ValueError("interval_seconds is required for interval schedule type")
+        return v
+
+class WorkflowResponse(BaseModel):
+    id: int
+    name: str
+    description: Optional[str]
+    nodes: List[WorkflowNode]
+    schedule_type: Optional[str]
+    schedule_config: Optional[Dict[str, Any]]
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class WorkflowRunNodeResponse(BaseModel):
+    node_key: str
+    job_id: int
+    depends_on: List[str]
+    status: str
+    execution_id: Optional[int]
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+class WorkflowRunResponse(BaseModel):
+    id: int
+    workflow_id: int
+    status: str
+    started_at: datetime
+    completed_at: Optional[datetime]
+    nodes: List[WorkflowRunNodeResponse] = []
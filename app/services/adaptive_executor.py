@@ -0,0 +1,227 @@
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional
+from apscheduler.executors.base import run_job
+from apscheduler.executors.pool import BasePoolExecutor
+from app.services.metrics import Metrics
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ElasticThreadPool:
+    """Thread pool whose worker count can be changed while it is running"""
+    
+    def __init__(self, workers: int, name: str = "job-worker"):
+        self.name = name
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._target = 0
+        self._workers = 0
+        self._busy = 0
+        self._shutdown = False
+        self.resize(workers)
+    
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        if self._shutdown:
+            raise RuntimeError("Cannot submit to a pool that has been shut down")
+        future: Future = Future()
+        self._queue.put((future, fn, args, kwargs))
+        return future
+    
+    def resize(self, workers: int):
+        """Grow immediately; shrink as surplus workers finish their current task"""
+        with self._lock:
+            self._target = workers
+            missing = workers - self._workers
+            for _ in range(max(missing, 0)):
+                self._workers += 1
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self.name}-{len(self._threads)}",
+                    daemon=True
+                )
+                self._threads.append(thread)
+                thread.start()
+        
+        # Wake idle workers so surplus ones notice the lower target and exit
+        for _ in range(max(-missing, 0)):
+            self._queue.put(None)
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "workers": self._workers,
+                "target": self._target,
+                "busy": self._busy,
+                "pending": self._queue.qsize()
+            }
+    
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            self._shutdown = True
+            self._target = 0
+            threads = list(self._threads)
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+    
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                with self._lock:
+                    if self._workers > self._target:
+                        self._workers -= 1
+                        self._threads.remove(threading.current_thread())
+                        return
+                continue
+            
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            
+            with self._lock:
+                self._busy += 1
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._busy -= 1
+
+class AdaptiveThreadPoolExecutor(BasePoolExecutor):
+    """APScheduler executor that resizes its thread pool between configured bounds
+    
+    Every interval the autoscaler looks at the pending-fire backlog, the lag between
+    a fire's scheduled time and its start, and DB connection pool saturation:
+    backlog or lag grows the pool unless the DB pool is saturated, and a pool that
+    stays mostly idle shrinks. With min_workers equal to max_workers the pool is
+    fixed: backlog and lag are still measured for load shedding, but nothing resizes.
+    """
+    
+    def __init__(
+        self,
+        min_workers: int,
+        max_workers: int,
+        interval_seconds: float = 1.0,
+        lag_threshold_seconds: float = 1.0,
+        db_saturation_threshold: float = 0.9,
+        idle_ticks_before_shrink: int = 5,
+        db_saturation: Optional[Callable[[], float]] = None
+    ):
+        super().__init__(ElasticThreadPool(min_workers))
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.interval_seconds = interval_seconds
+        self.lag_threshold_seconds = lag_threshold_seconds
+        self.db_saturation_threshold = db_saturation_threshold
+        self.idle_ticks_before_shrink = idle_ticks_before_shrink
+        self._db_saturation = db_saturation or (lambda: 0.0)
+        self._lags: Deque[float] = deque(maxlen=1000)
+        self._idle_ticks = 0
+        self.last_lag = 0.0
+        self.decisions: Deque[Dict[str, Any]] = deque(maxlen=100)
+        self._stop = threading.Event()
+        self._autoscaler: Optional[threading.Thread] = None
+    
+    def start(self, scheduler, alias):
+        super().start(scheduler, alias)
+        self._stop.clear()
+        self._autoscaler = threading.Thread(target=self._autoscale_loop, name="executor-autoscaler", daemon=True)
+        self._autoscaler.start()
+    
+    def shutdown(self, wait=True):
+        self._stop.set()
+        super().shutdown(wait)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._pool.stats(),
+            "min_workers": self.min_workers,
+            "max_workers": self.max_workers,
+            "lag_seconds": round(self.last_lag, 3),
+            "decisions": list(self.decisions)
+        }
+    
+    def _do_submit_job(self, job, run_times):
+        def callback(f):
+            exc = f.exception()
+            if exc:
+                self._run_job_error(job.id, exc, getattr(exc, '__traceback__', None))
+            else:
+                self._run_job_success(job.id, f.result())
+        
+        f = self._pool.submit(self._run_measured, job, job._jobstore_alias, run_times, self._logger.name)
+        f.add_done_callback(callback)
+    
+    def _run_measured(self, job, jobstore_alias, run_times, logger_name):
+        # Scheduling lag: how late the fire starts relative to its most recent due time
+        lag = (datetime.now(timezone.utc) - run_times[-1]).total_seconds()
+        self._lags.append(max(lag, 0.0))
+        return run_job(job, jobstore_alias, run_times, logger_name)
+    
+    def _autoscale_loop(self):
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self._autoscale()
+            except Exception as e:
+                logger.error(f"Executor autoscaler failed: {e}")
+    
+    def _autoscale(self):
+        stats = self._pool.stats()
+        current = stats["target"]
+        backlog = stats["pending"]
+        lags = [self._lags.popleft() for _ in range(len(self._lags))]
+        lag = max(lags) if lags else 0.0
+        self.last_lag = lag
+        db_saturation = self._db_saturation()
+        
+        Metrics.set_gauge("executor_workers", stats["workers"])
+        Metrics.set_gauge("executor_busy_workers", stats["busy"])
+        Metrics.set_gauge("executor_backlog", backlog)
+        Metrics.set_gauge("executor_scheduling_lag_seconds", lag)
+        Metrics.set_gauge("db_pool_saturation", db_saturation)
+        if self.min_workers == self.max_workers:
+            return
+        
+        target, reason = current, None
+        behind = backlog > 0 or lag > self.lag_threshold_seconds
+        if behind and db_saturation >= self.db_saturation_threshold:
+            # Hold: extra workers would only queue on DB connections
+            self._idle_ticks = 0
+            Metrics.inc("executor_scale_holds_total", reason="db_pool_saturated")
+        elif behind:
+            self._idle_ticks = 0
+            # Grow towards the backlog, at least doubling to catch up with lag quickly
+            target = min(self.max_workers, max(current * 2, current + backlog))
+            reason = f"backlog {backlog}, lag {lag:.2f}s"
+        elif stats["busy"] <= current // 2:
+            self._idle_ticks += 1
+            if self._idle_ticks >= self.idle_ticks_before_shrink and current > self.min_workers:
+                self._idle_ticks = 0
+                target = max(self.min_workers, max(stats["busy"], current // 2))
+                reason = "idle"
+        else:
+            self._idle_ticks = 0
+        
+        if target != current:
+            self._pool.resize(target)
+            decision = {
+                "at": datetime.now(timezone.utc).isoformat(),
+                "from_workers": current,
+                "to_workers": target,
+                "reason": reason,
+                "backlog": backlog,
+                "lag_seconds": round(lag, 3),
+                "db_saturation": round(db_saturation, 3)
+            }
+            self.decisions.append(decision)
+            Metrics.inc("executor_scale_events_total", direction="up" if target > current else "down")
+            logger.info(f"Executor resized {current} -> {target} workers ({reason})")
@@ -0,0 +1,72 @@
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import desc
+from datetime import datetime, timezone
+from app.models.dead_letter import DeadLetterJob
+from app.schemas.job_schemas import DeadLetterResponse
+from app.services.scheduler_service import SchedulerService
+from app.services.job_executor import JobExecutor
+import logging
+
+logger = logging.getLogger(__name__)
+
+class DeadLetterService:
+    """Service layer for inspecting and replaying dead-lettered jobs"""
+    
+    def __init__(self, db: Session, scheduler_service: SchedulerService):
+        self.db = db
+        self.scheduler_service = scheduler_service
+    
+    def get_dead_letters(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        job_id: Optional[int] = None,
+        status: Optional[str] = None
+    ) -> Tuple[List[DeadLetterResponse], int]:
+        """Retrieve dead letter entries with filtering and pagination"""
+        query = self.db.query(DeadLetterJob)
+        
+        if job_id is not None:
+            query = query.filter(DeadLetterJob.job_id == job_id)
+        
+        if status:
+            query = query.filter(DeadLetterJob.status == status)
+        
+        total = query.count()
+        entries = query.order_by(desc(DeadLetterJob.id)).offset(skip).limit(limit).all()
+        
+        return [DeadLetterResponse.from_orm(entry) for entry in entries], total
+    
+    def replay(self, ids: Optional[List[int]] = None, job_id: Optional[int] = None) -> int:
+        """Re-submit pending dead letter entries with a fresh retry budget"""
+        try:
+            query = self.db.query(DeadLetterJob).filter(DeadLetterJob.status == "pending")
+            
+            if ids is not None:
+                query = query.filter(DeadLetterJob.id.in_(ids))
+            
+            if job_id is not None:
+                query = query.filter(DeadLetterJob.job_id == job_id)
+            
+            entries = query.with_for_update().all()
+            now = datetime.now(timezone.utc)
+            
+            for entry in entries:
+                self.scheduler_service.submit_once(
+                    JobExecutor.retry_job,
+                    [entry.job_id, 1, entry.execution_id],
+                    f"job_{entry.job_id}_replay_{entry.id}"
+                )
+                entry.status = "replayed"
+                entry.replayed_at = now
+            
+            self.db.commit()
+            
+            logger.info(f"Replayed {len(entries)} dead letter entries")
+            return len(entries)
+            
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to replay dead letter entries: {e}")
+            raise
@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Set
+import orjson
+from app.services.metrics import Metrics
+from app.config.settings import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Subscription:
+    """One subscriber's filters and bounded event buffer, owned by its event loop"""
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop, job_id: Optional[int], job_type: Optional[str], buffer_size: int):
+        self.loop = loop
+        self.job_id = job_id
+        self.job_type = job_type
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self.dropped = 0
+    
+    def matches(self, event: Dict[str, Any]) -> bool:
+        if self.job_id is not None and event.get("job_id") != self.job_id:
+            return False
+        if self.job_type is not None and event.get("job_type") != self.job_type:
+            return False
+        return True
+    
+    def offer(self, event: Dict[str, Any]):
+        """Buffer an event, dropping the oldest one when a slow consumer has fallen behind"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+            Metrics.inc("events_dropped_total")
+        self.queue.put_nowait(event)
+    
+    async def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Next event, or None if nothing arrived within timeout"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+    
+    def take_dropped(self) -> int:
+        dropped, self.dropped = self.dropped, 0
+        return dropped
+
+class EventBroadcaster:
+    """Fan-out of execution lifecycle events to live subscribers
+    
+    With the local backend events only reach subscribers of this process; with the
+    redis backend every replica publishes to a pub/sub channel and delivers what it
+    receives from it, so subscribers see executions from all replicas.
+    """
+    
+    _lock = threading.Lock()
+    _subscriptions: Set[Subscription] = set()
+    _redis = None
+    _listener: Optional[threading.Thread] = None
+    _stop = threading.Event()
+    
+    @classmethod
+    def subscribe(cls, job_id: Optional[int] = None, job_type: Optional[str] = None) -> Subscription:
+        """Register a subscriber on the running event loop"""
+        subscription = Subscription(asyncio.get_running_loop(), job_id, job_type, settings.event_buffer_size)
+        with cls._lock:
+            cls._subscriptions.add(subscription)
+            Metrics.set_gauge("event_subscribers", len(cls._subscriptions))
+        return subscription
+    
+    @classmethod
+    def unsubscribe(cls, subscription: Subscription):
+        with cls._lock:
+            cls._subscriptions.discard(subscription)
+            Metrics.set_gauge("event_subscribers", len(cls._subscriptions))
+    
+    @classmethod
+    def publish(cls, event_type: str, **fields):
+        """Publish an event; never raises, since events must not affect job execution"""
+        event = {"event": event_type, "at": datetime.now(timezone.utc).isoformat(), **fields}
+        try:
+            if settings.event_backend == "redis":
+                cls._get_redis().publish(settings.event_channel, orjson.dumps(event))
+            else:
+                cls._dispatch(event)
+        except Exception as e:
+            logger.warning(f"Failed to publish {event_type} event: {e}")
+    
+    @classmethod
+    def start(cls):
+        """Start relaying events from the pub/sub channel when the redis backend is used"""
+        if settings.event_backend != "redis" or cls._listener is not None:
+            return
+        cls._stop.clear()
+        cls._listener = threading.Thread(target=cls._listen, name="event-listener", daemon=True)
+        cls._listener.start()
+    
+    @classmethod
+    def stop(cls):
+        cls._stop.set()
+        cls._listener = None
+    
+    @classmethod
+    def _dispatch(cls, event: Dict[str, Any]):
+        with cls._lock:
+            subscriptions = list(cls._subscriptions)
+        for subscription in subscriptions:
+            if not subscription.matches(event):
+                continue
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # The subscriber's event loop has closed
+                cls.unsubscribe(subscription)
+    
+    @classmethod
+    def _get_redis(cls):
+        if cls._redis is None:
+            import redis
+            cls._redis = redis.Redis.from_url(settings.redis_url)
+        return cls._redis
+    
+    @classmethod
+    def _listen(cls):
+        while not cls._stop.is_set():
+            try:
+                pubsub = cls._get_redis().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(settings.event_channel)
+                while not cls._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        cls._dispatch(orjson.loads(message["data"]))
+                pubsub.close()
+            except Exception as e:
+                logger.error(f"Event listener lost its Redis subscription, retrying: {e}")
+                time.sleep(1.0)
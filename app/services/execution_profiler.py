@@ -0,0 +1,158 @@
+import cProfile
+import pstats
+import random
+import threading
+import time
+import tracemalloc
+from typing import Dict, Any, Optional, Callable, List
+from app.config.settings import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# tracemalloc is process-wide, so only one execution at a time may own it
+_tracemalloc_lock = threading.Lock()
+
+class ExecutionProfiler:
+    """Phase timings and optional cProfile/tracemalloc summary of one sampled execution"""
+    
+    def __init__(self, started: float, cprofile: bool = False, trace_memory: bool = False):
+        self.phases: Dict[str, float] = {}
+        self.started = started
+        self._last_mark = started
+        self.cprofile = cprofile
+        self.trace_memory = trace_memory
+        self._hotspots: Optional[List[Dict[str, Any]]] = None
+        self._memory: Optional[Dict[str, Any]] = None
+        # Guards ownership of tracemalloc between the handler thread and abandon()
+        self._state_lock = threading.Lock()
+        self._tracing = False
+        self._abandoned = False
+    
+    @staticmethod
+    def for_job(job_config: Dict[str, Any], started: float) -> Optional["ExecutionProfiler"]:
+        """A profiler if this run is sampled, from job_config["profiling"] or the global sample rate
+        
+        Returns None for the vast majority of runs, which then carry no profiling cost.
+        """
+        options = job_config.get("profiling")
+        if options is None:
+            if not settings.profile_sample_rate or random.random() >= settings.profile_sample_rate:
+                return None
+            options = {}
+        elif random.random() >= options.get("sample_rate", 1.0):
+            return None
+        
+        return ExecutionProfiler(
+            started,
+            cprofile=options.get("cprofile", settings.profile_cprofile),
+            trace_memory=options.get("tracemalloc", False)
+        )
+    
+    def mark(self, phase: str):
+        """Record the time since the previous mark as the duration of phase"""
+        now = time.perf_counter()
+        self.phases[phase] = round((now - self._last_mark) * 1000, 3)
+        self._last_mark = now
+    
+    def wrap(self, func: Callable[[], Any]) -> Callable[[], Any]:
+        """Wrap the handler call so it is profiled on the thread that runs it"""
+        if not self.cprofile and not self.trace_memory:
+            return func
+        
+        def profiled():
+            profile = cProfile.Profile() if self.cprofile else None
+            tracing = self.trace_memory and self._start_tracemalloc()
+            if tracing:
+                before = tracemalloc.take_snapshot()
+            if profile is not None:
+                profile.enable()
+            try:
+                return func()
+            finally:
+                if profile is not None:
+                    profile.disable()
+                    self._hotspots = self._summarize_profile(profile)
+                if tracing:
+                    self._memory = self._summarize_memory(before)
+        return profiled
+    
+    def abandon(self):
+        """Give up tracing for a run the executor walked away from (timed out or cancelled)
+        
+        Stops tracemalloc and frees it for other executions now instead of whenever the
+        abandoned handler thread finishes, which may be never. That thread then skips
+        its memory summary.
+        """
+        with self._state_lock:
+            self._abandoned = True
+            if self._tracing:
+                self._stop_tracemalloc()
+                logger.info("Stopped memory profile of an abandoned execution")
+    
+    def summary(self) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {
+            "phases_ms": dict(self.phases),
+            "total_ms": round((self._last_mark - self.started) * 1000, 3)
+        }
+        if self._hotspots is not None:
+            summary["hotspots"] = self._hotspots
+        if self._memory is not None:
+            summary["memory"] = self._memory
+        return summary
+    
+    @staticmethod
+    def _summarize_profile(profile: cProfile.Profile) -> List[Dict[str, Any]]:
+        stats = pstats.Stats(profile).stats
+        top = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:settings.profile_top_n]
+        return [
+            {
+                "function": f"{filename}:{line}({name})",
+                "calls": calls,
+                "own_ms": round(own * 1000, 3),
+                "cumulative_ms": round(cumulative * 1000, 3)
+            }
+            for (filename, line, name), (_, calls, own, cumulative, _) in top
+        ]
+    
+    def _start_tracemalloc(self) -> bool:
+        with self._state_lock:
+            if self._abandoned:
+                return False
+            if not _tracemalloc_lock.acquire(blocking=False):
+                logger.info("Skipping memory profile: another execution is being traced")
+                return False
+            if tracemalloc.is_tracing():
+                # Started outside the scheduler; leave it to its owner
+                _tracemalloc_lock.release()
+                return False
+            tracemalloc.start()
+            self._tracing = True
+            return True
+    
+    def _stop_tracemalloc(self):
+        """Stop tracing and release tracemalloc; call with _state_lock held while tracing"""
+        self._tracing = False
+        tracemalloc.stop()
+        _tracemalloc_lock.release()
+    
+    def _summarize_memory(self, before: tracemalloc.Snapshot) -> Optional[Dict[str, Any]]:
+        with self._state_lock:
+            if not self._tracing:
+                # abandon() already stopped tracing
+                return None
+            try:
+                after = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                self._stop_tracemalloc()
+        
+        # Allocations from other threads running meanwhile are included
+        diff = after.compare_to(before, "lineno")[:settings.profile_top_n]
+        return {
+            "peak_bytes": peak,
+            "top_allocations": [
+                {"location": str(stat.traceback), "size_diff_bytes": stat.size_diff, "count_diff": stat.count_diff}
+                for stat in diff
+            ]
+        }
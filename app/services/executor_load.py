@@ -0,0 +1,92 @@
+import math
+import os
+import socket
+import threading
+from typing import Dict, Any, Optional, Callable
+import orjson
+from app.config.settings import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "executor_load:"
+
+class ExecutorLoad:
+    """Executor backlog and lag shared between pods through Redis
+    
+    Pods that run jobs publish their executor stats every executor_load_publish_seconds
+    under a key of their own that expires if they stop. API-only pods have no executor,
+    so admission control and readiness there read the combined load of those pods.
+    """
+    
+    _redis = None
+    _publisher: Optional[threading.Thread] = None
+    _stop = threading.Event()
+    _key = f"{KEY_PREFIX}{socket.gethostname()}:{os.getpid()}"
+    
+    @classmethod
+    def start(cls, stats: Callable[[], Dict[str, Any]]):
+        """Publish this pod's executor stats until stop() is called"""
+        if settings.executor_load_publish_seconds <= 0 or cls._publisher is not None:
+            return
+        cls._stop.clear()
+        cls._publisher = threading.Thread(
+            target=cls._publish_loop,
+            args=(stats,),
+            name="executor-load-publisher",
+            daemon=True
+        )
+        cls._publisher.start()
+    
+    @classmethod
+    def stop(cls):
+        if cls._publisher is None:
+            return
+        cls._stop.set()
+        cls._publisher = None
+        try:
+            cls._get_redis().delete(cls._key)
+        except Exception as e:
+            logger.warning(f"Failed to withdraw executor load: {e}")
+    
+    @classmethod
+    def publish(cls, stats: Dict[str, Any]):
+        payload = {field: stats.get(field, 0) for field in ("workers", "busy", "pending", "lag_seconds")}
+        ttl = max(1, math.ceil(settings.executor_load_publish_seconds * 3))
+        cls._get_redis().set(cls._key, orjson.dumps(payload), ex=ttl)
+    
+    @classmethod
+    def read(cls) -> Dict[str, Any]:
+        """Combined load of every publishing pod: summed backlog, worst lag; empty if unreachable"""
+        try:
+            client = cls._get_redis()
+            keys = list(client.scan_iter(match=f"{KEY_PREFIX}*", count=100))
+            loads = [orjson.loads(value) for value in client.mget(keys) if value] if keys else []
+        except Exception as e:
+            logger.warning(f"Failed to read executor load: {e}")
+            return {}
+        
+        return {
+            "pods": len(loads),
+            "workers": sum(load["workers"] for load in loads),
+            "busy": sum(load["busy"] for load in loads),
+            "pending": sum(load["pending"] for load in loads),
+            "lag_seconds": max((load["lag_seconds"] for load in loads), default=0.0)
+        }
+    
+    @classmethod
+    def _publish_loop(cls, stats: Callable[[], Dict[str, Any]]):
+        while True:
+            try:
+                cls.publish(stats())
+            except Exception as e:
+                logger.warning(f"Failed to publish executor load: {e}")
+            if cls._stop.wait(settings.executor_load_publish_seconds):
+                return
+    
+    @classmethod
+    def _get_redis(cls):
+        if cls._redis is None:
+            import redis
+            cls._redis = redis.Redis.from_url(settings.redis_url)
+        return cls._redis
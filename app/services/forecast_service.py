@@ -0,0 +1,171 @@
+import math
+import re
+from collections import Counter, defaultdict
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, List, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.models.job import Job
+from app.models.job_execution import JobExecution
+from app.config.settings import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+MAX_FORECAST_BUCKETS = 10080
+
+def parse_duration(value: str) -> int:
+    """Parse durations such as 90s, 1m, 24h or 7d into seconds"""
+    match = re.fullmatch(r"\s*(\d+)\s*([smhd])\s*", value or "")
+    if not match or int(match.group(1)) == 0:
+        raise ValueError(f"Invalid duration: {value!r}, expected e.g. 30s, 1m, 24h, 7d")
+    return int(match.group(1)) * DURATION_UNITS[match.group(2)]
+
+class ForecastService:
+    """Service for projecting future fire volume and worker demand of active jobs"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def forecast(self, window_seconds: int, bucket_seconds: int) -> Dict[str, Any]:
+        """Histogram of upcoming fires per job type with an estimate of busy workers per bucket
+        
+        Identical schedules are expanded once and weighted by how many jobs share them,
+        so the cost follows the number of distinct schedules rather than the number of jobs.
+        """
+        if bucket_seconds > window_seconds:
+            raise ValueError("bucket must not be larger than window")
+        bucket_count = math.ceil(window_seconds / bucket_seconds)
+        if bucket_count > MAX_FORECAST_BUCKETS:
+            raise ValueError(f"window/bucket yields {bucket_count} buckets, at most {MAX_FORECAST_BUCKETS} allowed")
+        
+        start = datetime.now(timezone.utc).replace(microsecond=0)
+        start_ts = start.timestamp()
+        
+        # Group schedules: cron by expression, interval by period and phase within it
+        cron_groups: Counter = Counter()
+        interval_groups: Counter = Counter()
+        rows = self.db.query(Job.job_type, Job.schedule_type, Job.schedule_config, Job.next_run).filter(
+            Job.is_active == True
+        ).all()
+        for job_type, schedule_type, schedule_config, next_run in rows:
+            schedule_config = schedule_config or {}
+            if schedule_type == "cron" and schedule_config.get("cron_expression"):
+                cron_groups[(job_type, schedule_config["cron_expression"])] += 1
+            elif schedule_type == "interval" and schedule_config.get("interval_seconds"):
+                interval = float(schedule_config["interval_seconds"])
+                first = self._first_interval_fire(next_run, interval, start_ts)
+                # Fires per bucket only depend on the phase of the first fire within the period
+                interval_groups[(job_type, interval, round(first % interval))] += 1
+        
+        histograms: Dict[str, List[int]] = defaultdict(lambda: [0] * bucket_count)
+        
+        for (job_type, expression), weight in cron_groups.items():
+            histogram = histograms[job_type]
+            try:
+                for offset in self._cron_offsets(expression, start, window_seconds):
+                    histogram[int(offset // bucket_seconds)] += weight
+            except (ValueError, KeyError) as e:
+                logger.warning(f"Skipping unparseable cron expression {expression!r} in forecast: {e}")
+        
+        for (job_type, interval, phase), weight in interval_groups.items():
+            first = (phase - start_ts) % interval
+            counts = self._interval_counts(first, interval, window_seconds, bucket_seconds, bucket_count)
+            histogram = histograms[job_type]
+            for index, count in counts:
+                histogram[index] += count * weight
+        
+        durations = self._average_durations_ms()
+        totals = [0] * bucket_count
+        workers = [0.0] * bucket_count
+        job_types = {}
+        for job_type, histogram in sorted(histograms.items()):
+            average_ms = durations.get(job_type)
+            for index, fires in enumerate(histogram):
+                totals[index] += fires
+                if average_ms:
+                    # Little's law: busy workers = arrival rate x time in service
+                    workers[index] += fires * average_ms / 1000 / bucket_seconds
+            job_types[job_type] = {
+                "fires": sum(histogram),
+                "avg_execution_ms": round(average_ms, 1) if average_ms is not None else None,
+                "histogram": histogram
+            }
+        
+        peaks = sorted(range(bucket_count), key=lambda index: (-workers[index], -totals[index], index))[:10]
+        return {
+            "window_start": start,
+            "window_seconds": window_seconds,
+            "bucket_seconds": bucket_seconds,
+            "max_workers": settings.max_workers,
+            "total_fires": sum(totals),
+            "fires": totals,
+            "estimated_workers": [round(value, 3) for value in workers],
+            "peaks": [
+                {
+                    "bucket_start": start + timedelta(seconds=index * bucket_seconds),
+                    "fires": totals[index],
+                    "estimated_workers": round(workers[index], 3)
+                }
+                for index in peaks if totals[index]
+            ],
+            "job_types": job_types
+        }
+    
+    @staticmethod
+    def _first_interval_fire(next_run, interval: float, start_ts: float) -> float:
+        """Timestamp of the first fire at or after the window start"""
+        if next_run is None:
+            return start_ts + interval
+        # next_run is stored as naive UTC
+        next_ts = next_run.replace(tzinfo=timezone.utc).timestamp() if next_run.tzinfo is None else next_run.timestamp()
+        if next_ts < start_ts:
+            next_ts += math.ceil((start_ts - next_ts) / interval) * interval
+        return next_ts
+    
+    @staticmethod
+    def _cron_offsets(expression: str, start: datetime, window_seconds: int):
+        """Seconds from the window start of every fire of a cron expression inside the window"""
+        from croniter import croniter
+        cron = croniter(expression, start)
+        while True:
+            offset = (cron.get_next(datetime) - start).total_seconds()
+            if offset >= window_seconds:
+                return
+            yield offset
+    
+    @staticmethod
+    def _interval_counts(
+        first: float,
+        interval: float,
+        window_seconds: int,
+        bucket_seconds: int,
+        bucket_count: int
+    ) -> List[Tuple[int, int]]:
+        """(bucket index, fires) of an interval schedule whose first fire is first seconds in"""
+        if interval >= bucket_seconds:
+            # Sparse: at most one fire per bucket, walk the fires
+            fires = int(math.ceil((window_seconds - first) / interval)) if first < window_seconds else 0
+            return [(int((first + k * interval) // bucket_seconds), 1) for k in range(fires)]
+        
+        # Dense: count the fires falling in each bucket arithmetically
+        def fires_before(t: float) -> int:
+            return max(0, math.ceil((min(t, window_seconds) - first) / interval))
+        
+        return [
+            (index, fires_before((index + 1) * bucket_seconds) - fires_before(index * bucket_seconds))
+            for index in range(bucket_count)
+        ]
+    
+    def _average_durations_ms(self) -> Dict[str, float]:
+        """Average recorded execution time per job type over recent history"""
+        since = datetime.now(timezone.utc) - timedelta(days=settings.forecast_history_days)
+        rows = self.db.query(Job.job_type, func.avg(JobExecution.execution_time_ms)).join(
+            Job, Job.id == JobExecution.job_id
+        ).filter(
+            JobExecution.started_at >= since,
+            JobExecution.execution_time_ms.isnot(None)
+        ).group_by(Job.job_type).all()
+        return {job_type: float(average) for job_type, average in rows if average is not None}
@@ -0,0 +1,58 @@
+import threading
+from typing import Dict, Any, List, Callable, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+class _Batch:
+    """Job IDs of one type collected during a single window"""
+    
+    def __init__(self):
+        self.job_ids: List[int] = []
+        self.full = threading.Event()
+
+class JobBatcher:
+    """Groups co-firing jobs of the same type into one batched execution
+    
+    The first fire of a type opens a batch and becomes its leader: it waits for the
+    window (or until the batch is full) and then runs the whole batch on its worker.
+    Fires that join an open batch return immediately and free their worker.
+    """
+    
+    def __init__(
+        self,
+        run_batch: Callable[[str, List[int]], Dict[str, Any]],
+        window_seconds: float,
+        max_size: int
+    ):
+        self.run_batch = run_batch
+        self.window_seconds = window_seconds
+        self.max_size = max_size
+        self._open: Dict[str, _Batch] = {}
+        self._lock = threading.Lock()
+    
+    def submit(self, job_type: str, job_id: int) -> Dict[str, Any]:
+        """Add a fired job to the open batch of its type"""
+        with self._lock:
+            batch: Optional[_Batch] = self._open.get(job_type)
+            leader = batch is None
+            if leader:
+                batch = _Batch()
+                self._open[job_type] = batch
+            
+            batch.job_ids.append(job_id)
+            if len(batch.job_ids) >= self.max_size:
+                # Close the batch so later fires start a new one
+                del self._open[job_type]
+                batch.full.set()
+        
+        if not leader:
+            return {"status": "batched", "job_id": job_id}
+        
+        batch.full.wait(self.window_seconds)
+        with self._lock:
+            if self._open.get(job_type) is batch:
+                del self._open[job_type]
+        
+        logger.info(f"Running batch of {len(batch.job_ids)} {job_type} jobs")
+        return self.run_batch(job_type, batch.job_ids)
@@ -1,91 +1,593 @@
 import asyncio
+import threading
 import time
-from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+import uuid
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, Optional, Tuple, List, Callable
 from sqlalchemy.orm import Session
 from app.models.job import Job
 from app.models.job_execution import JobExecution
+from app.models.dead_letter import DeadLetterJob
+from app.schemas.job_schemas import RetryPolicy
 from app.database.connection import get_db_context
-from app.services.job_handler import JobHandlerFactory
+from app.services.job_handler import (
+    JobHandler, JobHandlerFactory, JobCancelled, CancellationToken, set_current_token
+)
+from app.services.job_batcher import JobBatcher
+from app.services.rate_limiter import get_rate_limiter
+from app.services.load_monitor import LoadMonitor
+from app.services.metrics import Metrics
+from app.services.event_broadcaster import EventBroadcaster
+from app.services.execution_profiler import ExecutionProfiler
+from app.services.result_store import ResultStore, StoredOutcome
+from app.config.settings import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Cancellation tokens of executions currently running in this process
+_running_executions: Dict[int, CancellationToken] = {}
+
+WAIT_SLICE_SECONDS = 0.1
+
 class JobExecutor:
     """Service for executing scheduled jobs"""
     
     @staticmethod
-    def execute_job(job_id: int) -> Dict[str, Any]:
+    def execute_job(job_id: int, job_type: Optional[str] = None, reserved: bool = False) -> Dict[str, Any]:
         """Execute a job and record the execution"""
+        # A deferred fire already holds its rate limit token
+        if reserved:
+            result, _ = JobExecutor.run_job(job_id)
+            return result
+        
+        # Co-firing jobs of a batch-capable type are collected and run together
+        if job_type and settings.batch_window_ms > 0:
+            handler = JobHandlerFactory.get_handler(job_type)
+            if handler is not None and handler.supports_batch:
+                return _batcher.submit(job_type, job_id)
+        
+        result, _ = JobExecutor.run_job(
+            job_id,
+            on_throttle=lambda delay: JobExecutor.defer(
+                JobExecutor.execute_job, [job_id, job_type, True], f"job_{job_id}", delay
+            ),
+            on_shed=lambda delay: JobExecutor.defer(
+                JobExecutor.execute_job, [job_id, job_type], f"job_{job_id}_shed", delay, coalesce=True
+            ),
+            droppable=True
+        )
+        return result
+    
+    @staticmethod
+    def retry_job(job_id: int, attempt: int, parent_execution_id: int, reserved: bool = False) -> Dict[str, Any]:
+        """Execute a delayed retry attempt of a failed job"""
+        on_throttle = None
+        if not reserved:
+            on_throttle = lambda delay: JobExecutor.defer(
+                JobExecutor.retry_job, [job_id, attempt, parent_execution_id, True], f"job_{job_id}_retry", delay
+            )
+        
+        result, _ = JobExecutor.run_job(
+            job_id,
+            attempt=attempt,
+            parent_execution_id=parent_execution_id,
+            on_throttle=on_throttle,
+            on_shed=lambda delay: JobExecutor.defer(
+                JobExecutor.retry_job, [job_id, attempt, parent_execution_id, reserved], f"job_{job_id}_retry_shed", delay
+            )
+        )
+        return result
+    
+    @staticmethod
+    def defer(func: Callable, args: list, task_prefix: str, delay: float, coalesce: bool = False):
+        """Re-fire a throttled or shed task after delay seconds
+        
+        Every throttled fire holds its own rate limit token and gets its own deferral.
+        With coalesce, the task prefix is the deferral's ID and a fire that finds one
+        already pending is dropped, so repeated shedding keeps one deferral per job.
+        """
+        from app.services.scheduler_service import SchedulerService
+        task_id = task_prefix if coalesce else f"{task_prefix}_deferred_{uuid.uuid4().hex[:12]}"
+        submitted = SchedulerService().submit_once(
+            func,
+            args,
+            task_id,
+            run_date=datetime.now(timezone.utc) + timedelta(seconds=delay),
+            replace_existing=not coalesce
+        )
+        if not submitted:
+            logger.info(f"Deferral {task_id} already pending, dropping this fire")
+    
+    @staticmethod
+    def run_job(
+        job_id: int,
+        workflow_run_id: Optional[int] = None,
+        require_active: bool = True,
+        attempt: int = 1,
+        parent_execution_id: Optional[int] = None,
+        on_throttle: Optional[Callable[[float], None]] = None,
+        on_shed: Optional[Callable[[float], None]] = None,
+        droppable: bool = False
+    ) -> Tuple[Dict[str, Any], Optional[int]]:
+        """Execute a job and return its result with the execution record ID
+        
+        Callers that pass on_throttle are rate limited: a throttled run creates no
+        execution record and on_throttle is called with the delay to re-fire after.
+        The re-fire already holds its token and runs without on_throttle. Only
+        scheduled fires are droppable: past the rule's max_wait_seconds, or
+        skipped under load with load_shed_action "skip".
+        Callers that pass on_shed let low priority runs be shed under overload.
+        """
+        started = time.perf_counter()
         
         with get_db_context() as db:
             # Get job details
             job = db.query(Job).filter(Job.id == job_id).first()
             if not job:
                 logger.error(f"Job {job_id} not found")
-                return {"status": "error", "message": "Job not found"}
+                return {"status": "error", "message": "Job not found"}, None
             
-            if not job.is_active:
+            if require_active and not job.is_active:
                 logger.info(f"Job {job_id} is inactive, skipping execution")
-                return {"status": "skipped", "message": "Job is inactive"}
+                return {"status": "skipped", "message": "Job is inactive"}, None
+            
+            if on_shed is not None and LoadMonitor.should_shed(job.job_config or {}):
+                return JobExecutor._shed(job_id, job.job_type, on_shed, skippable=droppable), None
+            
+            if on_throttle is not None:
+                delay = get_rate_limiter().acquire(job.job_type, job.job_config or {}, droppable=droppable)
+                if delay is None:
+                    logger.info(f"Job {job_id} dropped, its rate limit backlog exceeds max_wait_seconds")
+                    return {"status": "dropped", "message": "Rate limit backlog too long"}, None
+                if delay > 0:
+                    logger.info(f"Job {job_id} throttled, deferring by {delay:.2f}s")
+                    on_throttle(delay)
+                    return {"status": "deferred", "delay_seconds": delay}, None
+            
+            # Sampled runs record where their time goes; all others skip every profiling step
+            profiler = ExecutionProfiler.for_job(job.job_config or {}, started)
+            if profiler:
+                profiler.mark("load")
             
             # Create execution record
             execution = JobExecution(
                 job_id=job_id,
+                workflow_run_id=workflow_run_id,
+                attempt=attempt,
+                parent_execution_id=parent_execution_id,
                 status="running"
             )
             db.add(execution)
             db.commit()
             db.refresh(execution)
             
-            start_time = time.time()
-            result = {"status": "success"}
-            error_message = None
+            execution_id = execution.id
+            job_type = job.job_type
+            job_config = job.job_config or {}
+        
+        event_fields = {
+            "job_id": job_id,
+            "job_type": job_type,
+            "execution_id": execution_id,
+            "attempt": attempt,
+            "workflow_run_id": workflow_run_id
+        }
+        EventBroadcaster.publish("started", **event_fields)
+        if profiler:
+            profiler.mark("insert")
+        
+        # The DB session is released while the handler runs
+        start_time = time.time()
+        result, error_message = JobExecutor._run_handler(job_id, execution_id, job_type, job_config, profiler)
+        execution_time = int((time.time() - start_time) * 1000)
+        if profiler:
+            profiler.mark("handler")
+        
+        # Large outputs are compressed before a connection is taken
+        outcome = ResultStore.encode(result, error_message)
+        
+        with get_db_context() as db:
+            job = db.query(Job).filter(Job.id == job_id).first()
+            execution = db.query(JobExecution).filter(JobExecution.id == execution_id).first()
+            
+            JobExecutor._record_outcome(db, job, execution, outcome, execution_time)
+            db.commit()
+            
+            # Workflow nodes report failures to their run, and cancellations are never retried
+            if job and outcome.error_message is not None and workflow_run_id is None and outcome.status != "cancelled":
+                JobExecutor._handle_failure(db, job, execution, outcome.error_message)
+        
+        if profiler:
+            profiler.mark("record")
+            JobExecutor._store_profile(execution_id, profiler.summary())
+        
+        JobExecutor._publish_finished(event_fields, outcome, execution_time)
+        return result, execution_id
+    
+    @staticmethod
+    def run_batch(job_type: str, job_ids: List[int]) -> Dict[str, Any]:
+        """Execute co-firing jobs of one type with a single handler call"""
+        handler = JobHandlerFactory.get_handler(job_type)
+        
+        with get_db_context() as db:
+            jobs = db.query(Job).filter(
+                Job.id.in_(job_ids),
+                Job.is_active == True
+            ).all()
+            
+            # Throttled members are re-fired later instead of joining this batch
+            limiter = get_rate_limiter()
+            admitted = []
+            for job in jobs:
+                if LoadMonitor.should_shed(job.job_config or {}):
+                    JobExecutor._shed(
+                        job.id,
+                        job_type,
+                        lambda delay, job_id=job.id: JobExecutor.defer(
+                            JobExecutor.execute_job, [job_id, job_type], f"job_{job_id}_shed", delay, coalesce=True
+                        )
+                    )
+                    continue
+                delay = limiter.acquire(job_type, job.job_config or {})
+                if delay is None:
+                    logger.info(f"Job {job.id} dropped from batch, its rate limit backlog exceeds max_wait_seconds")
+                elif delay > 0:
+                    JobExecutor.defer(JobExecutor.execute_job, [job.id, job_type, True], f"job_{job.id}", delay)
+                else:
+                    admitted.append(job)
+            
+            # Every member keeps its own timeout: only jobs with the same timeout share a handler call
+            groups: Dict[Optional[float], List[Tuple[int, Dict[str, Any]]]] = {}
+            for job in admitted:
+                config = job.job_config or {}
+                timeout = config.get("timeout_seconds") or settings.job_default_timeout_seconds
+                groups.setdefault(timeout, []).append((job.id, config))
+        
+        if not groups:
+            return {"status": "skipped", "message": "No active jobs in batch"}
+        
+        # Tightest timeouts first, unbounded groups last
+        outcomes: List[StoredOutcome] = []
+        for timeout in sorted(groups, key=lambda value: (value is None, value or 0)):
+            batch_job_ids = [job_id for job_id, _ in groups[timeout]]
+            configs = [config for _, config in groups[timeout]]
+            outcomes.extend(JobExecutor._run_batch_group(handler, job_type, batch_job_ids, configs, timeout))
+        
+        succeeded = sum(1 for outcome in outcomes if outcome.error_message is None)
+        logger.info(f"Executed batch of {len(outcomes)} {job_type} jobs, {succeeded} succeeded")
+        return {"status": "success", "batch_size": len(outcomes), "succeeded": succeeded}
+    
+    @staticmethod
+    def _run_batch_group(
+        handler: JobHandler,
+        job_type: str,
+        batch_job_ids: List[int],
+        configs: List[Dict[str, Any]],
+        timeout: Optional[float]
+    ) -> List[StoredOutcome]:
+        """Run jobs sharing one timeout with a single execute_batch call and record each outcome"""
+        with get_db_context() as db:
+            executions = [JobExecution(job_id=job_id, status="running") for job_id in batch_job_ids]
+            db.add_all(executions)
+            db.flush()
+            execution_ids = [execution.id for execution in executions]
+        
+        batch_events = [
+            {"job_id": job_id, "job_type": job_type, "execution_id": execution_id, "attempt": 1, "workflow_run_id": None}
+            for job_id, execution_id in zip(batch_job_ids, execution_ids)
+        ]
+        for event_fields in batch_events:
+            EventBroadcaster.publish("started", **event_fields)
+        
+        # Each member can be cancelled on its own; the batch stops once all of them are
+        member_tokens = [CancellationToken() for _ in execution_ids]
+        start_time = time.time()
+        status, value = JobExecutor._run_guarded(
+            f"batch of {len(configs)} {job_type} jobs",
+            execution_ids,
+            lambda: handler.execute_batch(configs),
+            timeout,
+            member_tokens
+        )
+        execution_time = int((time.time() - start_time) * 1000)
+        
+        if status == "ok" and (not isinstance(value, list) or len(value) != len(configs)):
+            status, value = "error", ValueError("execute_batch must return one result per config")
+        
+        outcomes = []
+        for index, member_token in enumerate(member_tokens):
+            if status == "ok":
+                result = value[index]
+                if member_token.cancelled and result.get("status") != "success":
+                    # Cancelled before the handler got to it; work it did finish is kept
+                    result, error_message = JobExecutor._failure_result("cancelled", None, timeout)
+                else:
+                    error_message = None if result.get("status") == "success" else result.get("message", "Job failed")
+            else:
+                result, error_message = JobExecutor._failure_result(status, value, timeout)
+            outcomes.append(ResultStore.encode(result, error_message))
+        
+        with get_db_context() as db:
+            jobs_by_id = {job.id: job for job in db.query(Job).filter(Job.id.in_(batch_job_ids)).all()}
+            executions_by_id = {
+                execution.id: execution
+                for execution in db.query(JobExecution).filter(JobExecution.id.in_(execution_ids)).all()
+            }
+            
+            for job_id, execution_id, outcome in zip(batch_job_ids, execution_ids, outcomes):
+                JobExecutor._record_outcome(
+                    db,
+                    jobs_by_id.get(job_id),
+                    executions_by_id[execution_id],
+                    outcome,
+                    execution_time
+                )
+            db.commit()
             
+            for job_id, execution_id, outcome in zip(batch_job_ids, execution_ids, outcomes):
+                job = jobs_by_id.get(job_id)
+                if job and outcome.error_message is not None and outcome.status != "cancelled":
+                    JobExecutor._handle_failure(db, job, executions_by_id[execution_id], outcome.error_message)
+        
+        for event_fields, outcome in zip(batch_events, outcomes):
+            JobExecutor._publish_finished(event_fields, outcome, execution_time)
+        return outcomes
+    
+    @staticmethod
+    def _shed(job_id: int, job_type: str, on_shed: Callable[[float], None], skippable: bool = True) -> Dict[str, Any]:
+        """Defer or drop a low priority fire while the service is overloaded
+        
+        Retries and replays are not skippable: nothing would run after them, so they are always deferred.
+        """
+        action = settings.load_shed_action if skippable else "defer"
+        Metrics.inc("load_shed_total", job_type=job_type, action=action)
+        if action == "defer":
+            delay = settings.load_shed_defer_seconds
+            logger.info(f"Job {job_id} shed under load, deferring by {delay:.0f}s")
+            on_shed(delay)
+            return {"status": "deferred", "delay_seconds": delay}
+        
+        logger.info(f"Job {job_id} shed under load, skipping this fire")
+        return {"status": "shed", "message": "Skipped under load"}
+    
+    @staticmethod
+    def _publish_finished(event_fields: Dict[str, Any], outcome: StoredOutcome, execution_time: int):
+        """Publish the completed or failed event of an execution"""
+        EventBroadcaster.publish(
+            "completed" if outcome.error_message is None else "failed",
+            **event_fields,
+            status=outcome.status,
+            duration_ms=execution_time,
+            error_message=outcome.error_message
+        )
+    
+    @staticmethod
+    def _store_profile(execution_id: int, profile: Dict[str, Any]):
+        """Attach a profile to its execution once the run's own writes are committed"""
+        try:
+            with get_db_context() as db:
+                db.query(JobExecution).filter(JobExecution.id == execution_id).update(
+                    {"profile": profile},
+                    synchronize_session=False
+                )
+                db.commit()
+        except Exception as e:
+            logger.warning(f"Failed to store profile of execution {execution_id}: {e}")
+    
+    @staticmethod
+    def request_cancel(execution_id: int) -> bool:
+        """Signal a running execution in this process to stop"""
+        token = _running_executions.get(execution_id)
+        if token is None:
+            return False
+        token.cancel("cancelled")
+        return True
+    
+    @staticmethod
+    def _record_outcome(
+        db: Session,
+        job: Optional[Job],
+        execution: JobExecution,
+        outcome: StoredOutcome,
+        execution_time: int
+    ):
+        """Apply a handler outcome to the execution record and job stats"""
+        # Update execution record; oversized output goes to execution_blobs in the same transaction
+        execution.completed_at = datetime.now(timezone.utc)
+        execution.status = outcome.status
+        execution.result = outcome.result
+        execution.error_message = outcome.error_message
+        execution.execution_time_ms = execution_time
+        ResultStore.save(db, execution.id, outcome)
+        
+        if not job:
+            logger.warning(f"Job {execution.job_id} was deleted while executing")
+            return
+        
+        # Update job stats
+        if outcome.error_message is None:
+            job.success_runs += 1
+            job.last_run = datetime.now(timezone.utc)
+        else:
+            job.failed_runs += 1
+        job.total_runs += 1
+        job.updated_at = datetime.now(timezone.utc)
+        
+        # Calculate next run
+        from app.services.scheduler_service import SchedulerService
+        scheduler = SchedulerService()
+        job.next_run = scheduler.calculate_next_run(
+            job.schedule_type,
+            job.schedule_config
+        )
+    
+    @staticmethod
+    def _run_handler(
+        job_id: int,
+        execution_id: int,
+        job_type: str,
+        job_config: Dict[str, Any],
+        profiler: Optional[ExecutionProfiler] = None
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Run the handler for a single execution, returning its result and error message"""
+        handler = JobHandlerFactory.get_handler(job_type)
+        if not handler:
+            error_message = f"No handler found for job type: {job_type}"
+            logger.error(f"Failed to execute job {job_id}: {error_message}")
+            return {"status": "error", "message": error_message}, error_message
+        
+        timeout = job_config.get("timeout_seconds") or settings.job_default_timeout_seconds
+        func = lambda: handler.execute(job_config)
+        status, value = JobExecutor._run_guarded(
+            f"job {job_id}",
+            [execution_id],
+            profiler.wrap(func) if profiler else func,
+            timeout
+        )
+        
+        # The walked-away handler thread may never reach its own cleanup
+        if profiler and status in ("timed_out", "cancelled"):
+            profiler.abandon()
+        
+        if status != "ok":
+            return JobExecutor._failure_result(status, value, timeout)
+        
+        logger.info(f"Successfully executed job {job_id}")
+        return value, None
+    
+    @staticmethod
+    def _failure_result(status: str, error: Optional[Exception], timeout: Optional[float]) -> Tuple[Dict[str, Any], str]:
+        """Translate a non-ok guarded run into a result dict and error message"""
+        if status == "timed_out":
+            error_message = f"Execution exceeded timeout of {timeout}s"
+        elif status == "cancelled":
+            error_message = "Execution cancelled"
+        else:
+            status, error_message = "error", str(error)
+        return {"status": status, "message": error_message}, error_message
+    
+    @staticmethod
+    def _run_guarded(
+        label: str,
+        execution_ids: List[int],
+        func: Callable[[], Any],
+        timeout: Optional[float],
+        member_tokens: Optional[List[CancellationToken]] = None
+    ) -> Tuple[str, Any]:
+        """Run func on its own thread, enforcing the timeout and cancel requests
+        
+        A batch passes one member token per execution: cancelling an execution only
+        cancels its member token, and the whole run stops once every member is cancelled.
+        Returns ("ok", value), ("error", exception), ("timed_out", None) or ("cancelled", None).
+        """
+        token = CancellationToken()
+        tokens = dict(zip(execution_ids, member_tokens or [token]))
+        outcome: Dict[str, Any] = {}
+        
+        def target():
+            set_current_token(token, member_tokens)
             try:
-                # Get job handler
-                handler = JobHandlerFactory.get_handler(job.job_type)
-                if not handler:
-                    raise ValueError(f"No handler found for job type: {job.job_type}")
-                
-                # Execute the job
-                result = handler.execute(job.job_config or {})
-                
-                # Update job stats
-                job.success_runs += 1
-                job.last_run = datetime.now(timezone.utc)
-                
-                logger.info(f"Successfully executed job {job_id}")
-                
+                outcome["result"] = func()
             except Exception as e:
-                result = {"status": "error", "message": str(e)}
-                error_message = str(e)
-                job.failed_runs += 1
-                logger.error(f"Failed to execute job {job_id}: {e}")
-            
-            finally:
-                # Calculate execution time
-                execution_time = int((time.time() - start_time) * 1000)
+                outcome["error"] = e
+        
+        # A daemon thread lets the worker walk away from a hung handler
+        thread = threading.Thread(target=target, name=f"job-execution-{execution_ids[0]}", daemon=True)
+        _running_executions.update(tokens)
+        thread.start()
+        
+        started = time.monotonic()
+        deadline = started + timeout if timeout else None
+        next_poll = started + settings.cancel_poll_seconds
+        try:
+            while True:
+                # Short slices so local cancel requests are noticed promptly
+                wait = WAIT_SLICE_SECONDS
+                if deadline is not None:
+                    wait = min(wait, max(deadline - time.monotonic(), 0))
+                thread.join(wait)
+                if not thread.is_alive():
+                    break
                 
-                # Update execution record
-                execution.completed_at = datetime.now(timezone.utc)
-                execution.status = result["status"]
-                execution.result = result
-                execution.error_message = error_message
-                execution.execution_time_ms = execution_time
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    token.cancel("timeout")
+                    logger.error(f"Execution of {label} timed out after {timeout}s")
+                    return "timed_out", None
                 
-                # Update job stats
-                job.total_runs += 1
-                job.updated_at = datetime.now(timezone.utc)
+                # Cancel requests from other replicas arrive through the execution record
+                if not token.cancelled and now >= next_poll:
+                    next_poll = now + settings.cancel_poll_seconds
+                    pending = [execution_id for execution_id, member in tokens.items() if not member.cancelled]
+                    for execution_id in JobExecutor._cancelling(pending):
+                        tokens[execution_id].cancel("cancelled")
                 
-                # Calculate next run
-                from app.services.scheduler_service import SchedulerService
-                scheduler = SchedulerService()
-                job.next_run = scheduler.calculate_next_run(
-                    job.schedule_type, 
-                    job.schedule_config
-                )
+                if not token.cancelled and all(member.cancelled for member in tokens.values()):
+                    token.cancel("cancelled")
                 
-                db.commit()
-            
-            return result
+                if token.cancelled:
+                    logger.info(f"Execution of {label} cancelled")
+                    return "cancelled", None
+        finally:
+            for execution_id in execution_ids:
+                _running_executions.pop(execution_id, None)
+        
+        error = outcome.get("error")
+        if isinstance(error, JobCancelled):
+            return "cancelled", None
+        if error is not None:
+            logger.error(f"Failed to execute {label}: {error}")
+            return "error", error
+        return "ok", outcome["result"]
+    
+    @staticmethod
+    def _cancelling(execution_ids: List[int]) -> List[int]:
+        """Executions among execution_ids with a pending cancel request"""
+        if not execution_ids:
+            return []
+        with get_db_context() as db:
+            return [row.id for row in db.query(JobExecution.id).filter(
+                JobExecution.id.in_(execution_ids),
+                JobExecution.status == "cancelling"
+            ).all()]
+    
+    @staticmethod
+    def _handle_failure(db: Session, job: Job, execution: JobExecution, error_message: str):
+        """Schedule a delayed retry or dead-letter the job once retries are exhausted"""
+        policy_config = (job.job_config or {}).get("retry_policy")
+        if policy_config is None:
+            return
+        
+        try:
+            policy = RetryPolicy(**policy_config)
+        except Exception as e:
+            logger.warning(f"Ignoring invalid retry policy for job {job.id}: {e}")
+            return
+        
+        if execution.attempt < policy.max_attempts:
+            delay = policy.delay_for(execution.attempt)
+            from app.services.scheduler_service import SchedulerService
+            SchedulerService().submit_once(
+                JobExecutor.retry_job,
+                [job.id, execution.attempt + 1, execution.id],
+                f"job_{job.id}_retry_{execution.id}",
+                run_date=datetime.now(timezone.utc) + timedelta(seconds=delay)
+            )
+            logger.info(f"Retrying job {job.id} (attempt {execution.attempt + 1}/{policy.max_attempts}) in {delay:.1f}s")
+        else:
+            db.add(DeadLetterJob(
+                job_id=job.id,
+                execution_id=execution.id,
+                attempts=execution.attempt,
+                error_message=error_message,
+                status="pending"
+            ))
+            db.commit()
+            logger.error(f"Job {job.id} exhausted {policy.max_attempts} attempts, moved to dead letter queue")
+
+_batcher = JobBatcher(
+    JobExecutor.run_batch,
+    window_seconds=settings.batch_window_ms / 1000,
+    max_size=settings.batch_max_size
+)
@@ -1,11 +1,81 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional, List, Callable
+from contextlib import contextmanager
+from email.message import EmailMessage
 import random
+import smtplib
+import threading
 import time
 import logging
 
+from app.config.settings import settings
+from app.services.resource_pool import ResourcePool, ResourcePools
+
 logger = logging.getLogger(__name__)
 
+class JobCancelled(Exception):
+    """Raised inside a handler when its execution has been cancelled"""
+    pass
+
+class CancellationToken:
+    """Cooperative cancellation signal shared between the executor and a handler thread"""
+    
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+        self.reason: Optional[str] = None
+    
+    def cancel(self, reason: str = "cancelled"):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Cancellation callback failed: {e}")
+    
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run callback on the cancelling thread once cancelled; returns a function that unregisters it"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        callback()
+        return lambda: None
+    
+    def _remove_callback(self, callback: Callable[[], None]):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+    
+    def wait(self, seconds: float) -> bool:
+        """Block for up to the given seconds, returning True if cancelled meanwhile"""
+        return self._event.wait(seconds)
+
+_execution_context = threading.local()
+
+def set_current_token(token: CancellationToken, member_tokens: Optional[List[CancellationToken]] = None):
+    """Bind a cancellation token, and the per-member tokens of a batch, to the current handler thread"""
+    _execution_context.token = token
+    _execution_context.member_tokens = member_tokens
+
+def current_token() -> CancellationToken:
+    """Token of the execution running on this thread, or a token that never fires"""
+    token = getattr(_execution_context, "token", None)
+    if token is None:
+        token = CancellationToken()
+        _execution_context.token = token
+    return token
+
 class JobHandler(ABC):
     """Abstract base class for job handlers"""
     
@@ -13,17 +83,107 @@ class JobHandler(ABC):
     def execute(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the job with given configuration"""
         pass
+    
+    def startup(self):
+        """Acquire long-lived resources (e.g. register connection pools) before jobs run"""
+        pass
+    
+    def shutdown(self):
+        """Release resources acquired in startup"""
+        pass
+    
+    def health(self) -> Dict[str, Any]:
+        """Report the handler's health and resource usage"""
+        return {"status": "healthy"}
+    
+    def execute_batch(self, configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Execute several jobs of this type at once, returning one result per config
+        
+        Optional: handlers that override this get co-firing jobs grouped into a
+        single call instead of one execute() per job.
+        """
+        raise NotImplementedError
+    
+    @property
+    def supports_batch(self) -> bool:
+        return type(self).execute_batch is not JobHandler.execute_batch
+    
+    def is_cancelled(self) -> bool:
+        """Whether the current execution was cancelled or timed out"""
+        return current_token().cancelled
+    
+    def is_member_cancelled(self, index: int) -> bool:
+        """Whether member index of the running batch was cancelled, on its own or with the batch
+        
+        Batch handlers should skip cancelled members and report them with status "cancelled".
+        """
+        member_tokens = getattr(_execution_context, "member_tokens", None)
+        return current_token().cancelled or bool(member_tokens and member_tokens[index].cancelled)
+    
+    @contextmanager
+    def borrow(self, pool: ResourcePool):
+        """Borrow from a pool for the current execution
+        
+        If the execution times out or is cancelled while the resource is out, its pool
+        slot is released right away instead of waiting for the abandoned thread.
+        """
+        with pool.borrow() as resource:
+            unregister = current_token().on_cancel(lambda: pool.abandon(resource))
+            try:
+                yield resource
+            finally:
+                unregister()
+    
+    def check_cancelled(self):
+        """Raise JobCancelled if the current execution should stop"""
+        token = current_token()
+        if token.cancelled:
+            raise JobCancelled(token.reason)
+    
+    def sleep(self, seconds: float):
+        """Sleep that wakes up and raises JobCancelled as soon as the execution is cancelled"""
+        token = current_token()
+        if token.wait(seconds):
+            raise JobCancelled(token.reason)
 
 class EmailNotificationHandler(JobHandler):
-    """Handler for email notification jobs"""
+    """Handler for email notification jobs
+    
+    Sends through a pooled SMTP connection when SMTP_HOST is configured,
+    otherwise simulates sending.
+    """
+    
+    pool_name = "smtp"
+    
+    def startup(self):
+        """Register the SMTP connection pool"""
+        if settings.smtp_host:
+            ResourcePools.register(self.pool_name, self._connect, close=self._disconnect, validate=self._is_alive)
+    
+    def shutdown(self):
+        """Close pooled SMTP connections"""
+        pool = ResourcePools.get(self.pool_name)
+        if pool:
+            pool.close()
+    
+    def health(self) -> Dict[str, Any]:
+        pool = ResourcePools.get(self.pool_name)
+        if not pool:
+            return {"status": "healthy", "mode": "simulated"}
+        return {"status": "healthy", "mode": "smtp", "pool": pool.stats()}
     
     def execute(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Simulate sending email notifications"""
+        """Send email notifications"""
         recipients = config.get("recipients", ["user@example.com"])
         subject = config.get("subject", "Scheduled Notification")
         
-        # Simulate email sending
-        time.sleep(random.uniform(0.1, 0.5))
+        pool = ResourcePools.get(self.pool_name)
+        if pool:
+            with self.borrow(pool) as smtp:
+                self._send(smtp, config, recipients, subject)
+        else:
+            # Simulate email sending
+            self.sleep(random.uniform(0.1, 0.5))
         
         logger.info(f"Sent email to {len(recipients)} recipients: {subject}")
         
@@ -33,6 +193,66 @@ class EmailNotificationHandler(JobHandler):
             "subject": subject,
             "sent_at": time.time()
         }
+    
+    def execute_batch(self, configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send several notifications over one connection"""
+        pool = ResourcePools.get(self.pool_name)
+        if pool is None:
+            # Simulate a single connection setup shared by the whole batch
+            self.sleep(random.uniform(0.1, 0.5))
+        
+        results = []
+        for index, config in enumerate(configs):
+            if self.is_member_cancelled(index):
+                results.append({"status": "cancelled", "message": "Execution cancelled"})
+                continue
+            recipients = config.get("recipients", ["user@example.com"])
+            subject = config.get("subject", "Scheduled Notification")
+            if pool:
+                try:
+                    with self.borrow(pool) as smtp:
+                        self._send(smtp, config, recipients, subject)
+                except smtplib.SMTPException as e:
+                    results.append({"status": "error", "message": str(e)})
+                    continue
+            results.append({
+                "status": "success",
+                "recipients_count": len(recipients),
+                "subject": subject,
+                "sent_at": time.time()
+            })
+        
+        sent = sum(1 for result in results if result["status"] == "success")
+        logger.info(f"Sent {sent} of {len(configs)} batched email notifications")
+        return results
+    
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=settings.smtp_timeout_seconds)
+        if settings.smtp_username:
+            smtp.starttls()
+            smtp.login(settings.smtp_username, settings.smtp_password)
+        return smtp
+    
+    def _disconnect(self, smtp: smtplib.SMTP):
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+    
+    def _is_alive(self, smtp: smtplib.SMTP) -> bool:
+        """Whether a pooled connection still answers; servers drop idle ones after a few minutes"""
+        try:
+            return smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+    
+    def _send(self, smtp: smtplib.SMTP, config: Dict[str, Any], recipients: List[str], subject: str):
+        message = EmailMessage()
+        message["From"] = config.get("sender", settings.smtp_sender)
+        message["To"] = ", ".join(recipients)
+        message["Subject"] = subject
+        message.set_content(config.get("body", ""))
+        smtp.send_message(message)
 
 class DataProcessingHandler(JobHandler):
     """Handler for data processing jobs"""
@@ -43,7 +263,7 @@ class DataProcessingHandler(JobHandler):
         operation = config.get("operation", "aggregate")
         
         # Simulate processing time
-        time.sleep(random.uniform(0.2, 1.0))
+        self.sleep(random.uniform(0.2, 1.0))
         
         processed_records = random.randint(100, 10000)
         
@@ -75,3 +295,31 @@ class JobHandlerFactory:
     def register_handler(cls, job_type: str, handler: JobHandler):
         """Register a new job handler"""
         cls._handlers[job_type] = handler
+    
+    @classmethod
+    def startup_all(cls):
+        """Run every handler's startup hook"""
+        for job_type, handler in cls._handlers.items():
+            handler.startup()
+            logger.info(f"Started handler for {job_type}")
+    
+    @classmethod
+    def shutdown_all(cls):
+        """Run every handler's shutdown hook, continuing past failures"""
+        for job_type, handler in cls._handlers.items():
+            try:
+                handler.shutdown()
+            except Exception as e:
+                logger.error(f"Failed to shut down handler for {job_type}: {e}")
+        ResourcePools.close_all()
+    
+    @classmethod
+    def health(cls) -> Dict[str, Dict[str, Any]]:
+        """Collect the health of every handler"""
+        report = {}
+        for job_type, handler in cls._handlers.items():
+            try:
+                report[job_type] = handler.health()
+            except Exception as e:
+                report[job_type] = {"status": "unhealthy", "error": str(e)}
+        return report
@@ -1,15 +1,24 @@
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc
+from sqlalchemy import and_, or_, desc, asc, func
 from datetime import datetime, timezone, timedelta
 from app.models.job import Job
 from app.models.job_execution import JobExecution
-from app.schemas.job_schemas import JobCreate, JobUpdate, JobResponse
+from app.models.job_change import JobChange
+from app.schemas.job_schemas import (
+    JobCreate, JobUpdate, JobResponse, JobExecutionResponse, JobChangeResponse, JobChangeFeedResponse,
+    ExecutionProfileResponse
+)
 from app.services.scheduler_service import SchedulerService
+from app.services.result_store import ResultStore
+from app.config.settings import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Columns a job list can be projected to, in response order
+LIST_FIELDS = list(JobResponse.model_fields)
+
 class JobService:
     """Service layer for job management operations"""
     
@@ -40,6 +49,8 @@ class JobService:
             )
             
             self.db.add(db_job)
+            self.db.flush()
+            self.db.add(JobChange(job_id=db_job.id, change_type="created"))
             self.db.commit()
             self.db.refresh(db_job)
             
@@ -72,9 +83,116 @@ class JobService:
     ) -> Tuple[List[JobResponse], int]:
         """Retrieve jobs with filtering and pagination"""
         
-        query = self.db.query(Job)
+        query = self._filter_jobs(self.db.query(Job), is_active, job_type, search)
+        
+        # Get total count
+        total = query.count()
+        
+        # Apply pagination and ordering
+        jobs = query.order_by(desc(Job.created_at)).offset(skip).limit(limit).all()
+        
+        return [JobResponse.from_orm(job) for job in jobs], total
+    
+    def get_job_rows(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: Optional[bool] = None,
+        job_type: Optional[str] = None,
+        search: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Retrieve jobs as plain dicts of the selected columns, without building entities or models"""
+        fields = fields or LIST_FIELDS
+        unknown = [field for field in fields if field not in LIST_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        
+        # Column projection: only the selected columns are read and no ORM identity is tracked
+        query = self._filter_jobs(
+            self.db.query(*(getattr(Job, field) for field in fields)),
+            is_active,
+            job_type,
+            search
+        )
+        total = query.order_by(None).count()
+        rows = query.order_by(desc(Job.created_at)).offset(skip).limit(limit).all()
+        
+        return [dict(zip(fields, row)) for row in rows], total
+    
+    def get_job_version(self, job_id: int) -> int:
+        """Latest change sequence of a job; unlike updated_at it differs between edits in the same second"""
+        return self.db.query(func.max(JobChange.id)).filter(JobChange.job_id == job_id).scalar() or 0
+    
+    def get_list_version(
+        self,
+        is_active: Optional[bool] = None,
+        job_type: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> str:
+        """Cheap version of a filtered job list, changing whenever any job in it could have
+        
+        The change sequence covers creates, edits and deletes; updated_at and total_runs
+        cover run bookkeeping, which is not recorded as a change.
+        """
+        count, last_updated, runs = self._filter_jobs(
+            self.db.query(func.count(Job.id), func.max(Job.updated_at), func.sum(Job.total_runs)),
+            is_active,
+            job_type,
+            search
+        ).one()
+        table_version = self.db.query(func.max(JobChange.id)).scalar() or 0
+        return f"{table_version}:{count}:{last_updated}:{runs or 0}"
+    
+    def get_changes(self, since: int = 0, limit: int = 500) -> JobChangeFeedResponse:
+        """Jobs created, updated or deleted after the since token, oldest first
+        
+        IDs are handed out at insert, not at commit, so a change can become visible
+        after one with a higher ID. The page therefore stops before the first change
+        younger than change_feed_safety_seconds, keeping the token behind any change
+        that may still be committing.
+        """
+        changes = self.db.query(JobChange).filter(
+            JobChange.id > since
+        ).order_by(JobChange.id).limit(limit).all()
+        has_more = len(changes) == limit
+        
+        if settings.change_feed_safety_seconds > 0:
+            # The database clock stamped changed_at, so it also sets the cutoff
+            cutoff = self.db.query(func.now()).scalar() - timedelta(seconds=settings.change_feed_safety_seconds)
+            settled = next((index for index, change in enumerate(changes) if change.changed_at > cutoff), None)
+            if settled is not None:
+                changes = changes[:settled]
+        
+        # Only the latest change per job in this page matters to a syncing client
+        latest: Dict[int, JobChange] = {}
+        for change in changes:
+            latest.pop(change.job_id, None)
+            latest[change.job_id] = change
+        
+        live_ids = [job_id for job_id, change in latest.items() if change.change_type != "deleted"]
+        jobs = {job.id: job for job in self.db.query(Job).filter(Job.id.in_(live_ids)).all()} if live_ids else {}
         
-        # Apply filters
+        entries = []
+        for job_id, change in latest.items():
+            job = jobs.get(job_id)
+            # A job deleted after this page was read is reported as deleted right away
+            entries.append(JobChangeResponse(
+                job_id=job_id,
+                change_type=change.change_type if job is not None else "deleted",
+                changed_at=change.changed_at,
+                job=JobResponse.from_orm(job) if job is not None else None
+            ))
+        
+        return JobChangeFeedResponse(
+            changes=entries,
+            next_token=str(changes[-1].id if changes else since),
+            has_more=has_more and len(changes) == limit
+        )
+    
+    @staticmethod
+    def _filter_jobs(query, is_active: Optional[bool], job_type: Optional[str], search: Optional[str]):
+        """Apply the list filters shared by the entity and row queries"""
         if is_active is not None:
             query = query.filter(Job.is_active == is_active)
         
@@ -89,13 +207,7 @@ class JobService:
                 )
             )
         
-        # Get total count
-        total = query.count()
-        
-        # Apply pagination and ordering
-        jobs = query.order_by(desc(Job.created_at)).offset(skip).limit(limit).all()
-        
-        return [JobResponse.from_orm(job) for job in jobs], total
+        return query
     
     def update_job(self, job_id: int, job_data: JobUpdate) -> Optional[JobResponse]:
         """Update an existing job"""
@@ -104,6 +216,13 @@ class JobService:
             if not db_job:
                 return None
             
+            # Remember the current schedule so unchanged triggers are left alone
+            previous_fingerprint = self.scheduler_service.schedule_fingerprint(
+                db_job.schedule_type,
+                db_job.schedule_config
+            )
+            was_active = db_job.is_active
+            
             # Update fields
             update_data = job_data.dict(exclude_unset=True)
             for field, value in update_data.items():
@@ -118,12 +237,13 @@ class JobService:
                 db_job.next_run = next_run
             
             db_job.updated_at = datetime.now(timezone.utc)
+            self.db.add(JobChange(job_id=job_id, change_type="updated"))
             
             self.db.commit()
             self.db.refresh(db_job)
             
-            # Reschedule job
-            self.scheduler_service.reschedule_job(db_job)
+            # Only touch the job store when the trigger or active state changed
+            self.scheduler_service.sync_job(db_job, previous_fingerprint, was_active)
             
             logger.info(f"Updated job {job_id}")
             return JobResponse.from_orm(db_job)
@@ -143,8 +263,9 @@ class JobService:
             # Remove from scheduler
             self.scheduler_service.unschedule_job(job_id)
             
-            # Delete job
+            # Delete job, leaving a tombstone for the change feed
             self.db.delete(db_job)
+            self.db.add(JobChange(job_id=job_id, change_type="deleted"))
             self.db.commit()
             
             logger.info(f"Deleted job {job_id}")
@@ -155,6 +276,63 @@ class JobService:
             logger.error(f"Failed to delete job {job_id}: {e}")
             raise
     
+    def get_execution_profile(self, job_id: int, execution_id: int) -> Optional[ExecutionProfileResponse]:
+        """Get the recorded profile of a sampled execution"""
+        execution = self.db.query(JobExecution.id, JobExecution.profile).filter(
+            JobExecution.id == execution_id,
+            JobExecution.job_id == job_id
+        ).first()
+        if not execution or execution.profile is None:
+            return None
+        return ExecutionProfileResponse(execution_id=execution.id, job_id=job_id, profile=execution.profile)
+    
+    def get_execution_output(self, job_id: int, execution_id: int, field: str) -> Optional[Tuple[Any, bool]]:
+        """Inline result or error message of an execution and whether the full value was spilled"""
+        column = JobExecution.result if field == "result" else JobExecution.error_message
+        execution = self.db.query(column.label("value")).filter(
+            JobExecution.id == execution_id,
+            JobExecution.job_id == job_id
+        ).first()
+        if not execution or execution.value is None:
+            return None
+        if field == "result":
+            return execution.value, ResultStore.is_spilled(execution.value)
+        return execution.value, ResultStore.has_spill(self.db, execution_id, field)
+    
+    def cancel_execution(self, job_id: int, execution_id: int) -> Optional[JobExecutionResponse]:
+        """Request cancellation of a running execution"""
+        try:
+            # Conditional so a final status recorded meanwhile by the executor is never overwritten
+            requested = self.db.query(JobExecution).filter(
+                JobExecution.id == execution_id,
+                JobExecution.job_id == job_id,
+                JobExecution.status.in_(("running", "cancelling"))
+            ).update({"status": "cancelling"}, synchronize_session=False)
+            self.db.commit()
+            
+            execution = self.db.query(JobExecution).filter(
+                JobExecution.id == execution_id,
+                JobExecution.job_id == job_id
+            ).first()
+            if not execution:
+                return None
+            
+            if not requested:
+                raise ValueError(f"Execution {execution_id} is not running (status: {execution.status})")
+            
+            # The executing replica picks this up on its next poll if it isn't this process
+            
+            from app.services.job_executor import JobExecutor
+            JobExecutor.request_cancel(execution_id)
+            
+            logger.info(f"Requested cancellation of execution {execution_id} of job {job_id}")
+            return JobExecutionResponse.from_orm(execution)
+            
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to cancel execution {execution_id}: {e}")
+            raise
+    
     def get_jobs_for_execution(self) -> List[Job]:
         """Get jobs that are due for execution"""
         now = datetime.now(timezone.utc)
@@ -0,0 +1,118 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+from sqlalchemy import text
+from app.database.connection import engine, pool_saturation
+from app.services.metrics import Metrics
+from app.config.settings import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+class LoadMonitor:
+    """Backpressure signals shared by probes, admission control and load shedding
+    
+    Measurements are cached for health_cache_seconds so frequent probes and
+    requests don't each take a DB connection. "level" is this process's own health,
+    used by readiness and shedding; "admission_level" also counts the scheduler
+    pods' load on API pods and decides whether writes are accepted.
+    """
+    
+    _lock = threading.Lock()
+    _state: Optional[Dict[str, Any]] = None
+    _measured_at = 0.0
+    
+    @classmethod
+    def state(cls) -> Dict[str, Any]:
+        """Current load level ("ok", "overloaded" or "unavailable") and the signals behind it"""
+        with cls._lock:
+            if cls._state is None or time.monotonic() - cls._measured_at >= settings.health_cache_seconds:
+                cls._state = cls._measure()
+                cls._measured_at = time.monotonic()
+            return cls._state
+    
+    @classmethod
+    def overloaded(cls) -> bool:
+        return cls.state()["level"] != "ok"
+    
+    @classmethod
+    def invalidate(cls):
+        with cls._lock:
+            cls._state = None
+    
+    @staticmethod
+    def _measure() -> Dict[str, Any]:
+        from app.services.scheduler_service import SchedulerService
+        executor = SchedulerService().executor_stats()
+        backlog = executor.get("pending", 0)
+        lag = executor.get("lag_seconds", 0.0)
+        # API pods see the backlog summed over every scheduler pod, so the per-pod threshold scales with them
+        backlog_threshold = settings.overload_backlog_threshold * max(1, executor.get("pods", 1))
+        
+        database, error = "connected", None
+        checkout_ms = None
+        try:
+            start = time.perf_counter()
+            with engine.connect() as connection:
+                checkout_ms = (time.perf_counter() - start) * 1000
+                connection.execute(text("SELECT 1"))
+        except Exception as e:
+            database, error = "disconnected", str(e)
+        
+        executor_reasons = []
+        if backlog > backlog_threshold:
+            executor_reasons.append(f"executor backlog {backlog}")
+        if lag > settings.overload_lag_threshold_seconds:
+            executor_reasons.append(f"scheduling lag {lag:.2f}s")
+        
+        local_reasons = []
+        if checkout_ms is not None and checkout_ms > settings.overload_db_checkout_ms_threshold:
+            local_reasons.append(f"db checkout {checkout_ms:.0f}ms")
+        if database != "connected":
+            local_reasons.append("database unreachable")
+        
+        # An API pod's own health is its database; the scheduler pods' load only limits writes
+        if settings.service_role == "api":
+            reasons = local_reasons
+        else:
+            reasons = executor_reasons + local_reasons
+        admission_reasons = executor_reasons + local_reasons
+        
+        level = LoadMonitor._level(database, reasons)
+        admission_level = LoadMonitor._level(database, admission_reasons)
+        
+        Metrics.set_gauge("load_overloaded", 0 if admission_level == "ok" else 1)
+        if checkout_ms is not None:
+            Metrics.set_gauge("db_checkout_seconds", checkout_ms / 1000)
+        if admission_level != "ok":
+            logger.warning(f"Service {admission_level}: {', '.join(admission_reasons)}")
+        
+        return {
+            "level": level,
+            "reasons": reasons,
+            "admission_level": admission_level,
+            "admission_reasons": admission_reasons,
+            "measured_at": datetime.now(timezone.utc),
+            "database": database,
+            "database_error": error,
+            "executor_backlog": backlog,
+            "executor_backlog_threshold": backlog_threshold,
+            "scheduling_lag_seconds": lag,
+            "db_checkout_ms": round(checkout_ms, 1) if checkout_ms is not None else None,
+            "db_pool_saturation": round(pool_saturation(), 3)
+        }
+    
+    @staticmethod
+    def _level(database: str, reasons: List[str]) -> str:
+        if database != "connected":
+            return "unavailable"
+        return "overloaded" if reasons else "ok"
+    
+    @classmethod
+    def should_shed(cls, job_config: Dict[str, Any]) -> bool:
+        """Whether a fire of this priority is shed while the service is overloaded"""
+        priority = (job_config or {}).get("priority", "normal")
+        if priority not in settings.load_shed_priorities:
+            return False
+        return cls.overloaded()
@@ -0,0 +1,84 @@
+import threading
+from typing import Dict, Tuple, Any
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+class Metrics:
+    """In-process metrics registry rendered in Prometheus text format"""
+    
+    _lock = threading.Lock()
+    _counters: Dict[str, Dict[LabelKey, float]] = {}
+    _gauges: Dict[str, Dict[LabelKey, float]] = {}
+    _summaries: Dict[str, Dict[LabelKey, Tuple[float, int]]] = {}
+    
+    @classmethod
+    def inc(cls, name: str, value: float = 1, **labels):
+        """Increment a counter"""
+        key = cls._key(labels)
+        with cls._lock:
+            series = cls._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+    
+    @classmethod
+    def set_gauge(cls, name: str, value: float, **labels):
+        """Set a gauge to the given value"""
+        with cls._lock:
+            cls._gauges.setdefault(name, {})[cls._key(labels)] = value
+    
+    @classmethod
+    def observe(cls, name: str, value: float, **labels):
+        """Record an observation in a summary (sum and count)"""
+        key = cls._key(labels)
+        with cls._lock:
+            series = cls._summaries.setdefault(name, {})
+            total, count = series.get(key, (0.0, 0))
+            series[key] = (total + value, count + 1)
+    
+    @classmethod
+    def snapshot(cls) -> Dict[str, Any]:
+        """Current values as plain dicts, keyed by metric name then label string"""
+        with cls._lock:
+            return {
+                "counters": {name: {cls._format(k): v for k, v in s.items()} for name, s in cls._counters.items()},
+                "gauges": {name: {cls._format(k): v for k, v in s.items()} for name, s in cls._gauges.items()},
+                "summaries": {
+                    name: {cls._format(k): {"sum": t, "count": c} for k, (t, c) in s.items()}
+                    for name, s in cls._summaries.items()
+                }
+            }
+    
+    @classmethod
+    def render_prometheus(cls) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        lines = []
+        with cls._lock:
+            for name, series in sorted(cls._counters.items()):
+                lines.append(f"# TYPE {name} counter")
+                lines.extend(f"{name}{cls._format(k)} {v}" for k, v in series.items())
+            for name, series in sorted(cls._gauges.items()):
+                lines.append(f"# TYPE {name} gauge")
+                lines.extend(f"{name}{cls._format(k)} {v}" for k, v in series.items())
+            for name, series in sorted(cls._summaries.items()):
+                lines.append(f"# TYPE {name} summary")
+                for k, (total, count) in series.items():
+                    lines.append(f"{name}_sum{cls._format(k)} {total}")
+                    lines.append(f"{name}_count{cls._format(k)} {count}")
+        return "\n".join(lines) + "\n"
+    
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._counters.clear()
+            cls._gauges.clear()
+            cls._summaries.clear()
+    
+    @staticmethod
+    def _key(labels: Dict[str, Any]) -> LabelKey:
+        return tuple(sorted((k, str(v)) for k, v in labels.items()))
+    
+    @staticmethod
+    def _format(key: LabelKey) -> str:
+        if not key:
+            return ""
+        escaped = (v.replace("\\", "\\\\").replace('"', '\\"') for _, v in key)
+        return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(key, escaped)) + "}"
@@ -0,0 +1,156 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional, Tuple
+from pydantic import BaseModel, Field
+from app.config.settings import settings
+from app.services.metrics import Metrics
+import logging
+
+logger = logging.getLogger(__name__)
+
+class RateLimitRule(BaseModel):
+    rate_per_second: float = Field(..., gt=0, description="Sustained token refill rate")
+    burst: int = Field(1, ge=1, description="Bucket capacity")
+    key_field: Optional[str] = Field(None, description="job_config field used to split buckets")
+    key_transform: Optional[str] = Field(None, description="Optional transform of the key value: 'domain'")
+    max_wait_seconds: Optional[float] = Field(
+        None, gt=0, description="Longest deferral a fire may reserve; fires that would wait longer are dropped"
+    )
+
+class TokenBucket(ABC):
+    """Token bucket storage backend"""
+    
+    @abstractmethod
+    def reserve(self, key: str, rate: float, burst: int, max_wait: Optional[float] = None) -> float:
+        """Reserve one token, returning 0 if it is usable now or the seconds until it is
+        
+        Tokens may go negative, so each throttled caller is handed its own future slot
+        instead of every caller being told to come back at the same moment. Past
+        max_wait nothing is reserved and the returned wait exceeds max_wait.
+        """
+        pass
+
+class LocalTokenBucket(TokenBucket):
+    """In-memory buckets for single node deployments"""
+    
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+    
+    def reserve(self, key: str, rate: float, burst: int, max_wait: Optional[float] = None) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (float(burst), now))
+            tokens = min(burst, tokens + (now - updated) * rate) - 1
+            wait = max(0.0, -tokens / rate)
+            if max_wait is not None and wait > max_wait:
+                tokens += 1
+            self._buckets[key] = (tokens, now)
+            return wait
+
+class RedisTokenBucket(TokenBucket):
+    """Buckets shared by every replica, updated atomically by a Lua script"""
+    
+    # Uses the Redis server clock so replicas with skewed clocks agree
+    SCRIPT = """
+    local now_parts = redis.call('TIME')
+    local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+    local rate = tonumber(ARGV[1])
+    local burst = tonumber(ARGV[2])
+    local max_wait = tonumber(ARGV[3])
+    local data = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    local tokens = tonumber(data[1])
+    local ts = tonumber(data[2])
+    if tokens == nil then
+        tokens = burst
+        ts = now
+    end
+    tokens = math.min(burst, tokens + math.max(0, now - ts) * rate) - 1
+    local wait = math.max(0, -tokens / rate)
+    if max_wait >= 0 and wait > max_wait then
+        tokens = tokens + 1
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    redis.call('PEXPIRE', KEYS[1], math.ceil((burst / rate + wait) * 1000) + 1000)
+    return tostring(wait)
+    """
+    
+    def __init__(self, redis_url: str):
+        import redis
+        self.client = redis.Redis.from_url(redis_url)
+        self.script = self.client.register_script(self.SCRIPT)
+    
+    def reserve(self, key: str, rate: float, burst: int, max_wait: Optional[float] = None) -> float:
+        args = [rate, burst, -1 if max_wait is None else max_wait]
+        return float(self.script(keys=[f"ratelimit:{key}"], args=args))
+
+class RateLimiter:
+    """Declarative per job type (and optional per job_config key) rate limits"""
+    
+    def __init__(self, rules: Dict[str, Dict[str, Any]], bucket: TokenBucket):
+        self.rules = {job_type: RateLimitRule(**rule) for job_type, rule in rules.items()}
+        self.bucket = bucket
+    
+    @classmethod
+    def from_settings(cls) -> "RateLimiter":
+        if settings.rate_limit_backend == "redis":
+            bucket: TokenBucket = RedisTokenBucket(settings.redis_url)
+        else:
+            bucket = LocalTokenBucket()
+        return cls(settings.rate_limits, bucket)
+    
+    def acquire(self, job_type: str, job_config: Dict[str, Any], droppable: bool = True) -> Optional[float]:
+        """Reserve a token for this fire, returning 0 or the seconds it must be deferred by
+        
+        A deferred fire already holds its token and must not call acquire again. Returns
+        None when a droppable fire would wait longer than the rule's max_wait_seconds: it
+        reserved nothing and should be dropped, leaving the job's next fire to do the work.
+        Fires with no next fire to fall back on (retries, replays, workflow nodes) pass
+        droppable=False and always get a slot, however far out.
+        """
+        rule = self.rules.get(job_type)
+        if rule is None:
+            return 0.0
+        
+        key = self._bucket_key(job_type, rule, job_config)
+        max_wait = rule.max_wait_seconds if droppable else None
+        try:
+            wait = self.bucket.reserve(key, rule.rate_per_second, rule.burst, max_wait)
+        except Exception as e:
+            # Fail open: a limiter outage must not stop job execution
+            logger.warning(f"Rate limiter unavailable for {key}, allowing fire: {e}")
+            return 0.0
+        
+        if max_wait is not None and wait > max_wait:
+            Metrics.inc("rate_limiter_dropped_total", job_type=job_type)
+            return None
+        
+        Metrics.observe("rate_limiter_wait_seconds", wait, job_type=job_type)
+        if wait > 0:
+            Metrics.inc("rate_limiter_throttled_total", job_type=job_type)
+        return wait
+    
+    @staticmethod
+    def _bucket_key(job_type: str, rule: RateLimitRule, job_config: Dict[str, Any]) -> str:
+        if not rule.key_field:
+            return job_type
+        
+        value = job_config.get(rule.key_field)
+        if isinstance(value, (list, tuple)):
+            # Multi-valued fields (e.g. recipients) are limited by their first entry
+            value = value[0] if value else None
+        if value is not None and rule.key_transform == "domain":
+            value = str(value).rsplit("@", 1)[-1].lower()
+        return f"{job_type}:{value}"
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide rate limiter built from settings on first use"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter.from_settings()
+    return _rate_limiter
@@ -0,0 +1,194 @@
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional, Set
+from app.config.settings import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ResourcePool:
+    """Bounded pool of reusable outbound resources (connections, clients)
+    
+    Idle resources are checked with validate (if given) when borrowed; a stale one is
+    closed and replaced by a single fresh resource before it reaches the borrower.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        max_size: Optional[int] = None,
+        close: Optional[Callable[[Any], None]] = None,
+        acquire_timeout: float = 30.0,
+        validate: Optional[Callable[[Any], bool]] = None
+    ):
+        self.name = name
+        self.factory = factory
+        # Sized to the executor so every worker can hold one resource at a time
+        self.max_size = max_size or settings.max_workers
+        self._close = close
+        self._validate = validate
+        self.acquire_timeout = acquire_timeout
+        self._idle: deque = deque()
+        self._size = 0
+        # Identities of borrowed resources, and of those whose borrower was abandoned
+        self._borrowed: Set[int] = set()
+        self._abandoned: Set[int] = set()
+        self._closed = False
+        self._cond = threading.Condition()
+    
+    @contextmanager
+    def borrow(self):
+        """Borrow a resource, discarding it instead of returning it if the block raises"""
+        resource = self._acquire()
+        try:
+            yield resource
+        except Exception:
+            self._discard(resource)
+            raise
+        else:
+            self._release(resource)
+    
+    def abandon(self, resource: Any):
+        """Give up the slot of a resource whose borrower was abandoned (e.g. a timed out job)
+        
+        The slot is free for other borrowers at once; the resource itself is closed
+        whenever the abandoned borrower hands it back.
+        """
+        with self._cond:
+            if id(resource) not in self._borrowed:
+                return
+            self._borrowed.discard(id(resource))
+            self._abandoned.add(id(resource))
+            self._size -= 1
+            self._cond.notify()
+        logger.warning(f"Borrower of a resource from pool {self.name} was abandoned, freeing its slot")
+    
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "max_size": self.max_size
+            }
+    
+    def close(self):
+        """Close idle resources and refuse new borrows; borrowed ones close on return"""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for resource in idle:
+            self._close_quietly(resource)
+    
+    def _acquire(self) -> Any:
+        resource = None
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError(f"Resource pool {self.name} is closed")
+                if self._idle:
+                    resource = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                if not self._cond.wait(self.acquire_timeout):
+                    raise TimeoutError(f"Timed out waiting for a resource from pool {self.name}")
+        
+        # Validate and create outside the lock so a slow server doesn't block other borrowers
+        if resource is not None:
+            if self._is_valid(resource):
+                return self._lend(resource)
+            logger.info(f"Replacing stale resource from pool {self.name}")
+            self._close_quietly(resource)
+        
+        try:
+            return self._lend(self.factory())
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+    
+    def _lend(self, resource: Any) -> Any:
+        with self._cond:
+            self._borrowed.add(id(resource))
+        return resource
+    
+    def _is_valid(self, resource: Any) -> bool:
+        if self._validate is None:
+            return True
+        try:
+            return bool(self._validate(resource))
+        except Exception:
+            return False
+    
+    def _release(self, resource: Any):
+        with self._cond:
+            if self._holds_slot(resource):
+                if not self._closed:
+                    self._idle.append(resource)
+                    self._cond.notify()
+                    return
+                self._size -= 1
+        self._close_quietly(resource)
+    
+    def _discard(self, resource: Any):
+        with self._cond:
+            if self._holds_slot(resource):
+                self._size -= 1
+                self._cond.notify()
+        self._close_quietly(resource)
+    
+    def _holds_slot(self, resource: Any) -> bool:
+        """Mark a borrowed resource as handed back; False if abandon() already gave up its slot"""
+        self._borrowed.discard(id(resource))
+        if id(resource) in self._abandoned:
+            self._abandoned.discard(id(resource))
+            return False
+        return True
+    
+    def _close_quietly(self, resource: Any):
+        if self._close is None:
+            return
+        try:
+            self._close(resource)
+        except Exception as e:
+            logger.warning(f"Failed to close resource from pool {self.name}: {e}")
+
+class ResourcePools:
+    """Registry of named resource pools shared by job handlers"""
+    
+    _pools: Dict[str, ResourcePool] = {}
+    
+    @classmethod
+    def register(cls, name: str, factory: Callable[[], Any], **kwargs) -> ResourcePool:
+        """Create and register a pool, replacing any previous pool of that name"""
+        previous = cls._pools.get(name)
+        if previous is not None:
+            previous.close()
+        pool = ResourcePool(name, factory, **kwargs)
+        cls._pools[name] = pool
+        logger.info(f"Registered resource pool {name} (max_size={pool.max_size})")
+        return pool
+    
+    @classmethod
+    def get(cls, name: str) -> Optional[ResourcePool]:
+        """Get a registered pool"""
+        return cls._pools.get(name)
+    
+    @classmethod
+    def close_all(cls):
+        """Close every registered pool"""
+        for pool in cls._pools.values():
+            pool.close()
+        cls._pools.clear()
+    
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, int]]:
+        return {name: pool.stats() for name, pool in cls._pools.items()}
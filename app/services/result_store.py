@@ -0,0 +1,125 @@
+import zlib
+from typing import Dict, Any, Optional, Iterator
+import orjson
+from sqlalchemy.orm import Session
+from app.models.execution_blob import ExecutionBlob
+from app.database.connection import get_db_context
+from app.services.metrics import Metrics
+from app.config.settings import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Key of the placeholder left in job_executions.result when the result is spilled
+SPILL_KEY = "_spilled"
+
+# Upper bound on the bytes decompressed per step while streaming a spilled value
+STREAM_BYTES = 65536
+
+class StoredOutcome:
+    """An execution outcome in its stored form: inline values plus compressed spills"""
+    
+    def __init__(self, status: str, result: Any, error_message: Optional[str], spills: Dict[str, bytes]):
+        self.status = status
+        self.result = result
+        self.error_message = error_message
+        self.spills = spills
+
+class ResultStore:
+    """Size-capped storage of execution results and error messages
+    
+    Values up to result_inline_max_bytes stay inline in job_executions. Larger ones are
+    zlib-compressed and written to execution_blobs in chunks, leaving a placeholder
+    inline, and are streamed back chunk by chunk on read.
+    """
+    
+    @staticmethod
+    def encode(result: Dict[str, Any], error_message: Optional[str]) -> StoredOutcome:
+        """Decide what stays inline and compress the rest; call before opening a DB session"""
+        limit = settings.result_inline_max_bytes
+        spills: Dict[str, bytes] = {}
+        status = result["status"]
+        
+        inline_result = result
+        try:
+            payload = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Not representable as plain JSON; stored inline as before
+            payload = None
+        if payload is not None and len(payload) > limit:
+            spills["result"] = ResultStore._compress(payload)
+            inline_result = {
+                "status": status,
+                SPILL_KEY: {"encoding": "zlib", "size_bytes": len(payload), "stored_bytes": len(spills["result"])}
+            }
+        
+        inline_error = error_message
+        if error_message is not None:
+            encoded = error_message.encode()
+            if len(encoded) > limit:
+                spills["error_message"] = ResultStore._compress(encoded)
+                preview = encoded[:limit].decode(errors="ignore")
+                inline_error = f"{preview}... [truncated, {len(encoded)} bytes in total]"
+        
+        return StoredOutcome(status, inline_result, inline_error, spills)
+    
+    @staticmethod
+    def save(db: Session, execution_id: int, outcome: StoredOutcome):
+        """Add the spilled chunks of an outcome to the session"""
+        size = settings.result_blob_chunk_bytes
+        for field, data in outcome.spills.items():
+            db.add_all([
+                ExecutionBlob(execution_id=execution_id, field=field, chunk_index=index, data=data[offset:offset + size])
+                for index, offset in enumerate(range(0, len(data), size))
+            ])
+            Metrics.inc("execution_spilled_total", field=field)
+            Metrics.inc("execution_spilled_bytes_total", len(data), field=field)
+    
+    @staticmethod
+    def is_spilled(result: Any) -> bool:
+        """Whether a stored result is the placeholder of a spilled one"""
+        return isinstance(result, dict) and SPILL_KEY in result
+    
+    @staticmethod
+    def has_spill(db: Session, execution_id: int, field: str) -> bool:
+        return db.query(ExecutionBlob.id).filter(
+            ExecutionBlob.execution_id == execution_id,
+            ExecutionBlob.field == field,
+            ExecutionBlob.chunk_index == 0
+        ).first() is not None
+    
+    @staticmethod
+    def stream(execution_id: int, field: str) -> Iterator[bytes]:
+        """Decompressed bytes of a spilled value, fetched one chunk at a time
+        
+        Each chunk is read in its own short session, so a slow client never holds a connection.
+        """
+        decompressor = zlib.decompressobj()
+        index = 0
+        while True:
+            with get_db_context() as db:
+                row = db.query(ExecutionBlob.data).filter(
+                    ExecutionBlob.execution_id == execution_id,
+                    ExecutionBlob.field == field,
+                    ExecutionBlob.chunk_index == index
+                ).first()
+            if row is None:
+                break
+            
+            data = row.data
+            while data:
+                out = decompressor.decompress(data, STREAM_BYTES)
+                if out:
+                    yield out
+                data = decompressor.unconsumed_tail
+            index += 1
+        
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+        if not decompressor.eof:
+            logger.error(f"Spilled {field} of execution {execution_id} is incomplete")
+    
+    @staticmethod
+    def _compress(data: bytes) -> bytes:
+        return zlib.compress(data, settings.result_compression_level)
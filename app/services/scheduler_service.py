@@ -1,27 +1,74 @@
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.jobstores.redis import RedisJobStore
-from apscheduler.executors.pool import  ThreadPoolExecutor
-from croniter import croniter
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, TYPE_CHECKING
+import hashlib
+import json
+import threading
+import time
 from app.models.job import Job
 from app. config.settings import settings
 import logging
 
+# APScheduler, Redis and croniter are imported on first use to keep API startup fast
+if TYPE_CHECKING:
+    from apscheduler.schedulers.background import BackgroundScheduler
+
 logger = logging.getLogger(__name__)
 
+# A single APScheduler instance per process, shared by every SchedulerService
+# so that jobs added from API requests and worker threads reach the running scheduler
+_scheduler: Optional["BackgroundScheduler"] = None
+_scheduler_lock = threading.Lock()
+
 class SchedulerService:
     """Service for managing job scheduling using APScheduler"""
     
-    def __init__(self):
-        # Configure job stores
-        jobstores = {
-            'default': RedisJobStore(host='localhost', port=6379, db=1)
-        }
+    @property
+    def scheduler(self) -> "BackgroundScheduler":
+        """The process-wide scheduler, created on first use"""
+        global _scheduler
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = self._create_scheduler()
+                if settings.service_role == "api":
+                    # API pods never run jobs; a paused scheduler only writes to the shared job store
+                    _scheduler.start(paused=True)
+        return _scheduler
+    
+    @staticmethod
+    def _create_scheduler() -> "BackgroundScheduler":
+        """Build the process-wide scheduler"""
+        from apscheduler.schedulers.background import BackgroundScheduler
+        from apscheduler.jobstores.redis import RedisJobStore
+        from apscheduler.jobstores.memory import MemoryJobStore
+        from apscheduler.executors.pool import ThreadPoolExecutor
+        from redis.connection import parse_url
+        from app.services.adaptive_executor import AdaptiveThreadPoolExecutor
+        from app.database.connection import pool_saturation
         
-        # Configure executors
+        # Configure job stores; db 1 unless REDIS_URL names one
+        if settings.job_store == "memory":
+            jobstores = {'default': MemoryJobStore()}
+        else:
+            jobstores = {
+                'default': RedisJobStore(**{'db': 1, **parse_url(settings.redis_url)})
+            }
+        
+        # Configure executors; API pods never run jobs, so they get no worker pool to speak of.
+        # A fixed pool is an adaptive one with equal bounds, so it still reports backlog and lag.
+        if settings.service_role == "api":
+            executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            executor = AdaptiveThreadPoolExecutor(
+                min_workers=settings.min_workers if settings.autoscale_enabled else settings.max_workers,
+                max_workers=settings.max_workers,
+                interval_seconds=settings.autoscale_interval_seconds,
+                lag_threshold_seconds=settings.autoscale_lag_threshold_seconds,
+                db_saturation_threshold=settings.autoscale_db_saturation_threshold,
+                idle_ticks_before_shrink=settings.autoscale_idle_ticks,
+                db_saturation=pool_saturation
+            )
         executors = {
-            'default': ThreadPoolExecutor(max_workers=settings.max_workers)
+            'default': executor
         }
         
         # Job defaults
@@ -30,26 +77,56 @@ class SchedulerService:
             'max_instances': 3
         }
         
-        self.scheduler = BackgroundScheduler(
+        return BackgroundScheduler(
             jobstores=jobstores,
             executors=executors,
             job_defaults=job_defaults
         )
+    
+    def executor_stats(self) -> Dict[str, Any]:
+        """Worker pool size, load and recent scaling decisions"""
+        if settings.service_role == "api":
+            # No executor here; report the load published by the pods that run jobs
+            from app.services.executor_load import ExecutorLoad
+            return {"adaptive": False, "max_workers": 0, **ExecutorLoad.read()}
         
+        from app.services.adaptive_executor import AdaptiveThreadPoolExecutor
+        executor = self.scheduler._executors.get('default')
+        if isinstance(executor, AdaptiveThreadPoolExecutor):
+            return {"adaptive": executor.min_workers < executor.max_workers, **executor.stats()}
+        return {"adaptive": False, "max_workers": settings.max_workers}
+    
     def start(self):
         """Start the scheduler"""
         if not self.scheduler.running:
             self.scheduler.start()
             logger.info("Scheduler started")
+            if settings.scheduler_poll_seconds > 0:
+                threading.Thread(target=self._poll_job_store, name="scheduler-poll", daemon=True).start()
+            if settings.service_role != "api" and settings.job_store == "redis":
+                from app.services.executor_load import ExecutorLoad
+                ExecutorLoad.start(self.executor_stats)
+    
+    def _poll_job_store(self):
+        """Wake the scheduler periodically so jobs added by other pods are picked up"""
+        from apscheduler.schedulers.base import STATE_STOPPED
+        while True:
+            time.sleep(settings.scheduler_poll_seconds)
+            if self.scheduler.state == STATE_STOPPED:
+                return
+            self.scheduler.wakeup()
     
     def shutdown(self):
         """Shutdown the scheduler"""
         if self.scheduler.running:
+            from app.services.executor_load import ExecutorLoad
+            ExecutorLoad.stop()
             self.scheduler.shutdown()
             logger.info("Scheduler shutdown")
     
     def calculate_next_run(self, schedule_type: str, schedule_config: Dict[str, Any]) -> datetime:
         """Calculate the next run time for a job"""
+        from croniter import croniter
         now = datetime.now(timezone.utc)
         
         if schedule_type == "cron":
@@ -81,7 +158,7 @@ class SchedulerService:
                 JobExecutor.execute_job,
                 'cron',
                 id=job_id,
-                args=[job.id],
+                args=[job.id, job.job_type],
                 **self._parse_cron_config(job.schedule_config["cron_expression"]),
                 replace_existing=True
             )
@@ -91,13 +168,71 @@ class SchedulerService:
                 JobExecutor.execute_job,
                 'interval',
                 id=job_id,
-                args=[job.id],
+                args=[job.id, job.job_type],
                 seconds=job.schedule_config["interval_seconds"],
                 replace_existing=True
             )
         
         logger.info(f"Scheduled job {job.id}: {job.name}")
     
+    def schedule_workflow(self, workflow_id: int, schedule_type: str, schedule_config: Dict[str, Any]):
+        """Schedule a workflow so that each fire starts a new run"""
+        from app.services.workflow_executor import WorkflowExecutor
+        
+        if schedule_type == "cron":
+            trigger_args = self._parse_cron_config(schedule_config["cron_expression"])
+        elif schedule_type == "interval":
+            trigger_args = {'seconds': schedule_config["interval_seconds"]}
+        else:
+            raise ValueError(f"Unsupported schedule type: {schedule_type}")
+        
+        self.scheduler.add_job(
+            WorkflowExecutor.start_run,
+            schedule_type,
+            id=f"workflow_{workflow_id}",
+            args=[workflow_id],
+            replace_existing=True,
+            **trigger_args
+        )
+        logger.info(f"Scheduled workflow {workflow_id}")
+    
+    def unschedule_workflow(self, workflow_id: int):
+        """Remove a workflow schedule from the scheduler"""
+        from apscheduler.jobstores.base import JobLookupError
+        try:
+            self.scheduler.remove_job(f"workflow_{workflow_id}")
+            logger.info(f"Unscheduled workflow {workflow_id}")
+        except JobLookupError:
+            logger.warning(f"Workflow {workflow_id} was not in scheduler")
+    
+    def submit_once(
+        self,
+        func,
+        args: list,
+        task_id: str,
+        run_date: Optional[datetime] = None,
+        replace_existing: bool = True
+    ) -> bool:
+        """Run a one-shot task on the worker pool at run_date, or as soon as possible
+        
+        Returns False without scheduling anything if replace_existing is off and a
+        task with this ID is still pending.
+        """
+        from apscheduler.jobstores.base import ConflictingIdError
+        try:
+            self.scheduler.add_job(
+                func,
+                'date',
+                run_date=run_date,
+                id=task_id,
+                args=args,
+                replace_existing=replace_existing,
+                misfire_grace_time=None
+            )
+        except ConflictingIdError:
+            return False
+        return True
+    
     def unschedule_job(self, job_id: int):
         """Remove a job from the scheduler"""
         scheduler_job_id = f"job_{job_id}"
@@ -113,6 +248,45 @@ class SchedulerService:
         if job.is_active:
             self.schedule_job(job)
     
+    def pause_job(self, job_id: int):
+        """Pause a job in place, keeping its trigger in the job store"""
+        from apscheduler.jobstores.base import JobLookupError
+        try:
+            self.scheduler.pause_job(f"job_{job_id}")
+            logger.info(f"Paused job {job_id}")
+        except JobLookupError:
+            logger.warning(f"Job {job_id} was not in scheduler, nothing to pause")
+    
+    def resume_job(self, job: Job):
+        """Resume a paused job, scheduling it if it was never added"""
+        from apscheduler.jobstores.base import JobLookupError
+        try:
+            self.scheduler.resume_job(f"job_{job.id}")
+            logger.info(f"Resumed job {job.id}")
+        except JobLookupError:
+            self.schedule_job(job)
+    
+    def sync_job(self, job: Job, previous_fingerprint: str, was_active: bool):
+        """Apply only the job store changes required after a job update"""
+        fingerprint = self.schedule_fingerprint(job.schedule_type, job.schedule_config)
+        if fingerprint != previous_fingerprint:
+            self.reschedule_job(job)
+        elif job.is_active != was_active:
+            if job.is_active:
+                self.resume_job(job)
+            else:
+                self.pause_job(job.id)
+    
+    @staticmethod
+    def schedule_fingerprint(schedule_type: str, schedule_config: Dict[str, Any]) -> str:
+        """Stable hash of the fields that define a job's trigger"""
+        payload = json.dumps(
+            {"type": schedule_type, "config": schedule_config},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha1(payload.encode()).hexdigest()
+    
     def _parse_cron_config(self, cron_expression: str) -> Dict[str, Any]:
         """Parse cron expression into APScheduler format"""
         parts = cron_expression.split()
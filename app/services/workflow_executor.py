@@ -0,0 +1,179 @@
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
+from app.models.workflow import Workflow, WorkflowRun, WorkflowRunNode
+from app.database.connection import get_db_context
+from app.services.job_executor import JobExecutor
+import logging
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_NODE_STATUSES = ("completed", "failed", "skipped")
+
+class WorkflowExecutor:
+    """Service for running workflow DAGs on the scheduler's worker pool"""
+
+    @staticmethod
+    def start_run(workflow_id: int) -> Optional[int]:
+        """Create a workflow run and dispatch its root nodes"""
+
+        with get_db_context() as db:
+            workflow = db.query(Workflow).filter(Workflow.id == workflow_id).first()
+            if not workflow:
+                logger.error(f"Workflow {workflow_id} not found")
+                return None
+
+            run = WorkflowRun(workflow_id=workflow_id, status="running")
+            db.add(run)
+            db.flush()
+
+            # Snapshot the definition so edits don't affect in-flight runs
+            for node in workflow.nodes:
+                db.add(WorkflowRunNode(
+                    run_id=run.id,
+                    node_key=node["key"],
+                    job_id=node["job_id"],
+                    depends_on=node.get("depends_on", []),
+                    status="pending"
+                ))
+            db.commit()
+            run_id = run.id
+
+        logger.info(f"Started run {run_id} of workflow {workflow_id}")
+        WorkflowExecutor._dispatch_ready_nodes(run_id)
+        return run_id
+
+    @staticmethod
+    def execute_node(run_id: int, node_key: str, reserved: bool = False):
+        """Execute a single workflow node and trigger its downstream nodes"""
+
+        with get_db_context() as db:
+            node = WorkflowExecutor._get_node(db, run_id, node_key)
+            if not node or node.status != "queued":
+                logger.warning(f"Node {node_key} of run {run_id} is not queued, skipping")
+                return
+            node.status = "running"
+            node.started_at = datetime.now(timezone.utc)
+            job_id = node.job_id
+
+        # Workflow steps run regardless of the job's own standalone schedule state
+        try:
+            result, execution_id = JobExecutor.run_job(
+                job_id,
+                workflow_run_id=run_id,
+                require_active=False,
+                on_throttle=None if reserved else lambda delay: WorkflowExecutor._defer_node(run_id, node_key, delay)
+            )
+        except Exception as e:
+            # A node left "running" would keep its run from ever finishing
+            logger.error(f"Node {node_key} of run {run_id} could not be executed: {e}")
+            result, execution_id = {"status": "error", "message": str(e)}, None
+        if result.get("status") == "deferred":
+            return
+        succeeded = result.get("status") == "success"
+
+        with get_db_context() as db:
+            node = WorkflowExecutor._get_node(db, run_id, node_key)
+            node.status = "completed" if succeeded else "failed"
+            node.execution_id = execution_id
+            node.completed_at = datetime.now(timezone.utc)
+
+            if not succeeded:
+                nodes = db.query(WorkflowRunNode).filter(WorkflowRunNode.run_id == run_id).all()
+                descendants = WorkflowExecutor._descendants(nodes, node_key)
+                for other in nodes:
+                    if other.node_key in descendants and other.status == "pending":
+                        other.status = "skipped"
+                logger.error(f"Node {node_key} of run {run_id} failed, skipped {len(descendants)} downstream nodes")
+
+        WorkflowExecutor._dispatch_ready_nodes(run_id)
+
+    @staticmethod
+    def _defer_node(run_id: int, node_key: str, delay: float):
+        """Put a throttled node back in the queue and re-fire it after the delay"""
+        with get_db_context() as db:
+            node = WorkflowExecutor._get_node(db, run_id, node_key)
+            node.status = "queued"
+            node.started_at = None
+
+        JobExecutor.defer(
+            WorkflowExecutor.execute_node,
+            [run_id, node_key, True],
+            f"workflow_run_{run_id}_{node_key}",
+            delay
+        )
+
+    @staticmethod
+    def _dispatch_ready_nodes(run_id: int):
+        """Queue every pending node whose dependencies have all completed"""
+        from app.services.scheduler_service import SchedulerService
+
+        ready = []
+        with get_db_context() as db:
+            nodes = db.query(WorkflowRunNode).filter(WorkflowRunNode.run_id == run_id).all()
+            statuses = {node.node_key: node.status for node in nodes}
+
+            for node in nodes:
+                if node.status != "pending":
+                    continue
+                if not all(statuses.get(dep) == "completed" for dep in node.depends_on):
+                    continue
+
+                # Claim the node atomically so concurrent upstream completions dispatch it once
+                claimed = db.query(WorkflowRunNode).filter(
+                    WorkflowRunNode.id == node.id,
+                    WorkflowRunNode.status == "pending"
+                ).update({"status": "queued"}, synchronize_session=False)
+                if claimed:
+                    ready.append(node.node_key)
+
+            if all(status in TERMINAL_NODE_STATUSES for status in statuses.values()) and not ready:
+                WorkflowExecutor._finish_run(db, run_id, statuses)
+
+        if ready:
+            scheduler = SchedulerService()
+            for node_key in ready:
+                scheduler.submit_once(
+                    WorkflowExecutor.execute_node,
+                    [run_id, node_key],
+                    f"workflow_run_{run_id}_{node_key}"
+                )
+
+    @staticmethod
+    def _finish_run(db, run_id: int, statuses: Dict[str, str]):
+        """Mark a run as finished once all of its nodes are terminal"""
+        status = "completed" if all(s == "completed" for s in statuses.values()) else "failed"
+
+        # Conditional update keeps concurrent finishers idempotent
+        finished = db.query(WorkflowRun).filter(
+            WorkflowRun.id == run_id,
+            WorkflowRun.status == "running"
+        ).update(
+            {"status": status, "completed_at": datetime.now(timezone.utc)},
+            synchronize_session=False
+        )
+        if finished:
+            logger.info(f"Workflow run {run_id} {status}")
+
+    @staticmethod
+    def _get_node(db, run_id: int, node_key: str) -> Optional[WorkflowRunNode]:
+        return db.query(WorkflowRunNode).filter(
+            WorkflowRunNode.run_id == run_id,
+            WorkflowRunNode.node_key == node_key
+        ).first()
+
+    @staticmethod
+    def _descendants(nodes: List[WorkflowRunNode], node_key: str) -> Set[str]:
+        """All nodes that transitively depend on the given node"""
+        children: Dict[str, List[str]] = {}
+        for node in nodes:
+            for dep in node.depends_on:
+                children.setdefault(dep, []).append(node.node_key)
+
+        found: Set[str] = set()
+        stack = [node_key]
+        while stack:
+            for child in children.get(stack.pop(), []):
+                if child not in found:
+                    found.add(child)
+                    stack.append(child)
+        return found
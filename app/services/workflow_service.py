@@ -0,0 +1,128 @@
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import desc
+from app.models.job import Job
+from app.models.workflow import Workflow, WorkflowRun, WorkflowRunNode
+from app.schemas.workflow_schemas import (
+    WorkflowCreate, WorkflowResponse, WorkflowRunResponse, WorkflowRunNodeResponse
+)
+from app.services.scheduler_service import SchedulerService
+from app.services.workflow_executor import WorkflowExecutor
+import logging
+
+logger = logging.getLogger(__name__)
+
+class WorkflowService:
+    """Service layer for workflow management operations"""
+
+    def __init__(self, db: Session, scheduler_service: SchedulerService):
+        self.db = db
+        self.scheduler_service = scheduler_service
+
+    def create_workflow(self, workflow_data: WorkflowCreate) -> WorkflowResponse:
+        """Create a new workflow and schedule it if it has a schedule"""
+        try:
+            job_ids = {node.job_id for node in workflow_data.nodes}
+            found = {row.id for row in self.db.query(Job.id).filter(Job.id.in_(job_ids)).all()}
+            missing = job_ids - found
+            if missing:
+                raise ValueError(f"Unknown job ids in workflow: {sorted(missing)}")
+
+            db_workflow = Workflow(
+                name=workflow_data.name,
+                description=workflow_data.description,
+                nodes=[node.dict() for node in workflow_data.nodes],
+                schedule_type=workflow_data.schedule_type,
+                schedule_config=workflow_data.schedule_config,
+                is_active=workflow_data.is_active
+            )
+
+            self.db.add(db_workflow)
+            self.db.commit()
+            self.db.refresh(db_workflow)
+
+            if db_workflow.schedule_type and db_workflow.is_active:
+                self.scheduler_service.schedule_workflow(
+                    db_workflow.id,
+                    db_workflow.schedule_type,
+                    db_workflow.schedule_config
+                )
+
+            logger.info(f"Created workflow {db_workflow.id}: {db_workflow.name}")
+            return WorkflowResponse.from_orm(db_workflow)
+
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to create workflow: {e}")
+            raise
+
+    def get_workflow_by_id(self, workflow_id: int) -> Optional[WorkflowResponse]:
+        """Retrieve a workflow by its ID"""
+        db_workflow = self.db.query(Workflow).filter(Workflow.id == workflow_id).first()
+        if db_workflow:
+            return WorkflowResponse.from_orm(db_workflow)
+        return None
+
+    def get_workflows(self, skip: int = 0, limit: int = 100) -> Tuple[List[WorkflowResponse], int]:
+        """Retrieve workflows with pagination"""
+        query = self.db.query(Workflow)
+        total = query.count()
+        workflows = query.order_by(desc(Workflow.created_at)).offset(skip).limit(limit).all()
+        return [WorkflowResponse.from_orm(workflow) for workflow in workflows], total
+
+    def delete_workflow(self, workflow_id: int) -> bool:
+        """Delete a workflow and its schedule"""
+        try:
+            db_workflow = self.db.query(Workflow).filter(Workflow.id == workflow_id).first()
+            if not db_workflow:
+                return False
+
+            if db_workflow.schedule_type:
+                self.scheduler_service.unschedule_workflow(workflow_id)
+
+            self.db.delete(db_workflow)
+            self.db.commit()
+
+            logger.info(f"Deleted workflow {workflow_id}")
+            return True
+
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to delete workflow {workflow_id}: {e}")
+            raise
+
+    def trigger_run(self, workflow_id: int) -> Optional[WorkflowRunResponse]:
+        """Start a workflow run immediately"""
+        if not self.db.query(Workflow.id).filter(Workflow.id == workflow_id).first():
+            return None
+        run_id = WorkflowExecutor.start_run(workflow_id)
+        return self.get_run(workflow_id, run_id)
+
+    def get_run(self, workflow_id: int, run_id: int) -> Optional[WorkflowRunResponse]:
+        """Retrieve a workflow run with per-node status"""
+        run = self.db.query(WorkflowRun).filter(
+            WorkflowRun.id == run_id,
+            WorkflowRun.workflow_id == workflow_id
+        ).first()
+        if not run:
+            return None
+
+        nodes = self.db.query(WorkflowRunNode).filter(
+            WorkflowRunNode.run_id == run_id
+        ).order_by(WorkflowRunNode.id).all()
+
+        return WorkflowRunResponse(
+            id=run.id,
+            workflow_id=run.workflow_id,
+            status=run.status,
+            started_at=run.started_at,
+            completed_at=run.completed_at,
+            nodes=[WorkflowRunNodeResponse.from_orm(node) for node in nodes]
+        )
+
+    def get_runs(self, workflow_id: int, skip: int = 0, limit: int = 20) -> List[WorkflowRunResponse]:
+        """Retrieve recent runs of a workflow"""
+        runs = self.db.query(WorkflowRun.id).filter(
+            WorkflowRun.workflow_id == workflow_id
+        ).order_by(desc(WorkflowRun.id)).offset(skip).limit(limit).all()
+        return [self.get_run(workflow_id, run.id) for run in runs]
@@ -0,0 +1,73 @@
+"""Scheduling lag and worker count under bursty load, fixed versus autoscaled pool
+
+Schedules bursts of short tasks (300 fires due at the same moment, 8 s apart) on an
+APScheduler with either a fixed pool or the autoscaling executor, then reports how
+late fires started and how far the pool grew and shrank.
+    
+    python -m benchmarks.bench_autoscaling [--bursts 2] [--burst-size 300] [--task-ms 100]
+"""
+import argparse
+import statistics
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import timed
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from app.services.adaptive_executor import AdaptiveThreadPoolExecutor
+
+BURST_INTERVAL_SECONDS = 8
+
+def run(mode: str, bursts: int, burst_size: int, task_seconds: float, fixed_workers: int):
+    lags = []
+    lock = threading.Lock()
+    
+    def task(due: datetime):
+        with lock:
+            lags.append((datetime.now(timezone.utc) - due).total_seconds())
+        time.sleep(task_seconds)
+    
+    if mode == "fixed":
+        executor = AdaptiveThreadPoolExecutor(fixed_workers, fixed_workers)
+    else:
+        executor = AdaptiveThreadPoolExecutor(2, 32, interval_seconds=0.25, idle_ticks_before_shrink=4)
+    scheduler = BackgroundScheduler(executors={"default": executor}, job_defaults={"misfire_grace_time": None})
+    scheduler.start()
+    
+    start = datetime.now(timezone.utc) + timedelta(seconds=0.5)
+    for burst in range(bursts):
+        due = start + timedelta(seconds=BURST_INTERVAL_SECONDS * burst)
+        for index in range(burst_size):
+            scheduler.add_job(task, "date", run_date=due, args=[due], id=f"{burst}-{index}")
+    
+    peak_workers = 0
+    with timed(f"{mode}: {bursts * burst_size} fires until drained"):
+        while len(lags) < bursts * burst_size or executor.stats()["busy"]:
+            time.sleep(0.1)
+            peak_workers = max(peak_workers, executor.stats()["workers"])
+    
+    # Leave the autoscaler time to shrink the idle pool
+    time.sleep(3)
+    
+    final_workers = executor.stats()["workers"]
+    scheduler.shutdown()
+    print(
+        f"{mode}: lag mean {statistics.mean(lags):.2f} s, max {max(lags):.2f} s, "
+        f"peak workers {peak_workers}, final workers {final_workers}, "
+        f"scaling decisions {len(executor.decisions)}"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bursts", type=int, default=2)
+    parser.add_argument("--burst-size", type=int, default=300)
+    parser.add_argument("--task-ms", type=float, default=100.0)
+    parser.add_argument("--fixed-workers", type=int, default=4)
+    args = parser.parse_args()
+    
+    for mode in ("fixed", "autoscaled"):
+        run(mode, args.bursts, args.burst_size, args.task_ms / 1000, args.fixed_workers)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Throughput of co-firing jobs of one type, run one by one or batched
+
+Fires N jobs of a batch-capable type at once on a worker pool the size of the
+executor and reports how long it takes until all of them are recorded. The handler
+stands in for email_notification: each call pays a fixed setup cost (opening a
+connection) plus a small cost per job.
+    
+    python -m benchmarks.bench_batching [--jobs 10000] [--workers 10] [--setup-ms 5]
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import reset_database, timed
+
+from app.config.settings import settings
+from app.database.connection import get_db_context
+from app.models.job import Job
+from app.models.job_execution import JobExecution
+from app.services.job_executor import JobExecutor
+from app.services.job_handler import JobHandler, JobHandlerFactory
+
+class SimulatedEmailHandler(JobHandler):
+    def __init__(self, setup_seconds: float, per_job_seconds: float):
+        self.setup_seconds = setup_seconds
+        self.per_job_seconds = per_job_seconds
+    
+    def execute(self, config):
+        time.sleep(self.setup_seconds + self.per_job_seconds)
+        return {"status": "success"}
+    
+    def execute_batch(self, configs):
+        time.sleep(self.setup_seconds + self.per_job_seconds * len(configs))
+        return [{"status": "success"} for _ in configs]
+
+def create_jobs(count: int):
+    with get_db_context() as db:
+        jobs = [
+            Job(
+                name=f"notification {index}",
+                job_type="bench_email",
+                schedule_type="interval",
+                schedule_config={"interval_seconds": 3600},
+                job_config={"recipients": [f"user{index}@example.com"]},
+                total_runs=0,
+                success_runs=0,
+                failed_runs=0,
+                is_active=True
+            )
+            for index in range(count)
+        ]
+        db.add_all(jobs)
+        db.flush()
+        return [job.id for job in jobs]
+
+def run(mode: str, jobs: int, workers: int):
+    reset_database()
+    job_ids = create_jobs(jobs)
+    settings.batch_window_ms = 50 if mode == "batched" else 0
+    
+    with timed(f"{mode}: {jobs} co-firing jobs", jobs):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for job_id in job_ids:
+                pool.submit(JobExecutor.execute_job, job_id, "bench_email")
+    
+    with get_db_context() as db:
+        recorded = db.query(JobExecution).filter(JobExecution.status == "success").count()
+    print(f"{mode}: {recorded} successful executions recorded")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--setup-ms", type=float, default=5.0)
+    parser.add_argument("--per-job-ms", type=float, default=0.1)
+    args = parser.parse_args()
+    
+    JobHandlerFactory.register_handler(
+        "bench_email",
+        SimulatedEmailHandler(args.setup_ms / 1000, args.per_job_ms / 1000)
+    )
+    for mode in ("unbatched", "batched"):
+        run(mode, args.jobs, args.workers)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Import and startup time of the service per deployment role
+
+Each configuration runs in fresh interpreters: the time to import main, the time
+for the lifespan to come up, and which heavy modules (APScheduler, Redis, croniter)
+got loaded on the way. The median of several runs is reported.
+    
+    python -m benchmarks.bench_cold_start [--runs 7]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+CONFIGURATIONS = [
+    ("all, schema on boot", {"SERVICE_ROLE": "all", "AUTO_CREATE_SCHEMA": "true"}),
+    ("scheduler, schema by Alembic", {"SERVICE_ROLE": "scheduler", "AUTO_CREATE_SCHEMA": "false"}),
+    ("api, schema by Alembic", {"SERVICE_ROLE": "api", "AUTO_CREATE_SCHEMA": "false"}),
+]
+
+# Runs in the child interpreter; the TestClient import is not part of the service's startup
+PROBE = """
+import json, logging, sys, time
+from fastapi.testclient import TestClient
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+logging.disable(logging.CRITICAL)
+with TestClient(main.app):
+    up = time.perf_counter()
+heavy = [name for name in ("apscheduler", "redis", "croniter") if name in sys.modules]
+print(json.dumps({"import": imported - started, "startup": up - imported, "heavy": heavy}))
+"""
+
+def probe(env_overrides, database_url: str):
+    env = {**os.environ, "DATABASE_URL": database_url, "JOB_STORE": "memory", **env_overrides}
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=os.getcwd(),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+    
+    database_url = f"sqlite:///{tempfile.mkdtemp(prefix='job-scheduler-bench-')}/bench.db"
+    # Create the schema once, as a migration would before a rollout
+    probe(CONFIGURATIONS[0][1], database_url)
+    
+    for label, env_overrides in CONFIGURATIONS:
+        runs = [probe(env_overrides, database_url) for _ in range(args.runs)]
+        import_ms = statistics.median(run["import"] for run in runs) * 1000
+        startup_ms = statistics.median(run["startup"] for run in runs) * 1000
+        heavy = ", ".join(runs[-1]["heavy"]) or "none"
+        print(f"{label}: import {import_ms:.0f} ms, lifespan startup {startup_ms:.0f} ms, heavy modules loaded: {heavy}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Latency and size of the 1000-row job list, entity path versus projected rows
+
+Seeds 1000 jobs with realistic descriptions and configs, then times GET /api/v1/jobs/
+through the app. For comparison the old entity path is mounted alongside: full Job
+entities, JobResponse.from_orm per row and validation again through response_model.
+    
+    python -m benchmarks.bench_job_list [--jobs 1000] [--requests 20]
+"""
+import argparse
+import time
+
+from benchmarks.common import reset_database
+
+from fastapi import Depends
+from fastapi.testclient import TestClient
+
+from main import app
+from app.api.routes.jobs import get_read_job_service
+from app.database.connection import get_db_context
+from app.models.job import Job
+from app.schemas.job_schemas import JobListResponse
+from app.services.job_service import JobService
+
+@app.get("/bench/entity-jobs", response_model=JobListResponse)
+async def list_jobs_from_entities(skip: int = 0, limit: int = 100, job_service: JobService = Depends(get_read_job_service)):
+    """The job list as served before column projection"""
+    jobs, total = job_service.get_jobs(skip=skip, limit=limit)
+    return JobListResponse(jobs=jobs, total=total, page=skip // limit + 1, per_page=limit, has_next=skip + limit < total)
+
+def seed(count: int):
+    with get_db_context() as db:
+        db.add_all([
+            Job(
+                name=f"job {index}",
+                description="lorem ipsum " * 40,
+                job_type="email_notification",
+                schedule_type="cron",
+                schedule_config={"cron_expression": "*/5 * * * *"},
+                job_config={"recipients": [f"user{index}@example.com"], "subject": "hi", "body": "x" * 200},
+                total_runs=index,
+                success_runs=index,
+                failed_runs=0,
+                is_active=True
+            )
+            for index in range(count)
+        ])
+
+def measure(client: TestClient, label: str, url: str, requests: int):
+    client.get(url)
+    started = time.perf_counter()
+    for _ in range(requests):
+        response = client.get(url)
+    elapsed = (time.perf_counter() - started) / requests
+    print(f"{label}: {elapsed * 1000:.1f} ms/request, {len(response.content) / 1024:,.0f} KB")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+    
+    reset_database()
+    seed(args.jobs)
+    client = TestClient(app)
+    limit = args.jobs
+    measure(client, "entities + response_model", f"/bench/entity-jobs?limit={limit}", args.requests)
+    measure(client, "projected rows", f"/api/v1/jobs/?limit={limit}", args.requests)
+    measure(client, "projected rows, fields=id,name,next_run", f"/api/v1/jobs/?limit={limit}&fields=id,name,next_run", args.requests)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Cost of metadata-only job updates, with and without schedule diffing
+
+Applies 10k name/description/job_config updates through JobService.update_job and
+counts the job store writes they cause. "reschedule" replays the old behaviour of
+removing and re-adding every updated job; "diffed" is the current path, which leaves
+the job store alone unless the trigger or active state changed.
+    
+    python -m benchmarks.bench_metadata_updates [--jobs 1000] [--updates 10000]
+"""
+import argparse
+
+from benchmarks.common import reset_database, timed
+
+from app.database.connection import get_db_context
+from app.schemas.job_schemas import JobCreate, JobUpdate
+from app.services.job_service import JobService
+from app.services.scheduler_service import SchedulerService
+
+def count_job_store_writes(scheduler):
+    """Wrap the default job store so its writes are counted"""
+    store = scheduler._lookup_jobstore("default")
+    counts = {"add_job": 0, "update_job": 0, "remove_job": 0}
+    for name in counts:
+        original = getattr(store, name)
+        
+        def counted(*args, _name=name, _original=original, **kwargs):
+            counts[_name] += 1
+            return _original(*args, **kwargs)
+        setattr(store, name, counted)
+    return counts
+
+def run(mode: str, jobs: int, updates: int):
+    reset_database()
+    scheduler_service = SchedulerService()
+    if mode == "reschedule":
+        scheduler_service.sync_job = lambda job, previous_fingerprint, was_active: scheduler_service.reschedule_job(job)
+    
+    with get_db_context() as db:
+        service = JobService(db, scheduler_service)
+        job_ids = [
+            service.create_job(JobCreate(
+                name=f"job {index}",
+                job_type="data_processing",
+                schedule_type="interval",
+                schedule_config={"interval_seconds": 3600}
+            )).id
+            for index in range(jobs)
+        ]
+    
+    counts = count_job_store_writes(scheduler_service.scheduler)
+    with get_db_context() as db:
+        service = JobService(db, scheduler_service)
+        with timed(f"{mode}: {updates} metadata-only updates", updates):
+            for index in range(updates):
+                service.update_job(job_ids[index % jobs], JobUpdate(
+                    name=f"job {index}",
+                    description=f"revision {index}",
+                    job_config={"dataset": f"dataset_{index % 7}"}
+                ))
+    print(f"{mode}: job store writes {counts}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--updates", type=int, default=10000)
+    args = parser.parse_args()
+    
+    # Paused: the benchmark measures job store traffic, not fires
+    SchedulerService().scheduler.start(paused=True)
+    for mode in ("reschedule", "diffed"):
+        run(mode, args.jobs, args.updates)
+    SchedulerService().scheduler.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Per-execution latency of email jobs with and without pooled SMTP connections
+
+Starts a local stand-in SMTP server in its own process that delays its greeting to
+mimic connection setup (TCP, TLS and auth against a real relay), then sends through
+EmailNotificationHandler: once opening a connection per execution, once borrowing
+from the handler's resource pool.
+    
+    python -m benchmarks.bench_resource_pool [--executions 500] [--workers 10] [--connect-ms 20]
+"""
+import argparse
+import multiprocessing
+import socketserver
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import timed
+
+from app.config.settings import settings
+from app.services.job_handler import EmailNotificationHandler
+from app.services.resource_pool import ResourcePools
+
+class SMTPStandIn(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib.send_message"""
+    
+    connect_seconds = 0.0
+    
+    def handle(self):
+        time.sleep(self.connect_seconds)
+        self.reply("220 localhost ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line[:4].upper()
+            if command in (b"EHLO", b"HELO"):
+                self.reply("250 localhost")
+            elif command == b"DATA":
+                self.reply("354 end with <CRLF>.<CRLF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                self.reply("250 queued")
+            elif command == b"QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                # MAIL, RCPT, RSET, NOOP
+                self.reply("250 ok")
+    
+    def reply(self, text: str):
+        self.wfile.write(f"{text}\r\n".encode())
+
+class ThreadedServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+def serve(connect_seconds: float, addresses: multiprocessing.Queue):
+    """Run the stand-in server, away from the benchmark's GIL"""
+    SMTPStandIn.connect_seconds = connect_seconds
+    server = ThreadedServer(("127.0.0.1", 0), SMTPStandIn)
+    addresses.put(server.server_address)
+    server.serve_forever()
+
+def run(mode: str, executions: int, workers: int):
+    handler = EmailNotificationHandler()
+    if mode == "pooled":
+        handler.startup()
+    config = {"recipients": ["user@example.com"], "subject": "Benchmark", "body": "Hello"}
+    
+    def send_unpooled():
+        smtp = handler._connect()
+        try:
+            handler._send(smtp, config, config["recipients"], config["subject"])
+        finally:
+            handler._disconnect(smtp)
+    
+    send = (lambda: handler.execute(config)) if mode == "pooled" else send_unpooled
+    
+    def timed_send() -> float:
+        started = time.perf_counter()
+        send()
+        return (time.perf_counter() - started) * 1000
+    
+    with timed(f"{mode}: {executions} executions on {workers} workers", executions):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            latencies = sorted(pool.map(lambda _: timed_send(), range(executions)))
+    
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{mode}: latency p50 {statistics.median(latencies):.2f} ms, p95 {p95:.2f} ms")
+    if mode == "pooled":
+        print(f"{mode}: pool {ResourcePools.stats()[handler.pool_name]}")
+        handler.shutdown()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--executions", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--connect-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    
+    addresses: multiprocessing.Queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(args.connect_ms / 1000, addresses), daemon=True)
+    server.start()
+    settings.smtp_host, settings.smtp_port = addresses.get(timeout=10)
+    settings.smtp_username = None
+    settings.max_workers = args.workers
+    
+    for mode in ("unpooled", "pooled"):
+        run(mode, args.executions, args.workers)
+    server.terminate()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Insert throughput and stored size of execution results, inline versus spilled
+
+Records executions the way the executor does, through ResultStore, with a mix of
+large data_processing style results (3000 rows, ~200 KB of JSON) and small ones.
+"inline" raises the cap so everything stays in job_executions; "spilled" uses the
+configured cap, compressing large results into execution_blobs.
+    
+    python -m benchmarks.bench_result_store [--large 200] [--small 2000]
+"""
+import argparse
+import random
+
+from benchmarks.common import reset_database, timed
+
+from sqlalchemy import text
+
+from app.config.settings import settings
+from app.database.connection import engine, get_db_context
+from app.models.job_execution import JobExecution
+from app.services.result_store import ResultStore
+
+BATCH_SIZE = 20
+
+def large_result():
+    return {
+        "status": "success",
+        "rows": [
+            {
+                "id": index,
+                "name": f"customer-{random.randint(0, 10 ** 6)}",
+                "total": round(random.random() * 1000, 2),
+                "region": random.choice(["eu", "us", "apac"])
+            }
+            for index in range(3000)
+        ]
+    }
+
+def run(mode: str, results):
+    reset_database()
+    inline_cap = settings.result_inline_max_bytes
+    if mode == "inline":
+        settings.result_inline_max_bytes = 2 ** 31
+    
+    try:
+        with timed(f"{mode}: {len(results)} executions recorded", len(results)):
+            for start in range(0, len(results), BATCH_SIZE):
+                outcomes = [ResultStore.encode(result, None) for result in results[start:start + BATCH_SIZE]]
+                with get_db_context() as db:
+                    for outcome in outcomes:
+                        execution = JobExecution(job_id=1, status=outcome.status, result=outcome.result)
+                        db.add(execution)
+                        db.flush()
+                        ResultStore.save(db, execution.id, outcome)
+    finally:
+        settings.result_inline_max_bytes = inline_cap
+    
+    with engine.connect() as connection:
+        inline_bytes = connection.execute(text("SELECT SUM(LENGTH(result)) FROM job_executions")).scalar() or 0
+        blob_bytes = connection.execute(text("SELECT SUM(LENGTH(data)) FROM execution_blobs")).scalar() or 0
+    print(f"{mode}: job_executions.result {inline_bytes / 1e6:.1f} MB, execution_blobs {blob_bytes / 1e6:.1f} MB")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--large", type=int, default=200)
+    parser.add_argument("--small", type=int, default=2000)
+    args = parser.parse_args()
+    
+    random.seed(1)
+    results = [large_result() for _ in range(args.large)]
+    results += [{"status": "success", "processed": 42} for _ in range(args.small)]
+    random.shuffle(results)
+    
+    for mode in ("inline", "spilled"):
+        run(mode, results)
+
+if __name__ == "__main__":
+    main()
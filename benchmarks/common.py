@@ -0,0 +1,37 @@
+"""Shared setup for the benchmarks
+
+Run them from the repository root, e.g. `python -m benchmarks.bench_metadata_updates`.
+They use a throwaway SQLite database and an in-memory job store unless DATABASE_URL
+and JOB_STORE are set, so the same script can be pointed at MySQL and Redis.
+Import this module before anything from app: settings and engines are built at import time.
+"""
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+_data_dir = tempfile.mkdtemp(prefix="job-scheduler-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_data_dir}/bench.db")
+os.environ.setdefault("JOB_STORE", "memory")
+
+# Per-job info logs would dominate the timings
+logging.basicConfig(level=logging.WARNING)
+
+def reset_database():
+    """Drop and recreate every table"""
+    from app.database.connection import engine
+    from app.models.base import Base
+    import app.models.job, app.models.job_execution, app.models.workflow
+    import app.models.dead_letter, app.models.job_change, app.models.execution_blob
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+@contextmanager
+def timed(label: str, operations: int = 0):
+    """Print the wall time of the block, and the rate if it ran a number of operations"""
+    started = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - started
+    rate = f", {operations / elapsed:,.0f}/s" if operations else ""
+    print(f"{label}: {elapsed * 1000:,.1f} ms{rate}")
@@ -8,9 +8,17 @@ import uvicorn
 from app.config.settings import settings
 from app.api.routes import jobs
 from app.api.routes import healthcheck
+from app.api.routes import workflows
+from app.api.routes import dead_letters
+from app.api.routes import metrics
+from app.api.routes import scheduler
+from app.api.routes import events
+from app.api.routes import schedule
 from app.services.scheduler_service import SchedulerService
+from app.services.job_handler import JobHandlerFactory
+from app.services.event_broadcaster import EventBroadcaster
 from app.models.job import Base
-from app.database.connection import engine
+from app.database.connection import engine, pin_to_primary
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -19,25 +27,13 @@ logger = logging.getLogger(__name__)
 # Global scheduler instance
 scheduler_service = None
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan events"""
-    global scheduler_service
-    
-    # Startup
-    logger.info("Starting Job Scheduler Microservice")
-    
-    # Create database tables
-    Base.metadata.create_all(bind=engine)
-    
-    # Initialize and start scheduler
-    scheduler_service = SchedulerService()
-    scheduler_service.start()
-    
-    # Load and schedule existing active jobs
+def _reschedule_active():
+    """Put every active job and scheduled workflow back into the scheduler"""
     from app.database.connection import get_db_context
     from app.models.job import Job
+    from app.models.workflow import Workflow
     
+    scheduler_service = SchedulerService()
     with get_db_context() as db:
         active_jobs = db.query(Job).filter(Job.is_active == True).all()
         for job in active_jobs:
@@ -46,14 +42,62 @@ async def lifespan(app: FastAPI):
                 logger.info(f"Rescheduled job {job.id}: {job.name}")
             except Exception as e:
                 logger.error(f"Failed to reschedule job {job.id}: {e}")
+        
+        scheduled_workflows = db.query(Workflow).filter(
+            Workflow.is_active == True,
+            Workflow.schedule_type.isnot(None)
+        ).all()
+        for workflow in scheduled_workflows:
+            try:
+                scheduler_service.schedule_workflow(
+                    workflow.id,
+                    workflow.schedule_type,
+                    workflow.schedule_config
+                )
+                logger.info(f"Rescheduled workflow {workflow.id}: {workflow.name}")
+            except Exception as e:
+                logger.error(f"Failed to reschedule workflow {workflow.id}: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan events"""
+    global scheduler_service
+    
+    # Startup
+    logger.info("Starting Job Scheduler Microservice")
+    
+    # Create database tables unless the schema is managed by Alembic only
+    if settings.auto_create_schema:
+        Base.metadata.create_all(bind=engine)
+    
+    # API pods never execute jobs
+    runs_jobs = settings.service_role != "api"
+    
+    # Let handlers set up pooled resources before any job can fire
+    if runs_jobs:
+        JobHandlerFactory.startup_all()
     
-    logger.info("Scheduler service started successfully")
+    # Relay execution events published by other replicas
+    EventBroadcaster.start()
+    
+    # Initialize and start scheduler; API pods create a paused one on their first schedule change
+    if runs_jobs:
+        scheduler_service = SchedulerService()
+        scheduler_service.start()
+        
+        # Load and schedule existing active jobs
+        _reschedule_active()
+    
+    logger.info(f"Scheduler service started successfully (role: {settings.service_role})")
     
     yield
     
     # Shutdown
     if scheduler_service:
         scheduler_service.shutdown()
+    if runs_jobs:
+        JobHandlerFactory.shutdown_all()
+    EventBroadcaster.stop()
     logger.info("Job Scheduler Microservice stopped")
 
 # Create FastAPI app
@@ -73,9 +117,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Pin clients to the primary for a short while after they write
+@app.middleware("http")
+async def read_your_writes(request: Request, call_next):
+    response = await call_next(request)
+    if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+        pin_to_primary(response)
+    return response
+
 # Add routes
 app.include_router(jobs.router, prefix="/api/v1")
 app.include_router(healthcheck.router, prefix="/api/v1")
+app.include_router(workflows.router, prefix="/api/v1")
+app.include_router(dead_letters.router, prefix="/api/v1")
+app.include_router(metrics.router, prefix="/api/v1")
+app.include_router(scheduler.router, prefix="/api/v1")
+app.include_router(events.router, prefix="/api/v1")
+app.include_router(schedule.router, prefix="/api/v1")
 
 # Global exception handler
 @app.exception_handler(Exception)
@@ -0,0 +1,118 @@
+import os
+import tempfile
+import threading
+
+# Configure before the app is imported: settings and engines are built at import time
+_data_dir = tempfile.mkdtemp(prefix="job-scheduler-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_data_dir}/primary.db")
+os.environ.setdefault("JOB_STORE", "memory")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+import app.services.scheduler_service as scheduler_module
+from app.database import connection
+from app.database.connection import engine, get_db_context
+from app.models.base import Base
+from app.models.job import Job
+from app.services.job_handler import JobHandler, JobHandlerFactory
+import main
+
+@pytest.fixture(autouse=True)
+def database():
+    """Fresh tables for every test"""
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+
+@pytest.fixture
+def client():
+    """API client with the app's lifespan (scheduler, handlers) running"""
+    with TestClient(main.app) as client:
+        yield client
+    # A shut down APScheduler can't be restarted; the next test gets a new one
+    scheduler_module._scheduler = None
+
+@pytest.fixture
+def replica(monkeypatch):
+    """A second SQLite database standing in for a read replica that never receives writes"""
+    replica_engine = connection._create_engine(f"sqlite:///{_data_dir}/replica.db")
+    Base.metadata.drop_all(replica_engine)
+    Base.metadata.create_all(replica_engine)
+    monkeypatch.setattr(connection, "replica_engines", [replica_engine])
+    monkeypatch.setattr(
+        connection, "_replica_sessions", [sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)]
+    )
+    yield replica_engine
+    replica_engine.dispose()
+
+class HungHandler(JobHandler):
+    """Blocks without ever checking for cancellation"""
+    
+    def __init__(self):
+        self.release = threading.Event()
+    
+    def execute(self, config):
+        self.release.wait(30)
+        return {"status": "success"}
+
+class QuickHandler(JobHandler):
+    """Returns job_config["result"] at once, or a plain success"""
+    
+    def execute(self, config):
+        return config.get("result", {"status": "success"})
+
+class FailingHandler(JobHandler):
+    """Raises job_config["error"] as a RuntimeError"""
+    
+    def execute(self, config):
+        raise RuntimeError(config.get("error", "Handler failed"))
+
+@pytest.fixture
+def register_handler():
+    """Register handlers for the duration of a test"""
+    registered = {}
+    
+    def register(job_type, handler):
+        registered.setdefault(job_type, JobHandlerFactory.get_handler(job_type))
+        JobHandlerFactory.register_handler(job_type, handler)
+    
+    yield register
+    for job_type, previous in registered.items():
+        if previous is None:
+            JobHandlerFactory._handlers.pop(job_type, None)
+        else:
+            JobHandlerFactory.register_handler(job_type, previous)
+
+@pytest.fixture
+def hung(register_handler):
+    """The "hung", "quick" and "failing" stub handlers; yields the hung one"""
+    handler = HungHandler()
+    register_handler("hung", handler)
+    register_handler("quick", QuickHandler())
+    register_handler("failing", FailingHandler())
+    yield handler
+    # Let the abandoned handler threads finish
+    handler.release.set()
+
+@pytest.fixture
+def make_job():
+    """Insert an active interval job and return its ID"""
+    def make(job_type="data_processing", job_config=None, interval_seconds=3600):
+        with get_db_context() as db:
+            job = Job(
+                name=f"{job_type} job",
+                job_type=job_type,
+                schedule_type="interval",
+                schedule_config={"interval_seconds": interval_seconds},
+                job_config=job_config or {},
+                total_runs=0,
+                success_runs=0,
+                failed_runs=0,
+                is_active=True
+            )
+            db.add(job)
+            db.flush()
+            return job.id
+    return make
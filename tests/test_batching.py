@@ -0,0 +1,106 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.database.connection import get_db_context
+from app.models.job_execution import JobExecution
+from app.services.job_executor import JobExecutor
+from app.services.job_handler import JobHandler
+
+class SteppedBatchHandler(JobHandler):
+    """Works through a batch one member at a time, each waiting for the test to step it"""
+    
+    def __init__(self):
+        self.started = threading.Event()
+        self.step = threading.Semaphore(0)
+    
+    def execute(self, config):
+        return {"status": "success"}
+    
+    def execute_batch(self, configs):
+        self.started.set()
+        results = []
+        for index, config in enumerate(configs):
+            while not self.step.acquire(timeout=0.01):
+                if self.is_member_cancelled(index):
+                    break
+            if self.is_member_cancelled(index):
+                results.append({"status": "cancelled", "message": "Execution cancelled"})
+                continue
+            results.append({"status": "success"})
+        return results
+
+def executions_by_job():
+    """Job ID -> (execution ID, status)"""
+    with get_db_context() as db:
+        return {execution.job_id: (execution.id, execution.status) for execution in db.query(JobExecution).all()}
+
+def test_cancelling_one_member_keeps_the_rest_of_the_batch(register_handler, make_job):
+    handler = SteppedBatchHandler()
+    register_handler("stepped", handler)
+    job_ids = [make_job("stepped") for _ in range(3)]
+    
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        run = pool.submit(JobExecutor.run_batch, "stepped", job_ids)
+        assert handler.started.wait(5)
+        
+        cancelled_execution = executions_by_job()[job_ids[1]][0]
+        assert JobExecutor.request_cancel(cancelled_execution)
+        for _ in job_ids:
+            handler.step.release()
+        
+        assert run.result(timeout=5) == {"status": "success", "batch_size": 3, "succeeded": 2}
+    
+    executions = executions_by_job()
+    assert [executions[job_id][1] for job_id in job_ids] == ["success", "cancelled", "success"]
+
+def test_cancelling_every_member_stops_the_batch(register_handler, make_job):
+    handler = SteppedBatchHandler()
+    register_handler("stepped", handler)
+    job_ids = [make_job("stepped") for _ in range(2)]
+    
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        run = pool.submit(JobExecutor.run_batch, "stepped", job_ids)
+        assert handler.started.wait(5)
+        
+        for execution_id, _ in executions_by_job().values():
+            assert JobExecutor.request_cancel(execution_id)
+        
+        assert run.result(timeout=5)["succeeded"] == 0
+    
+    assert {status for _, status in executions_by_job().values()} == {"cancelled"}
+
+class GroupRecordingHandler(JobHandler):
+    """Records the configs of each batch call; members with "hang" block until released"""
+    
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+    
+    def execute(self, config):
+        return {"status": "success"}
+    
+    def execute_batch(self, configs):
+        self.calls.append([config["name"] for config in configs])
+        if any(config.get("hang") for config in configs):
+            self.release.wait(30)
+        return [{"status": "success"} for _ in configs]
+
+def test_batch_members_keep_their_own_timeout(register_handler, make_job):
+    handler = GroupRecordingHandler()
+    register_handler("grouped", handler)
+    hanging = make_job("grouped", {"name": "hanging", "hang": True, "timeout_seconds": 0.3})
+    generous = [make_job("grouped", {"name": f"generous-{index}", "timeout_seconds": 60}) for index in range(2)]
+    unbounded = make_job("grouped", {"name": "unbounded"})
+    
+    try:
+        started = time.monotonic()
+        result = JobExecutor.run_batch("grouped", [unbounded, *generous, hanging])
+        assert time.monotonic() - started < 5
+    finally:
+        handler.release.set()
+    
+    assert result == {"status": "success", "batch_size": 4, "succeeded": 3}
+    assert handler.calls == [["hanging"], ["generous-0", "generous-1"], ["unbounded"]]
+    statuses = {job_id: status for job_id, (_, status) in executions_by_job().items()}
+    assert statuses == {hanging: "timed_out", generous[0]: "success", generous[1]: "success", unbounded: "success"}
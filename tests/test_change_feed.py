@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta, timezone
+
+from app.config.settings import settings
+from app.database.connection import get_db_context
+from app.models.job_change import JobChange
+from app.services.job_service import JobService
+from app.services.scheduler_service import SchedulerService
+
+def add_change(job_id, age_seconds):
+    # SQLite stamps changed_at in UTC
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    with get_db_context() as db:
+        db.add(JobChange(job_id=job_id, change_type="created", changed_at=now - timedelta(seconds=age_seconds)))
+
+def read_changes(since=0):
+    with get_db_context() as db:
+        return JobService(db, SchedulerService()).get_changes(since=since)
+
+def test_feed_holds_back_recent_changes(make_job):
+    settled, recent = make_job(), make_job()
+    add_change(settled, age_seconds=60)
+    add_change(recent, age_seconds=0)
+    
+    feed = read_changes()
+    assert [change.job_id for change in feed.changes] == [settled]
+    assert feed.next_token == "1"
+    assert not feed.has_more
+    
+    # Nothing past the held back change is skipped once it settles
+    with get_db_context() as db:
+        db.query(JobChange).filter(JobChange.id == 2).update(
+            {"changed_at": datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=60)}
+        )
+    feed = read_changes(since=int(feed.next_token))
+    assert [change.job_id for change in feed.changes] == [recent]
+    assert feed.next_token == "2"
+
+def test_feed_without_safety_lag_is_immediate(monkeypatch, make_job):
+    monkeypatch.setattr(settings, "change_feed_safety_seconds", 0)
+    job_id = make_job()
+    add_change(job_id, age_seconds=0)
+    
+    assert [change.job_id for change in read_changes().changes] == [job_id]
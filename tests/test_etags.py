@@ -0,0 +1,27 @@
+from app.database.connection import get_db_context
+from app.models.job import Job
+
+JOB = {
+    "name": "nightly report",
+    "job_type": "data_processing",
+    "schedule_type": "interval",
+    "schedule_config": {"interval_seconds": 3600}
+}
+
+def test_detail_etag_changes_on_edit_within_the_same_second(client):
+    job_id = client.post("/api/v1/jobs/", json=JOB).json()["id"]
+    first = client.get(f"/api/v1/jobs/{job_id}")
+    with get_db_context() as db:
+        updated_at = db.query(Job.updated_at).filter(Job.id == job_id).scalar()
+    
+    assert client.put(f"/api/v1/jobs/{job_id}", json={"description": "edited"}).status_code == 200
+    # MySQL DATETIME keeps whole seconds, so a quick edit can leave updated_at as it was
+    with get_db_context() as db:
+        db.query(Job).filter(Job.id == job_id).update({"updated_at": updated_at})
+    
+    response = client.get(f"/api/v1/jobs/{job_id}", headers={"If-None-Match": first.headers["ETag"]})
+    assert response.status_code == 200
+    assert response.json()["description"] == "edited"
+    
+    again = client.get(f"/api/v1/jobs/{job_id}", headers={"If-None-Match": response.headers["ETag"]})
+    assert again.status_code == 304
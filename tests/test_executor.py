@@ -0,0 +1,91 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.config.settings import settings
+from app.services.job_executor import JobExecutor
+from app.services.load_monitor import LoadMonitor
+from app.services.scheduler_service import SchedulerService
+
+def test_fixed_pool_reports_backlog_and_lag(monkeypatch):
+    monkeypatch.setattr(settings, "autoscale_enabled", False)
+    monkeypatch.setattr(settings, "max_workers", 2)
+    # Ticks are driven by the test
+    monkeypatch.setattr(settings, "autoscale_interval_seconds", 60)
+    release = threading.Event()
+    
+    scheduler = SchedulerService._create_scheduler()
+    scheduler.start()
+    try:
+        # Two fires occupy both workers and the rest queue behind them
+        run_at = datetime.now(timezone.utc) + timedelta(milliseconds=100)
+        for index in range(6):
+            scheduler.add_job(release.wait, "date", run_date=run_at, args=[5], id=f"blocked-{index}")
+        time.sleep(0.5)
+        
+        executor = scheduler._executors["default"]
+        stats = executor.stats()
+        assert stats["workers"] == 2
+        assert stats["pending"] == 4
+        
+        release.set()
+        time.sleep(0.2)
+        executor._autoscale()
+        assert executor.stats()["lag_seconds"] > 0.2
+        assert executor.stats()["workers"] == 2
+        assert not executor.decisions
+    finally:
+        release.set()
+        scheduler.shutdown()
+
+def test_load_monitor_sees_fixed_pool_backlog(monkeypatch):
+    monkeypatch.setattr(settings, "autoscale_enabled", False)
+    monkeypatch.setattr(settings, "max_workers", 1)
+    monkeypatch.setattr(settings, "overload_backlog_threshold", 2)
+    release = threading.Event()
+    
+    scheduler = SchedulerService._create_scheduler()
+    monkeypatch.setattr(SchedulerService, "scheduler", scheduler)
+    scheduler.start()
+    try:
+        executor = scheduler._executors["default"]
+        for _ in range(4):
+            executor._pool.submit(release.wait, 5)
+        
+        state = LoadMonitor._measure()
+        assert state["level"] == "overloaded"
+        assert state["reasons"][0].startswith("executor backlog")
+    finally:
+        release.set()
+        scheduler.shutdown()
+
+def test_repeated_shedding_keeps_one_deferral(monkeypatch, make_job):
+    monkeypatch.setattr(settings, "load_shed_action", "defer")
+    monkeypatch.setattr(LoadMonitor, "should_shed", staticmethod(lambda job_config: True))
+    scheduler = SchedulerService._create_scheduler()
+    monkeypatch.setattr(SchedulerService, "scheduler", scheduler)
+    scheduler.start(paused=True)
+    try:
+        job_id = make_job(job_config={"priority": "low"})
+        for _ in range(3):
+            assert JobExecutor.execute_job(job_id, "data_processing")["status"] == "deferred"
+        
+        assert [task.id for task in scheduler.get_jobs()] == [f"job_{job_id}_shed"]
+    finally:
+        scheduler.shutdown()
+
+def test_shed_retries_are_deferred_even_when_skipping(monkeypatch, make_job):
+    monkeypatch.setattr(settings, "load_shed_action", "skip")
+    monkeypatch.setattr(LoadMonitor, "should_shed", staticmethod(lambda job_config: True))
+    scheduler = SchedulerService._create_scheduler()
+    monkeypatch.setattr(SchedulerService, "scheduler", scheduler)
+    scheduler.start(paused=True)
+    try:
+        job_id = make_job(job_config={"priority": "low"})
+        assert JobExecutor.execute_job(job_id, "data_processing")["status"] == "shed"
+        
+        # Skipping a retry would lose the original failure: nothing runs or dead-letters after it
+        assert JobExecutor.retry_job(job_id, 2, None)["status"] == "deferred"
+        assert [task.args for task in scheduler.get_jobs()] == [(job_id, 2, None, False)]
+    finally:
+        scheduler.shutdown()
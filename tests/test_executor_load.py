@@ -0,0 +1,94 @@
+import fnmatch
+
+from app.config.settings import settings
+from app.services.executor_load import ExecutorLoad
+from app.services.load_monitor import LoadMonitor
+from app.services.scheduler_service import SchedulerService
+
+class FakeRedis:
+    """The few Redis commands ExecutorLoad uses, without expiry"""
+    
+    def __init__(self):
+        self.values = {}
+    
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+    
+    def delete(self, key):
+        self.values.pop(key, None)
+    
+    def scan_iter(self, match, count=None):
+        return [key for key in self.values if fnmatch.fnmatch(key, match)]
+    
+    def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+def publish_pods(monkeypatch, *pods):
+    for pod, stats in pods:
+        monkeypatch.setattr(ExecutorLoad, "_key", f"executor_load:{pod}")
+        ExecutorLoad.publish(stats)
+
+def test_api_pods_see_the_load_of_scheduler_pods(monkeypatch):
+    monkeypatch.setattr(ExecutorLoad, "_redis", FakeRedis())
+    monkeypatch.setattr(settings, "overload_backlog_threshold", 50)
+    
+    # Two scheduler pods publish their executor stats
+    publish_pods(
+        monkeypatch,
+        ("pod-a", {"workers": 10, "busy": 10, "pending": 70, "lag_seconds": 1.5}),
+        ("pod-b", {"workers": 10, "busy": 10, "pending": 60, "lag_seconds": 3.0})
+    )
+    
+    monkeypatch.setattr(settings, "service_role", "api")
+    stats = SchedulerService().executor_stats()
+    assert stats["pods"] == 2
+    assert stats["pending"] == 130
+    assert stats["lag_seconds"] == 3.0
+    
+    # Writes are refused against the threshold of both pods; the API pod itself stays ready
+    state = LoadMonitor._measure()
+    assert state["executor_backlog_threshold"] == 100
+    assert state["admission_level"] == "overloaded"
+    assert state["admission_reasons"][0] == "executor backlog 130"
+    assert state["level"] == "ok"
+
+def test_backlog_threshold_scales_with_scheduler_pods(monkeypatch):
+    monkeypatch.setattr(ExecutorLoad, "_redis", FakeRedis())
+    monkeypatch.setattr(settings, "overload_backlog_threshold", 100)
+    publish_pods(
+        monkeypatch,
+        *[(f"pod-{index}", {"workers": 10, "busy": 10, "pending": 80, "lag_seconds": 0.5}) for index in range(3)]
+    )
+    
+    monkeypatch.setattr(settings, "service_role", "api")
+    assert LoadMonitor._measure()["admission_level"] == "ok"
+
+def test_api_pod_readiness_ignores_scheduler_load(monkeypatch, client):
+    monkeypatch.setattr(ExecutorLoad, "_redis", FakeRedis())
+    monkeypatch.setattr(settings, "overload_backlog_threshold", 10)
+    publish_pods(monkeypatch, ("pod-a", {"workers": 10, "busy": 10, "pending": 500, "lag_seconds": 30.0}))
+    monkeypatch.setattr(settings, "service_role", "api")
+    LoadMonitor.invalidate()
+    
+    try:
+        assert client.get("/api/v1/health/ready").status_code == 200
+        assert client.get("/api/v1/jobs/").status_code == 200
+        response = client.post("/api/v1/jobs/", json={
+            "name": "nightly report",
+            "job_type": "data_processing",
+            "schedule_type": "interval",
+            "schedule_config": {"interval_seconds": 3600}
+        })
+        assert response.status_code == 429
+    finally:
+        LoadMonitor.invalidate()
+
+def test_api_pods_fail_open_without_redis(monkeypatch):
+    class Unreachable:
+        def scan_iter(self, match, count=None):
+            raise ConnectionError("Redis is down")
+    
+    monkeypatch.setattr(ExecutorLoad, "_redis", Unreachable())
+    monkeypatch.setattr(settings, "service_role", "api")
+    
+    assert LoadMonitor._measure()["level"] == "ok"
@@ -0,0 +1,32 @@
+import time
+import tracemalloc
+
+from app.database.connection import get_db_context
+from app.models.job_execution import JobExecution
+from app.services import execution_profiler
+from app.services.job_executor import JobExecutor
+
+TRACED = {"profiling": {"tracemalloc": True}}
+
+def test_timed_out_run_releases_tracemalloc(hung, make_job):
+    try:
+        result, _ = JobExecutor.run_job(make_job("hung", {**TRACED, "timeout_seconds": 0.3}))
+        assert result["status"] == "timed_out"
+        
+        # The handler thread is still blocked, yet tracing is already over
+        assert not tracemalloc.is_tracing()
+        assert not execution_profiler._tracemalloc_lock.locked()
+        
+        allocating = {"result": {"status": "success", "data": [str(number) for number in range(1000)]}}
+        result, execution_id = JobExecutor.run_job(make_job("quick", {**TRACED, **allocating}))
+        assert result["status"] == "success"
+        with get_db_context() as db:
+            profile = db.query(JobExecution.profile).filter(JobExecution.id == execution_id).scalar()
+        assert profile["memory"]["peak_bytes"] > 0
+    finally:
+        hung.release.set()
+    
+    # The abandoned thread finishing late leaves tracemalloc alone
+    time.sleep(0.1)
+    assert not tracemalloc.is_tracing()
+    assert not execution_profiler._tracemalloc_lock.locked()
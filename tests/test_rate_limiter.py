@@ -0,0 +1,64 @@
+import pytest
+
+import app.services.rate_limiter as rate_limiter_module
+from app.database.connection import get_db_context
+from app.models.job_execution import JobExecution
+from app.services.job_executor import JobExecutor
+from app.services.metrics import Metrics
+from app.services.rate_limiter import LocalTokenBucket, RateLimiter
+from conftest import QuickHandler
+
+def make_limiter(job_type="data_processing", **rule):
+    return RateLimiter({job_type: {"rate_per_second": 1, "burst": 1, **rule}}, LocalTokenBucket())
+
+def test_reservations_stop_at_max_wait():
+    limiter = make_limiter(max_wait_seconds=2)
+    waits = [limiter.acquire("data_processing", {}) for _ in range(5)]
+    
+    assert [round(wait, 1) if wait is not None else None for wait in waits] == [0.0, 1.0, 2.0, None, None]
+
+def test_dropped_fires_reserve_nothing():
+    limiter = make_limiter(max_wait_seconds=1)
+    for _ in range(10):
+        limiter.acquire("data_processing", {})
+    
+    # Only the two admitted fires hold tokens; drops left no debt behind
+    tokens, _ = limiter.bucket._buckets["data_processing"]
+    assert tokens == pytest.approx(-1, abs=0.01)
+
+def test_unbounded_rule_keeps_reserving():
+    limiter = make_limiter()
+    waits = [limiter.acquire("data_processing", {}) for _ in range(5)]
+    
+    assert round(waits[-1], 1) == 4.0
+
+def test_run_job_drops_fires_past_max_wait(monkeypatch, register_handler, make_job):
+    register_handler("quick", QuickHandler())
+    monkeypatch.setattr(rate_limiter_module, "_rate_limiter", make_limiter("quick", max_wait_seconds=1.5))
+    job_id = make_job("quick")
+    deferred = []
+    Metrics.reset()
+    
+    results = [
+        JobExecutor.run_job(job_id, on_throttle=deferred.append, droppable=True)[0]["status"]
+        for _ in range(3)
+    ]
+    
+    assert results[1:] == ["deferred", "dropped"]
+    assert len(deferred) == 1
+    assert Metrics.snapshot()["counters"]["rate_limiter_dropped_total"] == {'{job_type="quick"}': 1}
+    with get_db_context() as db:
+        assert db.query(JobExecution).filter(JobExecution.job_id == job_id).count() == 1
+
+def test_retries_are_deferred_past_max_wait(monkeypatch, register_handler, make_job):
+    register_handler("quick", QuickHandler())
+    monkeypatch.setattr(rate_limiter_module, "_rate_limiter", make_limiter("quick", max_wait_seconds=1.5))
+    deferred = []
+    monkeypatch.setattr(JobExecutor, "defer", lambda func, args, task_prefix, delay, **kwargs: deferred.append(delay))
+    job_id = make_job("quick")
+    
+    results = [JobExecutor.retry_job(job_id, 2, None)["status"] for _ in range(4)]
+    
+    # A retry has no next fire to fall back on, so it keeps its place however long the wait
+    assert results[1:] == ["deferred", "deferred", "deferred"]
+    assert [round(delay) for delay in deferred] == [1, 2, 3]
@@ -0,0 +1,55 @@
+import time
+
+from app.config.settings import settings
+from app.database.connection import PRIMARY_PIN_COOKIE, CONSISTENCY_HEADER
+
+JOB = {
+    "name": "nightly report",
+    "job_type": "data_processing",
+    "schedule_type": "interval",
+    "schedule_config": {"interval_seconds": 3600}
+}
+
+def test_reads_go_to_replica(client, replica):
+    job_id = client.post("/api/v1/jobs/", json=JOB).json()["id"]
+    client.cookies.clear()
+    
+    # The replica never received the write
+    assert client.get(f"/api/v1/jobs/{job_id}").status_code == 404
+    assert client.get("/api/v1/jobs/").json()["total"] == 0
+
+def test_writer_is_pinned_to_primary(client, replica):
+    response = client.post("/api/v1/jobs/", json=JOB)
+    assert PRIMARY_PIN_COOKIE in response.cookies
+    
+    job_id = response.json()["id"]
+    assert client.get(f"/api/v1/jobs/{job_id}").status_code == 200
+    assert client.get("/api/v1/jobs/").json()["total"] == 1
+
+def test_pin_expires(client, replica, monkeypatch):
+    monkeypatch.setattr(settings, "read_your_writes_seconds", 0.2)
+    job_id = client.post("/api/v1/jobs/", json=JOB).json()["id"]
+    assert client.get(f"/api/v1/jobs/{job_id}").status_code == 200
+    
+    time.sleep(0.3)
+    assert client.get(f"/api/v1/jobs/{job_id}").status_code == 404
+
+def test_strong_read_uses_primary(client, replica):
+    job_id = client.post("/api/v1/jobs/", json=JOB).json()["id"]
+    client.cookies.clear()
+    
+    response = client.get(f"/api/v1/jobs/{job_id}", headers={CONSISTENCY_HEADER: "strong"})
+    assert response.status_code == 200
+
+def test_no_pin_without_replicas(client):
+    response = client.post("/api/v1/jobs/", json=JOB)
+    assert PRIMARY_PIN_COOKIE not in response.cookies
+    assert client.get(f"/api/v1/jobs/{response.json()['id']}").status_code == 200
+
+def test_change_feed_reads_primary(client, replica, monkeypatch):
+    monkeypatch.setattr(settings, "change_feed_safety_seconds", 0)
+    job_id = client.post("/api/v1/jobs/", json=JOB).json()["id"]
+    client.cookies.clear()
+    
+    feed = client.get("/api/v1/jobs/changes").json()
+    assert [change["job_id"] for change in feed["changes"]] == [job_id]
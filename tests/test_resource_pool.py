@@ -0,0 +1,83 @@
+import itertools
+import threading
+
+from app.services.job_handler import CancellationToken, JobHandler, set_current_token
+from app.services.resource_pool import ResourcePool
+
+class Connection:
+    def __init__(self, number):
+        self.number = number
+        self.alive = True
+        self.closed = False
+
+class Connections:
+    """Factory, validate and close callbacks over fake connections"""
+    
+    def __init__(self):
+        self.counter = itertools.count(1)
+        self.created = []
+    
+    def connect(self):
+        connection = Connection(next(self.counter))
+        self.created.append(connection)
+        return connection
+    
+    def validate(self, connection):
+        return connection.alive
+    
+    def close(self, connection):
+        connection.closed = True
+
+def make_pool(connections, **kwargs):
+    return ResourcePool(
+        "test",
+        connections.connect,
+        close=connections.close,
+        validate=connections.validate,
+        acquire_timeout=1,
+        **kwargs
+    )
+
+def test_stale_idle_resource_is_replaced_on_borrow():
+    connections = Connections()
+    pool = make_pool(connections, max_size=1)
+    with pool.borrow() as connection:
+        pass
+    # The server dropped the idle connection
+    connection.alive = False
+    
+    with pool.borrow() as replacement:
+        assert replacement.number == 2
+    assert connection.closed
+    assert pool.stats() == {"size": 1, "idle": 1, "in_use": 0, "max_size": 1}
+
+def test_abandoned_borrower_gives_up_its_slot():
+    connections = Connections()
+    pool = make_pool(connections, max_size=1)
+    token = CancellationToken()
+    borrowed = threading.Event()
+    release = threading.Event()
+    
+    class Hung(JobHandler):
+        def execute(self, config):
+            with self.borrow(pool):
+                borrowed.set()
+                release.wait(5)
+    
+    def run():
+        set_current_token(token)
+        Hung().execute({})
+    
+    thread = threading.Thread(target=run)
+    thread.start()
+    assert borrowed.wait(5)
+    
+    # The executor times the job out; the only slot is usable again at once
+    token.cancel("timeout")
+    with pool.borrow() as connection:
+        assert connection.number == 2
+    
+    release.set()
+    thread.join(5)
+    assert connections.created[0].closed
+    assert pool.stats() == {"size": 1, "idle": 1, "in_use": 0, "max_size": 1}
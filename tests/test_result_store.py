@@ -0,0 +1,73 @@
+import orjson
+import pytest
+
+from app.config.settings import settings
+from app.database.connection import get_db_context
+from app.models.execution_blob import ExecutionBlob
+from app.models.job_execution import JobExecution
+from app.services.job_executor import JobExecutor
+from app.services.result_store import ResultStore, SPILL_KEY
+
+LARGE_RESULT = {"status": "success", "rows": [{"id": number, "name": f"row-{number}"} for number in range(500)]}
+
+@pytest.fixture(autouse=True)
+def small_cap(monkeypatch):
+    """A 1 KB inline cap and 256 byte chunks, so spills span several blob rows"""
+    monkeypatch.setattr(settings, "result_inline_max_bytes", 1024)
+    monkeypatch.setattr(settings, "result_blob_chunk_bytes", 256)
+
+def stored(execution_id):
+    """Inline result, inline error message and blob chunk count per field of an execution"""
+    with get_db_context() as db:
+        execution = db.query(JobExecution).filter(JobExecution.id == execution_id).first()
+        blobs = db.query(ExecutionBlob.field).filter(ExecutionBlob.execution_id == execution_id).all()
+        chunks = {}
+        for (field,) in blobs:
+            chunks[field] = chunks.get(field, 0) + 1
+        return execution.result, execution.error_message, chunks
+
+def test_results_under_the_cap_stay_inline(hung, client, make_job):
+    result = {"status": "success", "processed": 42}
+    job_id = make_job("quick", {"result": result})
+    _, execution_id = JobExecutor.run_job(job_id)
+    
+    assert stored(execution_id) == (result, None, {})
+    assert client.get(f"/api/v1/jobs/{job_id}/executions/{execution_id}/result").json() == result
+
+def test_spilled_placeholder_shape():
+    payload = orjson.dumps(LARGE_RESULT)
+    outcome = ResultStore.encode(LARGE_RESULT, None)
+    
+    assert outcome.result == {
+        "status": "success",
+        SPILL_KEY: {"encoding": "zlib", "size_bytes": len(payload), "stored_bytes": len(outcome.spills["result"])}
+    }
+    assert ResultStore.is_spilled(outcome.result)
+    assert outcome.error_message is None
+
+def test_spilled_result_round_trips(hung, client, make_job):
+    job_id = make_job("quick", {"result": LARGE_RESULT})
+    _, execution_id = JobExecutor.run_job(job_id)
+    
+    result, _, chunks = stored(execution_id)
+    assert ResultStore.is_spilled(result)
+    assert result[SPILL_KEY]["size_bytes"] == len(orjson.dumps(LARGE_RESULT))
+    assert chunks["result"] > 1
+    
+    response = client.get(f"/api/v1/jobs/{job_id}/executions/{execution_id}/result")
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == LARGE_RESULT
+
+def test_spilled_error_round_trips(hung, client, make_job):
+    message = "upstream rejected the batch: " + "x" * 5000
+    job_id = make_job("failing", {"error": message})
+    _, execution_id = JobExecutor.run_job(job_id)
+    
+    _, inline_error, chunks = stored(execution_id)
+    assert "[truncated," in inline_error
+    assert len(inline_error.encode()) < 1200
+    assert chunks["error_message"] >= 1
+    
+    response = client.get(f"/api/v1/jobs/{job_id}/executions/{execution_id}/error")
+    assert message in response.text
+    assert inline_error.endswith(f"[truncated, {len(response.text.encode())} bytes in total]")
@@ -0,0 +1,102 @@
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from app.database.connection import get_db_context
+from app.models.dead_letter import DeadLetterJob
+from app.models.job_execution import JobExecution
+from app.services.job_executor import JobExecutor
+from app.services.scheduler_service import SchedulerService
+from conftest import QuickHandler
+
+RETRY_POLICY = {"max_attempts": 3, "backoff_seconds": 10, "backoff_multiplier": 2, "jitter": 0}
+
+@pytest.fixture
+def submitted(monkeypatch):
+    """(args, seconds until run_date) of every task submitted to the worker pool"""
+    tasks = []
+    
+    def submit_once(self, func, args, task_id, run_date=None, replace_existing=True):
+        delay = (run_date - datetime.now(timezone.utc)).total_seconds() if run_date else 0
+        tasks.append((args, delay))
+        return True
+    
+    monkeypatch.setattr(SchedulerService, "submit_once", submit_once)
+    return tasks
+
+def executions(job_id):
+    """(attempt, parent execution ID, status) of each execution of the job"""
+    with get_db_context() as db:
+        return [
+            (execution.attempt, execution.parent_execution_id, execution.status)
+            for execution in db.query(JobExecution).filter(JobExecution.job_id == job_id).order_by(JobExecution.id)
+        ]
+
+def dead_letters():
+    with get_db_context() as db:
+        return [
+            (entry.job_id, entry.execution_id, entry.attempts, entry.error_message, entry.status)
+            for entry in db.query(DeadLetterJob).all()
+        ]
+
+def execution_id(job_id, attempt):
+    with get_db_context() as db:
+        return db.query(JobExecution.id).filter(JobExecution.job_id == job_id, JobExecution.attempt == attempt).scalar()
+
+def test_failures_are_retried_with_backoff(hung, make_job, submitted):
+    job_id = make_job("failing", {"retry_policy": RETRY_POLICY})
+    
+    _, first = JobExecutor.run_job(job_id)
+    (args, delay), = submitted
+    assert args == [job_id, 2, first]
+    assert delay == pytest.approx(10, abs=1)
+    
+    JobExecutor.retry_job(*args)
+    args, delay = submitted[1]
+    assert args == [job_id, 3, execution_id(job_id, 2)]
+    assert delay == pytest.approx(20, abs=1)
+    
+    # Each retry points back at the attempt it retries
+    assert executions(job_id) == [(1, None, "error"), (2, first, "error")]
+
+def test_exhausted_retries_are_dead_lettered(hung, make_job, submitted):
+    job_id = make_job("failing", {"retry_policy": RETRY_POLICY, "error": "upstream refused"})
+    
+    JobExecutor.run_job(job_id)
+    JobExecutor.retry_job(*submitted[0][0])
+    JobExecutor.retry_job(*submitted[1][0])
+    
+    assert [attempt for attempt, _, _ in executions(job_id)] == [1, 2, 3]
+    assert len(submitted) == 2
+    (entry,) = dead_letters()
+    assert entry[:3] == (job_id, execution_id(job_id, 3), 3)
+    assert "upstream refused" in entry[3]
+    assert entry[4] == "pending"
+
+def test_failures_without_a_policy_are_not_retried(hung, make_job, submitted):
+    job_id = make_job("failing")
+    JobExecutor.run_job(job_id)
+    
+    assert submitted == []
+    assert dead_letters() == []
+
+def test_replay_reruns_the_job_and_clears_the_entry(hung, client, make_job, register_handler):
+    job_id = make_job("failing", {"retry_policy": {**RETRY_POLICY, "max_attempts": 1}})
+    _, failed = JobExecutor.run_job(job_id)
+    (entry,) = dead_letters()
+    assert entry[:2] == (job_id, failed)
+    
+    # The cause has been fixed; the replay gets a fresh retry budget
+    register_handler("failing", QuickHandler())
+    response = client.post("/api/v1/dead-letters/replay", json={"job_id": job_id})
+    assert response.json() == {"replayed": 1}
+    assert dead_letters()[0][4] == "replayed"
+    
+    deadline = time.monotonic() + 5
+    while len(executions(job_id)) < 2 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    while executions(job_id)[-1][2] == "running" and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert executions(job_id) == [(1, None, "error"), (1, failed, "success")]
+    assert client.get("/api/v1/dead-letters/", params={"status": "pending"}).json() == []
@@ -0,0 +1,76 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.database.connection import get_db_context
+from app.models.job_execution import JobExecution
+from app.services.job_executor import JobExecutor
+from app.services.job_handler import JobHandler
+
+def execution_statuses():
+    with get_db_context() as db:
+        return {execution.job_id: execution.status for execution in db.query(JobExecution).all()}
+
+def test_timed_out_handlers_free_their_workers(hung, make_job):
+    hung_jobs = [make_job("hung", {"timeout_seconds": 0.5}) for _ in range(2)]
+    quick_job = make_job("quick")
+    
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        hung_runs = [pool.submit(JobExecutor.run_job, job_id) for job_id in hung_jobs]
+        # Queued behind two hung handlers; only runs once a worker is reclaimed
+        queued = pool.submit(JobExecutor.run_job, quick_job)
+        
+        result, _ = queued.result(timeout=5)
+        assert result["status"] == "success"
+        for run in hung_runs:
+            assert run.result(timeout=5)[0]["status"] == "timed_out"
+    
+    statuses = execution_statuses()
+    assert [statuses[job_id] for job_id in hung_jobs] == ["timed_out", "timed_out"]
+    assert statuses[quick_job] == "success"
+
+def test_cancel_stops_a_cooperative_handler(register_handler, make_job):
+    class Sleeper(JobHandler):
+        def execute(self, config):
+            self.sleep(30)
+            return {"status": "success"}
+    
+    register_handler("sleeper", Sleeper())
+    job_id = make_job("sleeper")
+    
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        run = pool.submit(JobExecutor.run_job, job_id)
+        execution_id = None
+        while execution_id is None:
+            with get_db_context() as db:
+                execution = db.query(JobExecution).filter(JobExecution.job_id == job_id).first()
+                execution_id = execution.id if execution else None
+            time.sleep(0.01)
+        while not JobExecutor.request_cancel(execution_id):
+            time.sleep(0.01)
+        
+        assert run.result(timeout=5)[0]["status"] == "cancelled"
+    assert execution_statuses()[job_id] == "cancelled"
+
+def add_execution(job_id, status):
+    with get_db_context() as db:
+        execution = JobExecution(job_id=job_id, status=status)
+        db.add(execution)
+        db.flush()
+        return execution.id
+
+def test_cancel_marks_a_running_execution_cancelling(client, make_job):
+    job_id = make_job()
+    execution_id = add_execution(job_id, "running")
+    
+    response = client.post(f"/api/v1/jobs/{job_id}/executions/{execution_id}/cancel")
+    assert response.status_code == 202
+    assert response.json()["status"] == "cancelling"
+
+def test_cancel_never_overwrites_a_final_status(client, make_job):
+    job_id = make_job()
+    execution_id = add_execution(job_id, "success")
+    
+    response = client.post(f"/api/v1/jobs/{job_id}/executions/{execution_id}/cancel")
+    assert response.status_code == 409
+    assert execution_statuses()[job_id] == "success"
+    assert client.post(f"/api/v1/jobs/{job_id}/executions/{execution_id + 1}/cancel").status_code == 404
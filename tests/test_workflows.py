@@ -0,0 +1,125 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.database.connection import get_db_context
+from app.models.workflow import Workflow, WorkflowRun, WorkflowRunNode
+from app.services.job_executor import JobExecutor
+from app.services.job_handler import JobHandler
+from app.services.scheduler_service import SchedulerService
+from app.services.workflow_executor import WorkflowExecutor
+
+@pytest.fixture
+def dispatched(monkeypatch):
+    """Node keys submitted to the worker pool, in order; the test runs them itself"""
+    submitted = []
+    
+    def submit_once(self, func, args, task_id, run_date=None, replace_existing=True):
+        submitted.append(args[1])
+        return True
+    
+    monkeypatch.setattr(SchedulerService, "submit_once", submit_once)
+    return submitted
+
+def make_workflow(*nodes):
+    """Nodes are (key, job_id, depends_on) tuples"""
+    with get_db_context() as db:
+        workflow = Workflow(
+            name="workflow",
+            nodes=[{"key": key, "job_id": job_id, "depends_on": depends_on} for key, job_id, depends_on in nodes]
+        )
+        db.add(workflow)
+        db.flush()
+        return workflow.id
+
+def run_dispatched(run_id, dispatched):
+    """Execute submitted nodes one at a time until nothing is left to dispatch"""
+    executed = 0
+    while executed < len(dispatched):
+        WorkflowExecutor.execute_node(run_id, dispatched[executed])
+        executed += 1
+
+def run_state(run_id):
+    with get_db_context() as db:
+        run = db.query(WorkflowRun).filter(WorkflowRun.id == run_id).first()
+        nodes = db.query(WorkflowRunNode).filter(WorkflowRunNode.run_id == run_id).all()
+        return run.status, {node.node_key: node.status for node in nodes}
+
+def test_fan_out_and_fan_in(hung, make_job, dispatched):
+    quick = make_job("quick")
+    workflow_id = make_workflow(
+        ("extract", quick, []),
+        ("transform_a", quick, ["extract"]),
+        ("transform_b", quick, ["extract"]),
+        ("load", quick, ["transform_a", "transform_b"])
+    )
+    
+    run_id = WorkflowExecutor.start_run(workflow_id)
+    assert dispatched == ["extract"]
+    
+    WorkflowExecutor.execute_node(run_id, "extract")
+    assert dispatched == ["extract", "transform_a", "transform_b"]
+    
+    # The join waits for both branches
+    WorkflowExecutor.execute_node(run_id, "transform_a")
+    assert dispatched[-1] == "transform_b"
+    WorkflowExecutor.execute_node(run_id, "transform_b")
+    assert dispatched[-1] == "load"
+    
+    WorkflowExecutor.execute_node(run_id, "load")
+    assert run_state(run_id) == ("completed", {key: "completed" for key in dispatched})
+
+def test_join_is_claimed_once_when_parents_finish_together(register_handler, make_job, dispatched):
+    barrier = threading.Barrier(2)
+    
+    class TogetherHandler(JobHandler):
+        def execute(self, config):
+            barrier.wait(5)
+            return {"status": "success"}
+    
+    register_handler("together", TogetherHandler())
+    parent = make_job("together")
+    workflow_id = make_workflow(("left", parent, []), ("right", parent, []), ("join", parent, ["left", "right"]))
+    
+    run_id = WorkflowExecutor.start_run(workflow_id)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        for run in [pool.submit(WorkflowExecutor.execute_node, run_id, key) for key in ("left", "right")]:
+            run.result(timeout=10)
+    
+    assert sorted(dispatched) == ["join", "left", "right"]
+    assert run_state(run_id)[1]["join"] == "queued"
+
+def test_failure_skips_descendants_and_other_branches_finish(hung, make_job, dispatched):
+    quick, failing = make_job("quick"), make_job("failing")
+    workflow_id = make_workflow(
+        ("fetch", failing, []),
+        ("parse", quick, ["fetch"]),
+        ("publish", quick, ["parse"]),
+        ("audit", quick, []),
+        ("archive", quick, ["audit"])
+    )
+    
+    run_id = WorkflowExecutor.start_run(workflow_id)
+    run_dispatched(run_id, dispatched)
+    
+    assert run_state(run_id) == ("failed", {
+        "fetch": "failed",
+        "parse": "skipped",
+        "publish": "skipped",
+        "audit": "completed",
+        "archive": "completed"
+    })
+
+def test_node_whose_execution_raises_fails_its_run(monkeypatch, hung, make_job, dispatched):
+    quick = make_job("quick")
+    workflow_id = make_workflow(("only", quick, []), ("after", quick, ["only"]))
+    
+    def broken(*args, **kwargs):
+        raise RuntimeError("database went away")
+    
+    monkeypatch.setattr(JobExecutor, "run_job", broken)
+    run_id = WorkflowExecutor.start_run(workflow_id)
+    run_dispatched(run_id, dispatched)
+    
+    assert run_state(run_id) == ("failed", {"only": "failed", "after": "skipped"})